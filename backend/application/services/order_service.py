@@ -7,16 +7,20 @@ Princípio OCP: Pode ser estendido para novos status sem modificar a lógica.
 """
 
 import uuid
-from typing import List
-from domain.ports import OrderRepositoryPort, ProductRepositoryPort
+from contextlib import nullcontext
+from typing import AsyncContextManager, AsyncIterator, Dict, List, Optional
+from domain.ports import (
+    AsyncOrderRepositoryPort,
+    AsyncProductRepositoryPort,
+    AsyncUnitOfWorkPort,
+)
 from domain.entities.order import Order, OrderItem, OrderStatus
 from domain.entities.cart import Cart
 from domain.exceptions import (
     OrderNotFoundException,
     EmptyCartException,
-    InsufficientStockException,
-    ProductNotFoundException,
 )
+from domain.pagination import Page
 
 
 class OrderService:
@@ -24,17 +28,26 @@ class OrderService:
 
     def __init__(
         self,
-        order_repository: OrderRepositoryPort,
-        product_repository: ProductRepositoryPort,
+        order_repository: AsyncOrderRepositoryPort,
+        product_repository: AsyncProductRepositoryPort,
+        unit_of_work: Optional[AsyncUnitOfWorkPort] = None,
     ):
         """
         Princípio DIP: Recebe abstrações via injeção de dependência.
-        Precisa do repositório de produtos para validar estoque.
+        Precisa do repositório de produtos para validar estoque e, se
+        informada, da unidade de trabalho que agrupa as escritas de cada
+        caso de uso (pedido + estoque) em uma única persistência.
         """
         self._order_repository = order_repository
         self._product_repository = product_repository
+        self._unit_of_work = unit_of_work
+
+    def _transaction(self) -> AsyncContextManager[None]:
+        if self._unit_of_work is None:
+            return nullcontext()
+        return self._unit_of_work.transaction()
 
-    def create_order_from_cart(
+    async def create_order_from_cart(
         self, cart: Cart, shipping_address: str
     ) -> Order:
         """
@@ -44,22 +57,17 @@ class OrderService:
         1. Carrinho não pode estar vazio
         2. Todos os produtos devem ter estoque suficiente
         3. O estoque é decrementado ao criar o pedido
+
+        A verificação e a baixa do estoque são uma única operação atômica do
+        repositório (reserve_stock): checkouts concorrentes nunca vendem
+        mais do que o estoque, e um carrinho é reservado por inteiro ou não
+        é reservado.
         """
         if not cart.items:
             raise EmptyCartException()
 
-        # Validar estoque de todos os itens
         order_items: List[OrderItem] = []
         for cart_item in cart.items:
-            product = self._product_repository.get_by_id(cart_item.product_id)
-            if product is None:
-                raise ProductNotFoundException(cart_item.product_id)
-
-            if product.stock < cart_item.quantity:
-                raise InsufficientStockException(
-                    product.id, product.stock, cart_item.quantity
-                )
-
             order_items.append(
                 OrderItem(
                     product_id=cart_item.product_id,
@@ -71,44 +79,90 @@ class OrderService:
                 )
             )
 
-        # Decrementar estoque
-        for cart_item in cart.items:
-            product = self._product_repository.get_by_id(cart_item.product_id)
-            product.decrease_stock(cart_item.quantity)
-            self._product_repository.update(product)
-
-        # Criar pedido
         order = Order(
             id=str(uuid.uuid4()),
             user_id=cart.user_id,
             items=order_items,
             shipping_address=shipping_address,
         )
-
-        return self._order_repository.create(order)
-
-    def get_order(self, order_id: str) -> Order:
+        quantities = _quantities_by_product(order_items)
+
+        # Baixa de estoque + criação do pedido em uma única escrita
+        async with self._transaction():
+            # Levanta ProductNotFoundException ou InsufficientStockException
+            # sem alterar nenhum produto
+            await self._product_repository.reserve_stock(quantities)
+            try:
+                return await self._order_repository.create(order)
+            except Exception:
+                # Um cancelamento (BaseException) não desfaz a reserva: a
+                # escrita do pedido já terminou quando ele é propagado
+                await self._product_repository.release_stock(quantities)
+                raise
+
+    async def get_order(self, order_id: str) -> Order:
         """Busca um pedido pelo ID."""
-        order = self._order_repository.get_by_id(order_id)
+        order = await self._order_repository.get_by_id(order_id)
         if order is None:
             raise OrderNotFoundException(order_id)
         return order
 
-    def get_user_orders(self, user_id: str) -> List[Order]:
+    async def get_user_orders(self, user_id: str) -> List[Order]:
         """Lista todos os pedidos de um usuário."""
-        return self._order_repository.get_by_user_id(user_id)
+        return await self._order_repository.get_by_user_id(user_id)
 
-    def cancel_order(self, order_id: str) -> Order:
-        """Cancela um pedido e devolve o estoque."""
-        order = self.get_order(order_id)
-        order.cancel()
+    async def get_user_orders_page(
+        self,
+        user_id: str,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Order]:
+        """
+        Página do histórico de pedidos de um usuário.
 
-        # Devolver estoque
-        for item in order.items:
-            product = self._product_repository.get_by_id(item.product_id)
-            if product:
-                product.stock += item.quantity
-                self._product_repository.update(product)
+        `sort`: "created_at" (padrão) ou "-created_at" (mais recentes
+        primeiro). `cursor` é o next_cursor da página anterior e só vale
+        para a mesma ordenação (InvalidCursorException caso contrário).
+        """
+        return await self._order_repository.get_page_by_user_id(
+            user_id, sort=sort, limit=limit, cursor=cursor
+        )
 
-        self._order_repository.update(order)
+    async def iter_user_orders(
+        self,
+        user_id: str,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        batch_size: int = 200,
+    ) -> AsyncIterator[List[Order]]:
+        """Percorre o histórico (a partir de `cursor`) em páginas de batch_size."""
+        while True:
+            page = await self.get_user_orders_page(user_id, sort, batch_size, cursor)
+            if page.items:
+                yield page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    async def cancel_order(self, order_id: str) -> Order:
+        """Cancela um pedido e devolve o estoque (em uma única escrita)."""
+        async with self._transaction():
+            order = await self.get_order(order_id)
+            order.cancel()
+
+            # Devolver estoque
+            await self._product_repository.release_stock(
+                _quantities_by_product(order.items)
+            )
+
+            await self._order_repository.update(order)
         return order
+
+
+def _quantities_by_product(items: List[OrderItem]) -> Dict[str, int]:
+    """Soma as quantidades por produto (um produto pode vir em várias linhas)."""
+    quantities: Dict[str, int] = {}
+    for item in items:
+        quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+    return quantities
@@ -2,50 +2,73 @@
 Serviço de Produtos - Camada de Aplicação (Use Cases).
 
 Princípio SRP: Responsável apenas pela orquestração de operações de produto.
-Princípio DIP: Depende da abstração (ProductRepositoryPort), não da implementação.
+Princípio DIP: Depende da abstração (AsyncProductRepositoryPort), não da implementação.
 Princípio OCP: Pode ser estendido para novos filtros sem modificar o código existente.
 """
 
-from typing import List, Optional
-from domain.ports import ProductRepositoryPort
+import asyncio
+import math
+import pickle
+import tempfile
+from contextlib import nullcontext
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional
+from domain.ports import AsyncProductRepositoryPort, AsyncUnitOfWorkPort
 from domain.entities.product import Product
-from domain.exceptions import ProductNotFoundException
+from domain.exceptions import InvalidImportRecordException, ProductNotFoundException
+from domain.pagination import Page
+
+# Tipos conferidos na importação (bool não conta como número)
+_TEXT_FIELDS = ("name", "description", "category", "image_url", "brand", "gender")
+_NUMERIC_FIELDS = ("price", "stock", "rating", "reviews_count")
 
 
 class ProductService:
     """Serviço que implementa os casos de uso relacionados a produtos."""
 
-    def __init__(self, product_repository: ProductRepositoryPort):
+    def __init__(
+        self,
+        product_repository: AsyncProductRepositoryPort,
+        unit_of_work: Optional[AsyncUnitOfWorkPort] = None,
+    ):
         """
         Princípio DIP: Recebe a abstração via injeção de dependência.
         O serviço não sabe se os dados vêm de JSON, SQL, API, etc.
         """
         self._repository = product_repository
+        self._unit_of_work = unit_of_work
 
-    def list_all_products(self) -> List[Product]:
+    async def list_all_products(self) -> List[Product]:
         """Lista todos os produtos disponíveis."""
-        return self._repository.get_all()
+        return await self._repository.get_all()
 
-    def get_product_by_id(self, product_id: str) -> Product:
+    async def get_product_by_id(self, product_id: str) -> Product:
         """Busca um produto pelo ID."""
-        product = self._repository.get_by_id(product_id)
+        product = await self._repository.get_by_id(product_id)
         if product is None:
             raise ProductNotFoundException(product_id)
         return product
 
-    def list_by_category(self, category: str) -> List[Product]:
+    async def list_by_category(self, category: str) -> List[Product]:
         """Lista produtos por categoria."""
-        return self._repository.get_by_category(category)
+        return await self._repository.get_by_category(category)
 
-    def search_products(self, query: str) -> List[Product]:
+    async def search_products(self, query: str) -> List[Product]:
         """Busca produtos por termo de pesquisa."""
-        return self._repository.search(query)
+        return await self._repository.search(query)
 
-    def get_categories(self) -> List[str]:
+    async def get_categories(self) -> List[str]:
         """Retorna todas as categorias disponíveis."""
-        return self._repository.get_categories()
+        return await self._repository.get_categories()
+
+    def catalog_version(self) -> int:
+        """Versão atual do catálogo (para validação de cache)."""
+        return self._repository.catalog_version()
 
-    def filter_products(
+    def product_version(self, product_id: str) -> Optional[int]:
+        """Versão atual de um produto, ou None se ele não existir."""
+        return self._repository.product_version(product_id)
+
+    async def filter_products(
         self,
         category: Optional[str] = None,
         gender: Optional[str] = None,
@@ -59,27 +82,132 @@ class ProductService:
 
         Princípio OCP: Novos filtros podem ser adicionados sem alterar
         a lógica existente.
+        Princípio DIP: A estratégia de filtragem (varredura em memória ou
+        índices de facetas) fica a cargo do repositório.
         """
-        if search:
-            products = self._repository.search(search)
-        elif category:
-            products = self._repository.get_by_category(category)
-        else:
-            products = self._repository.get_all()
-
-        if gender:
-            products = [
-                p for p in products
-                if p.gender.lower() == gender.lower() or p.gender.lower() == "unissex"
-            ]
-
-        if min_price is not None:
-            products = [p for p in products if p.price >= min_price]
-
-        if max_price is not None:
-            products = [p for p in products if p.price <= max_price]
+        return await self._repository.filter_products(
+            category=category,
+            gender=gender,
+            min_price=min_price,
+            max_price=max_price,
+            size=size,
+            search=search,
+        )
+
+    async def filter_products_page(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Product]:
+        """
+        Filtra produtos e retorna uma página ordenada do resultado.
 
-        if size:
-            products = [p for p in products if p.has_size(size)]
+        `cursor` é o next_cursor da página anterior; ele só vale para a
+        mesma ordenação (InvalidCursorException caso contrário).
+        """
+        return await self._repository.filter_products_page(
+            category=category,
+            gender=gender,
+            min_price=min_price,
+            max_price=max_price,
+            size=size,
+            search=search,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def export_products(self, batch_size: int = 1000) -> AsyncIterator[List[Product]]:
+        """Percorre o catálogo inteiro em lotes, sem montar a lista completa."""
+        async for batch in self._repository.iter_batches(batch_size):
+            yield batch
+
+    async def import_products(
+        self, records: AsyncIterable[dict], batch_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        Inclui ou atualiza produtos a partir de registros (dicionários no
+        formato de Product.to_dict), gravando-os em lotes de batch_size.
+
+        Em duas etapas:
+        - validação: todos os registros são lidos e validados, e os lotes
+          já convertidos vão para um arquivo temporário (a memória não
+          cresce com o catálogo). Um registro inválido interrompe a
+          importação com InvalidImportRecordException, sem alterar nada;
+        - aplicação: os lotes são gravados a partir do arquivo temporário,
+          em uma única unidade de trabalho (se houver). A transação não
+          fica aberta enquanto os registros chegam pela rede.
+
+        A E/S do arquivo temporário roda fora do event loop.
+        """
+        imported = created = 0
+        staged = await asyncio.to_thread(tempfile.TemporaryFile)
+        try:
+            batches = 0
+            batch: List[Product] = []
+            async for record in records:
+                batch.append(self._product_from_record(imported + len(batch) + 1, record))
+                if len(batch) >= batch_size:
+                    await asyncio.to_thread(pickle.dump, batch, staged, pickle.HIGHEST_PROTOCOL)
+                    imported += len(batch)
+                    batches += 1
+                    batch = []
+            if batch:
+                await asyncio.to_thread(pickle.dump, batch, staged, pickle.HIGHEST_PROTOCOL)
+                imported += len(batch)
+                batches += 1
+
+            await asyncio.to_thread(staged.seek, 0)
+            transaction = (
+                self._unit_of_work.transaction()
+                if self._unit_of_work is not None
+                else nullcontext()
+            )
+            async with transaction:
+                for _ in range(batches):
+                    batch = await asyncio.to_thread(pickle.load, staged)
+                    created += await self._repository.upsert_many(batch)
+        finally:
+            await asyncio.to_thread(staged.close)
+        return {"imported": imported, "created": created, "updated": imported - created}
+
+    @staticmethod
+    def _product_from_record(number: int, record: dict) -> Product:
+        """Converte um registro importado em Product, validando os tipos."""
+        if not isinstance(record, dict):
+            raise InvalidImportRecordException(number, "esperado um objeto JSON")
+        # Validadas antes da conversão: from_dict as transforma em tuplas
+        # (um texto viraria uma tupla de letras)
+        for field in ("sizes", "colors"):
+            values = record.get(field, [])
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                raise InvalidImportRecordException(number, f"{field} deve ser uma lista de textos")
+        try:
+            product = Product.from_dict(record)
+        except KeyError as e:
+            raise InvalidImportRecordException(number, f"campo obrigatório {e} ausente")
+        if not isinstance(product.id, str) or not product.id:
+            raise InvalidImportRecordException(number, "id deve ser um texto não vazio")
+        for field in _TEXT_FIELDS:
+            if not isinstance(getattr(product, field), str):
+                raise InvalidImportRecordException(number, f"{field} deve ser um texto")
+        for field in _NUMERIC_FIELDS:
+            value = getattr(product, field)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise InvalidImportRecordException(number, f"{field} deve ser numérico")
+            # json.loads aceita NaN e Infinity, que a API não consegue responder
+            if not math.isfinite(value):
+                raise InvalidImportRecordException(number, f"{field} deve ser um número finito")
+            if value < 0:
+                raise InvalidImportRecordException(number, f"{field} deve ser >= 0")
+        if not isinstance(product.stock, int) or product.stock < 0:
+            raise InvalidImportRecordException(number, "stock deve ser um inteiro >= 0")
+        return product
 
-        return products
@@ -2,33 +2,48 @@
 Serviço de Usuários - Camada de Aplicação (Use Cases).
 
 Princípio SRP: Responsável apenas pela orquestração de operações de usuário.
-Princípio DIP: Depende da abstração (UserRepositoryPort).
+Princípio DIP: Depende das abstrações (AsyncUserRepositoryPort,
+PasswordHasherPort e SessionTokenPort).
 """
 
-import hashlib
 import uuid
 from typing import Optional
-from domain.ports import UserRepositoryPort
+from domain.ports import (
+    AsyncUserRepositoryPort,
+    PasswordHasherPort,
+    SessionTokenPort,
+)
 from domain.entities.user import User
 from domain.exceptions import (
     UserNotFoundException,
     UserAlreadyExistsException,
     InvalidCredentialsException,
+    InvalidTokenException,
+    HashingOverloadedException,
 )
 
 
 class UserService:
     """Serviço que implementa os casos de uso relacionados a usuários."""
 
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryPort,
+        password_hasher: PasswordHasherPort,
+        session_tokens: Optional[SessionTokenPort] = None,
+    ):
         self._repository = user_repository
+        self._hasher = password_hasher
+        self._sessions = session_tokens
+        # Hash conferido quando o email não existe (ver login)
+        self._dummy_hash: Optional[str] = None
 
-    @staticmethod
-    def _hash_password(password: str) -> str:
-        """Hash simples da senha (para fins didáticos, não usar em produção)."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    @property
+    def session_ttl(self) -> Optional[int]:
+        """Validade das sessões em segundos (None = sessões desativadas)."""
+        return self._sessions.ttl if self._sessions is not None else None
 
-    def register(
+    async def register(
         self,
         name: str,
         email: str,
@@ -40,10 +55,11 @@ class UserService:
         Registra um novo usuário.
         
         Regras de negócio:
-        - Email deve ser único
-        - Senha é armazenada como hash
+        - Email deve ser único (garantido pelo repositório em create; a
+          consulta prévia só evita calcular o hash à toa)
+        - Senha é armazenada como hash (KDF com salt)
         """
-        existing = self._repository.get_by_email(email)
+        existing = await self._repository.get_by_email(email)
         if existing is not None:
             raise UserAlreadyExistsException(email)
 
@@ -51,36 +67,51 @@ class UserService:
             id=str(uuid.uuid4()),
             name=name,
             email=email,
-            password_hash=self._hash_password(password),
+            password_hash=await self._hasher.hash(password),
             address=address,
             phone=phone,
         )
 
-        return self._repository.create(user)
+        return await self._repository.create(user)
 
-    def login(self, email: str, password: str) -> User:
+    async def login(self, email: str, password: str) -> User:
         """
         Autentica um usuário.
         
-        Retorna o usuário se as credenciais forem válidas.
+        Retorna o usuário se as credenciais forem válidas. Um hash legado
+        (SHA-256 ou parâmetros antigos) é refeito com a KDF atual.
+
+        Um email inexistente também paga uma conferência de hash: sem ela,
+        o tempo de resposta revelaria quais emails estão cadastrados.
         """
-        user = self._repository.get_by_email(email)
+        user = await self._repository.get_by_email(email)
         if user is None:
+            if self._dummy_hash is None:
+                self._dummy_hash = await self._hasher.hash(uuid.uuid4().hex)
+            await self._hasher.verify(password, self._dummy_hash)
             raise InvalidCredentialsException()
 
-        if user.password_hash != self._hash_password(password):
+        if not await self._hasher.verify(password, user.password_hash):
             raise InvalidCredentialsException()
 
+        if self._hasher.needs_rehash(user.password_hash):
+            try:
+                user.password_hash = await self._hasher.hash(password)
+            except HashingOverloadedException:
+                # Pool cheio: a migração fica para o próximo login
+                return user
+            await self._repository.update(user)
+
         return user
 
-    def get_user_by_id(self, user_id: str) -> User:
+    async def get_user_by_id(self, user_id: str) -> User:
         """Busca um usuário pelo ID."""
-        user = self._repository.get_by_id(user_id)
+        user = await self._repository.get_by_id(user_id)
         if user is None:
             raise UserNotFoundException(user_id)
         return user
 
-    def update_profile(
+    async def update_profile(
         self,
         user_id: str,
         name: Optional[str] = None,
@@ -88,7 +119,7 @@ class UserService:
         phone: Optional[str] = None,
     ) -> User:
         """Atualiza o perfil do usuário."""
-        user = self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id)
 
         if name:
             user.name = name
@@ -97,5 +128,31 @@ class UserService:
         if phone is not None:
             user.phone = phone
 
-        self._repository.update(user)
+        await self._repository.update(user)
         return user
+
+    def issue_session(self, user: User) -> Optional[str]:
+        """
+        Emite o token de sessão de um usuário autenticado.
+
+        Retorna None se o serviço foi criado sem suporte a sessões.
+        """
+        if self._sessions is None:
+            return None
+        return self._sessions.issue(user.id)
+
+    def authenticate(self, token: str) -> str:
+        """
+        Valida um token de sessão e retorna o id do usuário.
+
+        Não consulta o repositório nem recalcula o hash da senha: basta
+        conferir a assinatura e a expiração do token.
+        """
+        if self._sessions is None:
+            raise InvalidTokenException()
+        return self._sessions.verify(token)
+
+    def logout(self, token: str) -> None:
+        """Encerra a sessão, revogando o token."""
+        if self._sessions is not None:
+            self._sessions.revoke(token)
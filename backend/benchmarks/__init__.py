@@ -0,0 +1 @@
+# Benchmarks - medições de desempenho (executar a partir do diretório backend)
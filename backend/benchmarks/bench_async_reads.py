@@ -0,0 +1,169 @@
+"""
+Benchmark de vazão de leituras concorrentes: rotas síncronas x assíncronas.
+
+Simula, no mesmo processo, muitos clientes lendo produtos enquanto outros
+atualizam perfis (cada atualização regrava o data.json, uma E/S bloqueante):
+
+- síncrono (como antes): cada requisição ocupa uma thread de um pool de
+  40 threads, o tamanho padrão do threadpool do FastAPI/AnyIO. As escritas
+  lentas prendem as threads e as leituras esperam na fila;
+- assíncrono (atual): serviços assíncronos sobre a ponte; as leituras em
+  memória são respondidas no event loop e só as escritas vão para threads.
+
+Reporta leituras e escritas por segundo e a latência p50/p99 das leituras.
+Entre uma requisição e outra, cada cliente devolve o controle ao event
+loop, como acontece com a E/S de rede de um servidor real.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_async_reads [--readers 200] [--writers 60]
+        [--seconds 3] [--products 20000] [--users 5000]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Tuple
+from application.services import ProductService, UserService
+from infrastructure.adapters import (
+    AsyncProductRepositoryBridge,
+    AsyncUserRepositoryBridge,
+    JsonDocumentStore,
+    JsonProductRepository,
+    JsonUserRepository,
+    PooledPasswordHasher,
+    Sha256Kdf,
+)
+from benchmarks.dataset import write_dataset
+
+# Tamanho padrão do threadpool usado pelo FastAPI para rotas síncronas
+DEFAULT_THREADPOOL_SIZE = 40
+
+
+async def _load(
+    read: Callable[[str], Awaitable[None]],
+    write: Callable[[str], Awaitable[None]],
+    readers: int,
+    writers: int,
+    seconds: float,
+    products: int,
+    users: int,
+) -> Tuple[List[float], int]:
+    """
+    Roda leitores e escritores por `seconds`; devolve as latências das
+    leituras e o número de escritas concluídas.
+    """
+    latencies: List[float] = []
+    writes = 0
+    deadline = time.perf_counter() + seconds
+
+    async def reader(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await read(f"prod-{rng.randrange(products):07d}")
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+
+    async def writer(seed: int) -> None:
+        nonlocal writes
+        rng = random.Random(-seed)
+        while time.perf_counter() < deadline:
+            await write(f"user-{rng.randrange(users):07d}")
+            writes += 1
+            await asyncio.sleep(0)
+
+    await asyncio.gather(
+        *(reader(i) for i in range(readers)),
+        *(writer(i) for i in range(writers)),
+    )
+    return latencies, writes
+
+
+async def run_sync(path: str, args: argparse.Namespace) -> Tuple[List[float], int]:
+    store = JsonDocumentStore(path)
+    products = JsonProductRepository(store)
+    users = JsonUserRepository(store)
+    pool = ThreadPoolExecutor(max_workers=DEFAULT_THREADPOOL_SIZE)
+    loop = asyncio.get_running_loop()
+
+    def get_product(product_id: str) -> dict:
+        return products.get_by_id(product_id).to_dict()
+
+    def update_profile(user_id: str) -> None:
+        user = users.get_by_id(user_id)
+        user.phone = str(time.perf_counter_ns())
+        users.update(user)
+
+    async def read(product_id: str) -> None:
+        await loop.run_in_executor(pool, get_product, product_id)
+
+    async def write(user_id: str) -> None:
+        await loop.run_in_executor(pool, update_profile, user_id)
+
+    try:
+        return await _load(
+            read, write, args.readers, args.writers, args.seconds, args.products, args.users
+        )
+    finally:
+        pool.shutdown()
+
+
+async def run_async(path: str, args: argparse.Namespace) -> Tuple[List[float], int]:
+    store = JsonDocumentStore(path)
+    products = ProductService(
+        AsyncProductRepositoryBridge(JsonProductRepository(store), inline_reads=True)
+    )
+    users = UserService(
+        AsyncUserRepositoryBridge(JsonUserRepository(store), inline_reads=True),
+        PooledPasswordHasher(Sha256Kdf()),
+    )
+
+    async def read(product_id: str) -> None:
+        (await products.get_product_by_id(product_id)).to_dict()
+
+    async def write(user_id: str) -> None:
+        await users.update_profile(user_id, phone=str(time.perf_counter_ns()))
+
+    return await _load(
+        read, write, args.readers, args.writers, args.seconds, args.products, args.users
+    )
+
+
+def _report(label: str, result: Tuple[List[float], int], seconds: float) -> None:
+    latencies, writes = result
+    if len(latencies) < 2:
+        print(f"{label:<12} leituras insuficientes para medir")
+        return
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<12} {len(latencies) / seconds:>10.0f} leituras/s "
+        f"{writes / seconds:>6.0f} escritas/s   "
+        f"p50 {cuts[49] * 1000:>8.2f} ms   p99 {cuts[98] * 1000:>8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--readers", type=int, default=200)
+    parser.add_argument("--writers", type=int, default=60)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(
+        f"{args.readers} leitores, {args.writers} escritores, {args.seconds:.0f} s, "
+        f"threadpool síncrono = {DEFAULT_THREADPOOL_SIZE} threads"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=args.products, users=args.users)
+        _report("síncrono", asyncio.run(run_sync(path, args)), args.seconds)
+        _report("assíncrono", asyncio.run(run_async(path, args)), args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark de ida e volta do catálogo em NDJSON (importação + exportação).
+
+Gera um arquivo NDJSON com --products produtos (em pedaços, sem montar a
+lista inteira), importa-o em um banco SQLite vazio e o exporta de volta,
+pelos mesmos caminhos da CLI (ver infrastructure.cli.catalog_ndjson).
+Reporta o tempo de cada etapa e o pico de memória alocada (tracemalloc),
+que deve ficar constante com o tamanho do catálogo.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_catalog_ndjson [--products 200000] [--batch-size 1000]
+"""
+
+import argparse
+import asyncio
+import filecmp
+import os
+import tempfile
+import time
+import tracemalloc
+from application.services import ProductService
+from infrastructure.adapters import (
+    AsyncProductRepositoryBridge,
+    AsyncUnitOfWorkBridge,
+    SqliteDatabase,
+    SqliteProductRepository,
+    SqliteUnitOfWork,
+)
+from infrastructure.adapters import ndjson
+from infrastructure.cli.catalog_ndjson import export_catalog, import_catalog
+from benchmarks.dataset import make_products
+
+
+def write_catalog(path: str, products: int, chunk: int = 10_000) -> None:
+    """Grava produtos sintéticos em NDJSON, um pedaço por vez."""
+    with open(path, "wb") as f:
+        for start in range(0, products, chunk):
+            batch = make_products(min(chunk, products - start), seed=start)
+            for offset, product in enumerate(batch):
+                product["id"] = f"prod-{start + offset:07d}"
+            f.write(ndjson.encode_lines(batch))
+
+
+def _measure(label: str, coroutine) -> object:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = asyncio.run(coroutine)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<11} {elapsed:>8.2f} s   pico de memória {peak / 2 ** 20:>7.1f} MiB")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "catalog.ndjson")
+        exported = os.path.join(tmp, "exported.ndjson")
+        write_catalog(source, args.products)
+        print(
+            f"{args.products} produtos, lotes de {args.batch_size}, "
+            f"arquivo de {os.path.getsize(source) / 2 ** 20:.1f} MiB"
+        )
+
+        database = SqliteDatabase(os.path.join(tmp, "catalog.sqlite3"))
+        service = ProductService(
+            AsyncProductRepositoryBridge(SqliteProductRepository(database)),
+            AsyncUnitOfWorkBridge(SqliteUnitOfWork(database), exclusive=True),
+        )
+        with open(source, "rb") as f:
+            summary = _measure("importação", import_catalog(service, f, args.batch_size))
+        with open(exported, "wb") as f:
+            count = _measure("exportação", export_catalog(service, f, args.batch_size))
+
+        same = filecmp.cmp(source, exported, shallow=False)
+        print(
+            f"importados {summary['imported']}, exportados {count}, "
+            f"arquivos {'idênticos' if same else 'DIFERENTES'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark do motor colunar (NumPy) de filtros e ordenação do catálogo.
+
+Para um catálogo grande, mede a página de filter_products_page (filtros
+de faixa e igualdade + ordenação) em três caminhos:
+- lista: a implementação padrão do port (list comprehensions sobre os
+  produtos e ordenação do resultado completo);
+- facetas: JsonProductRepository com o ProductFacetIndex;
+- colunar: JsonProductRepository(columnar=True), com ProductColumnIndex.
+
+Os repositórios são montados um de cada vez (cabem na memória juntos
+só em catálogos menores) e as páginas dos três caminhos devem coincidir.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_columnar_catalog [--products 1000000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+from domain.ports import ProductRepositoryPort
+from infrastructure.adapters import JsonDocumentStore, JsonProductRepository
+from benchmarks.dataset import write_dataset
+
+PAGE = 20
+
+QUERIES: List[Tuple[str, dict]] = [
+    ("preço 100-200, feminino, -rating", dict(min_price=100, max_price=200, gender="feminino", sort="-rating")),
+    ("categoria + tamanho, price", dict(category="Camisetas", size="M", sort="price")),
+    ("preço <= 500, -reviews_count", dict(max_price=500, sort="-reviews_count")),
+    ("gênero + preço >= 300, name", dict(gender="masculino", min_price=300, sort="name")),
+    ("sem filtros, -price", dict(sort="-price")),
+]
+
+
+def _median_ms(func: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _measure(repository: JsonProductRepository, page, repeat: int) -> Dict[str, Tuple[float, list]]:
+    results = {}
+    for name, query in QUERIES:
+        first = page(repository, **query, limit=PAGE)
+        # A segunda página exercita o cursor (keyset nos índices)
+        second = page(repository, **query, limit=PAGE, cursor=first.next_cursor)
+        ms = _median_ms(lambda: page(repository, **query, limit=PAGE), repeat)
+        results[name] = (ms, [p.id for p in first.items + second.items])
+    return results
+
+
+def run(path: str, repeat: int) -> Dict[str, Dict[str, Tuple[float, list]]]:
+    results = {}
+    for engine, columnar in (("facetas", False), ("colunar", True)):
+        start = time.perf_counter()
+        repository = JsonProductRepository(JsonDocumentStore(path), columnar=columnar)
+        print(f"{engine}: carga em {time.perf_counter() - start:.1f} s")
+        if not columnar:
+            # Caminho de lista: a implementação padrão do port, sem índices
+            results["lista"] = _measure(
+                repository, ProductRepositoryPort.filter_products_page, repeat
+            )
+        results[engine] = _measure(repository, JsonProductRepository.filter_products_page, repeat)
+        del repository
+        gc.collect()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=args.products)
+        results = run(path, args.repeat)
+
+    engines = ["lista", "facetas", "colunar"]
+    print(f"\n{args.products} produtos, páginas de {PAGE} (ms, mediana)")
+    print(f"{'consulta':<38}" + "".join(f"{e:>10}" for e in engines))
+    for name, _ in QUERIES:
+        ids = {results[e][name][1] == results["lista"][name][1] for e in engines}
+        assert ids == {True}, f"resultados diferentes em {name!r}"
+        print(f"{name:<38}" + "".join(f"{results[e][name][0]:>10.1f}" for e in engines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Teste de estresse do checkout concorrente.
+
+Vários clientes criam pedidos ao mesmo tempo pelo OrderService
+assíncrono (como as rotas fazem), disputando um conjunto pequeno de
+produtos com pouco estoque. As escritas rodam em threads pela ponte
+assíncrona, então as reservas concorrem de fato entre threads. Ao final,
+verifica que:
+- nenhum estoque ficou negativo;
+- para cada produto, estoque inicial - estoque final = soma das
+  quantidades dos pedidos criados (nada vendido a mais, nada perdido);
+- o arquivo/banco recarregado do disco tem o mesmo estoque da memória.
+
+E reporta a vazão de checkouts (pedidos criados + recusados por segundo).
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_concurrent_checkout [--backend json|sqlite]
+        [--clients 8] [--checkouts 400] [--products 50] [--stock 20]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from domain.entities.cart import Cart, CartItem
+from domain.exceptions import InsufficientStockException
+from application.services import OrderService
+from infrastructure.adapters import (
+    AsyncOrderRepositoryBridge,
+    AsyncProductRepositoryBridge,
+    AsyncUnitOfWorkBridge,
+    JsonDocumentStore,
+    JsonOrderRepository,
+    JsonProductRepository,
+    JsonUnitOfWork,
+    SqliteDatabase,
+    SqliteOrderRepository,
+    SqliteProductRepository,
+    SqliteUnitOfWork,
+)
+from infrastructure.cli.migrate_json_to_sqlite import migrate
+from benchmarks.dataset import write_dataset
+
+
+def _open(backend: str, json_path: str, sqlite_path: str):
+    """Retorna (repositório de produtos, de pedidos, unidade de trabalho)."""
+    if backend == "json":
+        store = JsonDocumentStore(json_path)
+        return (
+            JsonProductRepository(store),
+            JsonOrderRepository(store),
+            JsonUnitOfWork(store),
+        )
+    database = SqliteDatabase(sqlite_path)
+    return (
+        SqliteProductRepository(database),
+        SqliteOrderRepository(database),
+        SqliteUnitOfWork(database),
+    )
+
+
+def _set_stock(json_path: str, stock: int) -> None:
+    store = JsonDocumentStore(json_path)
+    products = JsonProductRepository(store)
+    with store.batch():
+        for product in products.get_all():
+            product.stock = stock
+            products.update(product)
+
+
+async def run(
+    backend: str, clients: int, checkouts: int, products: int, stock: int
+) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = write_dataset(tmp, products=products)
+        _set_stock(json_path, stock)
+        sqlite_path = os.path.join(tmp, "data.sqlite3")
+        if backend == "sqlite":
+            migrate(json_path, sqlite_path)
+
+        product_repository, order_repository, unit_of_work = _open(
+            backend, json_path, sqlite_path
+        )
+        inline_reads = backend == "json"
+        service = OrderService(
+            AsyncOrderRepositoryBridge(order_repository, inline_reads),
+            AsyncProductRepositoryBridge(product_repository, inline_reads),
+            AsyncUnitOfWorkBridge(unit_of_work, exclusive=backend == "sqlite"),
+        )
+        catalog = product_repository.get_all()
+        initial = {p.id: p.stock for p in catalog}
+
+        created, refused = [], []
+
+        async def client(client_id: int) -> None:
+            rng = random.Random(client_id)
+            for n in range(checkouts // clients):
+                cart = Cart(user_id=f"user-{client_id}")
+                for product in rng.sample(catalog, rng.randint(1, 3)):
+                    cart.add_item(CartItem(
+                        product_id=product.id,
+                        product_name=product.name,
+                        quantity=rng.randint(1, 3),
+                        size=product.sizes[0],
+                        color=product.colors[0],
+                        unit_price=product.price,
+                    ))
+                try:
+                    order = await service.create_order_from_cart(cart, "Rua A, 1")
+                except InsufficientStockException:
+                    refused.append(n)
+                else:
+                    created.append(order)
+
+        began = time.perf_counter()
+        await asyncio.gather(*(client(i) for i in range(clients)))
+        elapsed = time.perf_counter() - began
+
+        sold = Counter()
+        for order in created:
+            for item in order.items:
+                sold[item.product_id] += item.quantity
+        final = {p.id: p.stock for p in product_repository.get_all()}
+        assert all(s >= 0 for s in final.values()), "estoque negativo"
+        for product_id, before in initial.items():
+            assert before - final[product_id] == sold[product_id], (
+                f"estoque inconsistente em {product_id}"
+            )
+
+        # O que foi persistido deve bater com a memória
+        reloaded, _, _ = _open(backend, json_path, sqlite_path)
+        assert {p.id: p.stock for p in reloaded.get_all()} == final, "persistência divergente"
+
+        return {
+            "created": len(created),
+            "refused": len(refused),
+            "elapsed": elapsed,
+            "throughput": (len(created) + len(refused)) / elapsed,
+            "sold_out": sum(1 for s in final.values() if s == 0),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--checkouts", type=int, default=400)
+    parser.add_argument("--products", type=int, default=50)
+    parser.add_argument("--stock", type=int, default=20)
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        run(args.backend, args.clients, args.checkouts, args.products, args.stock)
+    )
+    print(
+        f"backend={args.backend} clientes={args.clients}: "
+        f"{result['created']} pedidos criados, {result['refused']} recusados "
+        f"(sem estoque), {result['sold_out']}/{args.products} produtos esgotados"
+    )
+    print(f"vazão: {result['throughput']:.0f} checkouts/s em {result['elapsed']:.2f} s")
+    print("estoque consistente: nenhum produto negativo ou vendido a mais")
+
+
+if __name__ == "__main__":
+    main()
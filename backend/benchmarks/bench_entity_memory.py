@@ -0,0 +1,103 @@
+"""
+Benchmark de memória das entidades carregadas do JSON.
+
+Mede com tracemalloc quantos bytes cada entidade retém depois de
+json.loads + from_dict (com os dicionários de origem já descartados),
+comparando as entidades atuais (slots, tuplas e strings compartilhadas)
+com o formato anterior: dataclasses comuns, com __dict__ por instância,
+listas e uma cópia de cada string por registro.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_entity_memory [--count 20000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from typing import Callable, List
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from domain.entities.user import User
+from benchmarks.dataset import make_orders, make_products, make_users
+
+
+def _legacy(cls: type) -> type:
+    """Dataclass comum (sem slots) com os mesmos campos da entidade."""
+    return make_dataclass(
+        f"Legacy{cls.__name__}",
+        [(f.name, f.type, field(default=None)) for f in fields(cls)],
+    )
+
+
+LegacyProduct = _legacy(Product)
+LegacyOrder = _legacy(Order)
+LegacyOrderItem = _legacy(OrderItem)
+LegacyUser = _legacy(User)
+
+
+def _legacy_from_dict(cls: type, data: dict, **overrides):
+    names = {f.name for f in fields(cls)}
+    return cls(**{**{k: v for k, v in data.items() if k in names}, **overrides})
+
+
+def _legacy_order(data: dict):
+    items = [_legacy_from_dict(LegacyOrderItem, i) for i in data["items"]]
+    return _legacy_from_dict(LegacyOrder, data, items=items)
+
+
+def _bytes_per_entity(text: str, build: Callable[[dict], object]) -> float:
+    """Bytes retidos por entidade após converter todos os registros de text."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        raw = json.loads(text)
+        count = len(raw)
+        entities: List[object] = [build(r) for r in raw]
+        del raw
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del entities
+    return retained / count
+
+
+def run(count: int) -> List[dict]:
+    products = make_products(count)
+    users = make_users(count)
+    orders = make_orders(count, users, products)
+    cases = [
+        ("Product", products, lambda d: _legacy_from_dict(LegacyProduct, d), Product.from_dict),
+        ("Order (com itens)", orders, _legacy_order, Order.from_dict),
+        ("User", users, lambda d: _legacy_from_dict(LegacyUser, d), User.from_dict),
+    ]
+    results = []
+    for name, records, legacy, current in cases:
+        # Texto serializado: cada json.loads cria strings novas, como a
+        # leitura do data.json
+        text = json.dumps(records, ensure_ascii=False)
+        results.append({
+            "entity": name,
+            "before": _bytes_per_entity(text, legacy),
+            "after": _bytes_per_entity(text, current),
+        })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{args.count} entidades de cada tipo (bytes retidos por entidade)")
+    print(f"{'entidade':>20} {'antes':>10} {'depois':>10} {'redução':>9}")
+    for r in run(args.count):
+        saved = 1 - r["after"] / r["before"]
+        print(f"{r['entity']:>20} {r['before']:>10.0f} {r['after']:>10.0f} {saved:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
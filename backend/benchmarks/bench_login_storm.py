@@ -0,0 +1,143 @@
+"""
+Benchmark de rajada de logins: hash no event loop x pool limitado.
+
+Enquanto vários clientes fazem login sem parar, outros navegam no
+catálogo. Compara:
+
+- no loop (como seria sem o pool): a KDF roda na própria requisição e
+  trava o event loop durante cada hash; a navegação espera;
+- pool (atual): PooledPasswordHasher calcula os hashes em threads, com
+  fila limitada; o excedente é recusado na hora (503 na API).
+
+Reporta leituras do catálogo por segundo com a latência p50/p99, e os
+logins concluídos e recusados.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_login_storm [--logins 32] [--readers 50]
+        [--seconds 3] [--iterations 600000] [--workers 2] [--max-queue 8]
+
+As iterações padrão são as da KDF em produção (Pbkdf2Kdf); valores
+menores aceleram a rodada, mas subestimam o custo de cada login.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from typing import List, Tuple
+from application.services import ProductService, UserService
+from domain.exceptions import HashingOverloadedException
+from domain.ports import PasswordHasherPort
+from infrastructure.adapters import (
+    AsyncProductRepositoryBridge,
+    AsyncUserRepositoryBridge,
+    JsonDocumentStore,
+    JsonProductRepository,
+    JsonUserRepository,
+    Pbkdf2Kdf,
+    PooledPasswordHasher,
+)
+from benchmarks.dataset import write_dataset
+
+# Senha cujo hash é DEFAULT_PASSWORD_HASH (ver benchmarks.dataset)
+PASSWORD = "admin"
+
+
+class _InlineHasher(PooledPasswordHasher):
+    """Calcula o hash na própria chamada, bloqueando o event loop."""
+
+    async def _run(self, func, *args):
+        return func(*args)
+
+
+async def _storm(
+    path: str, hasher: PasswordHasherPort, args: argparse.Namespace
+) -> Tuple[List[float], int, int]:
+    store = JsonDocumentStore(path)
+    products = ProductService(
+        AsyncProductRepositoryBridge(JsonProductRepository(store), inline_reads=True)
+    )
+    users = UserService(
+        AsyncUserRepositoryBridge(JsonUserRepository(store), inline_reads=True), hasher
+    )
+    # Migra antes os hashes legados: a rajada mede só logins com a KDF
+    for i in range(args.logins):
+        await users.login(f"usuario{i}@email.com", PASSWORD)
+
+    latencies: List[float] = []
+    accepted = rejected = 0
+    deadline = time.perf_counter() + args.seconds
+
+    async def reader(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            # A latência inclui a espera pela vez no event loop, como a de
+            # uma requisição que chega pela rede
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            await products.get_product_by_id(f"prod-{rng.randrange(args.products):07d}")
+            latencies.append(time.perf_counter() - start)
+
+    async def client(i: int) -> None:
+        nonlocal accepted, rejected
+        while time.perf_counter() < deadline:
+            try:
+                await users.login(f"usuario{i}@email.com", PASSWORD)
+                accepted += 1
+            except HashingOverloadedException:
+                rejected += 1
+                # Retry-After da API, em escala de benchmark
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(
+        *(reader(i) for i in range(args.readers)),
+        *(client(i) for i in range(args.logins)),
+    )
+    return latencies, accepted, rejected
+
+
+def _report(label: str, result: Tuple[List[float], int, int], seconds: float) -> None:
+    latencies, accepted, rejected = result
+    if len(latencies) < 2:
+        print(f"{label:<8} leituras insuficientes para medir")
+        return
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<8} {len(latencies) / seconds:>9.0f} leituras/s   "
+        f"p50 {cuts[49] * 1000:>8.2f} ms   p99 {cuts[98] * 1000:>8.2f} ms   "
+        f"logins {accepted:>5} ok {rejected:>6} recusados"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--readers", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--iterations", type=int, default=Pbkdf2Kdf().iterations)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=8)
+    parser.add_argument("--products", type=int, default=10_000)
+    args = parser.parse_args()
+
+    kdf = Pbkdf2Kdf(args.iterations)
+    print(
+        f"{args.logins} clientes de login, {args.readers} leitores, "
+        f"PBKDF2 com {args.iterations} iterações, {args.seconds:.0f} s"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=args.products, users=args.logins)
+        inline = _InlineHasher(kdf)
+        _report("no loop", asyncio.run(_storm(path, inline, args)), args.seconds)
+        pooled = PooledPasswordHasher(kdf, workers=args.workers, max_queue=args.max_queue)
+        try:
+            _report("pool", asyncio.run(_storm(path, pooled, args)), args.seconds)
+        finally:
+            pooled.close()
+
+
+if __name__ == "__main__":
+    main()
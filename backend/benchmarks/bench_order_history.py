@@ -0,0 +1,92 @@
+"""
+Benchmark do histórico de pedidos: lista completa x páginas keyset.
+
+Um usuário com --orders pedidos. Compara o custo, por chamada, de:
+
+- lista completa (como antes): todos os pedidos do usuário, serializados;
+- página 1, página do meio e última página (--limit pedidos cada), pelo
+  cursor keyset de get_page_by_user_id: devem custar o mesmo.
+
+Roda nos dois backends (JSON e SQLite).
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_order_history [--orders 20000] [--limit 50]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List, Optional
+from domain.ports import OrderRepositoryPort
+from infrastructure.adapters import (
+    JsonDocumentStore,
+    JsonOrderRepository,
+    SqliteDatabase,
+    SqliteOrderRepository,
+)
+from infrastructure.cli.migrate_json_to_sqlite import migrate
+from benchmarks.dataset import make_users, write_dataset
+
+USER_ID = make_users(1)[0]["id"]
+
+
+def _time(func: Callable[[], object], seconds: float = 0.5) -> float:
+    """Tempo médio (µs) de func, repetida por ~seconds."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return elapsed / calls * 1e6
+
+
+def _cursors(repository: OrderRepositoryPort, limit: int) -> List[Optional[str]]:
+    """Cursor de cada página (None = primeira)."""
+    cursors: List[Optional[str]] = [None]
+    while True:
+        page = repository.get_page_by_user_id(USER_ID, "-created_at", limit, cursors[-1])
+        if page.next_cursor is None:
+            return cursors
+        cursors.append(page.next_cursor)
+
+
+def run(label: str, repository: OrderRepositoryPort, limit: int) -> None:
+    cursors = _cursors(repository, limit)
+
+    def full_list() -> None:
+        [o.to_dict() for o in repository.get_by_user_id(USER_ID)]
+
+    def page_at(cursor: Optional[str]) -> Callable[[], None]:
+        def page() -> None:
+            result = repository.get_page_by_user_id(USER_ID, "-created_at", limit, cursor)
+            [o.to_dict() for o in result.items]
+        return page
+
+    print(
+        f"{label:<7} lista completa {_time(full_list):>10.1f} µs   "
+        f"página 1 {_time(page_at(cursors[0])):>7.1f} µs   "
+        f"meio {_time(page_at(cursors[len(cursors) // 2])):>7.1f} µs   "
+        f"última {_time(page_at(cursors[-1])):>7.1f} µs   ({len(cursors)} páginas)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{args.orders} pedidos de um usuário, páginas de {args.limit}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=200, users=1, orders=args.orders)
+        sqlite_path = os.path.join(tmp, "data.sqlite3")
+        migrate(path, sqlite_path)
+        run("json", JsonOrderRepository(JsonDocumentStore(path)), args.limit)
+        run("sqlite", SqliteOrderRepository(SqliteDatabase(sqlite_path)), args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Micro-benchmark das buscas por chave primária nos repositórios JSON.
+
+Mede o custo médio de get_by_id (produtos, usuários e pedidos) e de
+update (produtos) para coleções de tamanhos crescentes. Com os índices
+em dicionário, o custo por operação deve permanecer estável.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_primary_key_lookup [--sizes 1000,10000,100000,200000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from infrastructure.adapters import (
+    JsonDocumentStore,
+    JsonProductRepository,
+    JsonUserRepository,
+    JsonOrderRepository,
+)
+from benchmarks.dataset import write_dataset
+
+OPERATIONS = 100_000
+
+
+def _ns_per_op(func, keys) -> float:
+    start = time.perf_counter_ns()
+    for key in keys:
+        func(key)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def run(size: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=size, users=size, orders=size)
+        store = JsonDocumentStore(path)
+        products = JsonProductRepository(store)
+        users = JsonUserRepository(store)
+        orders = JsonOrderRepository(store)
+
+        rng = random.Random(7)
+        product_ids = [f"prod-{rng.randrange(size):07d}" for _ in range(OPERATIONS)]
+        user_ids = [f"user-{rng.randrange(size):07d}" for _ in range(OPERATIONS)]
+        order_ids = [f"order-{rng.randrange(size):08d}" for _ in range(OPERATIONS)]
+        to_update = [products.get_by_id(pid) for pid in product_ids]
+
+        result = {
+            "size": size,
+            "product_get_by_id": _ns_per_op(products.get_by_id, product_ids),
+            "user_get_by_id": _ns_per_op(users.get_by_id, user_ids),
+            "order_get_by_id": _ns_per_op(orders.get_by_id, order_ids),
+        }
+        # Dentro de um batch, mede só a manutenção do índice: o flush em
+        # disco acontece uma única vez, ao final, fora da medição.
+        with store.batch():
+            result["product_update"] = _ns_per_op(products.update, to_update)
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000,200000")
+    args = parser.parse_args()
+
+    columns = ["product_get_by_id", "user_get_by_id", "order_get_by_id", "product_update"]
+    print(f"{'tamanho':>10} " + " ".join(f"{c:>18}" for c in columns) + "   (ns/op)")
+    for size in (int(s) for s in args.sizes.split(",")):
+        result = run(size)
+        print(f"{size:>10} " + " ".join(f"{result[c]:>18.0f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
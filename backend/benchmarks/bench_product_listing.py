@@ -0,0 +1,107 @@
+"""
+Benchmark da serialização da listagem de produtos.
+
+Compara, para GET /api/products/ sem filtros:
+- caminho antigo: Product.to_dict() -> jsonable_encoder -> json.dumps;
+- caminho novo: fragmentos JSON em cache (ProductJsonCache) concatenados.
+
+O caminho novo é medido frio (primeira listagem, que preenche o cache),
+quente (listagens seguintes) e na primeira listagem após alterar 1% dos
+produtos. Ambos os caminhos devem produzir exatamente os mesmos bytes.
+Se o FastAPI não estiver instalado, o caminho antigo é medido sem o
+jsonable_encoder.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_product_listing [--products 10000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from infrastructure.adapters import (
+    AsyncProductRepositoryBridge,
+    JsonDocumentStore,
+    JsonProductRepository,
+)
+from infrastructure.web.product_json_cache import ProductJsonCache, encode_json, join_object
+from application.services import ProductService
+from benchmarks.dataset import write_dataset
+
+try:
+    from fastapi.encoders import jsonable_encoder
+except ImportError:  # pragma: no cover - FastAPI ausente no ambiente de medição
+    jsonable_encoder = None
+
+
+def old_path(repository: JsonProductRepository) -> bytes:
+    page = repository.filter_products_page()
+    content = {
+        "products": [p.to_dict() for p in page.items],
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+    }
+    if jsonable_encoder is not None:
+        content = jsonable_encoder(content)
+    return encode_json(content)
+
+
+def new_path(repository: JsonProductRepository, payloads: ProductJsonCache) -> bytes:
+    version = repository.catalog_version()
+    page = repository.filter_products_page()
+    return join_object(
+        products=payloads.encode_many(page.items, version),
+        total=page.total,
+        next_cursor=page.next_cursor,
+    )
+
+
+def _median_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JsonDocumentStore(write_dataset(tmp, products=args.products))
+        repository = JsonProductRepository(store)
+        service = ProductService(AsyncProductRepositoryBridge(repository, inline_reads=True))
+        payloads = ProductJsonCache(service)
+
+        start = time.perf_counter()
+        cold = new_path(repository, payloads)
+        cold_ms = (time.perf_counter() - start) * 1000
+        assert cold == old_path(repository), "os dois caminhos geram JSON diferente"
+
+        old_ms = _median_ms(lambda: old_path(repository), args.repeat)
+        warm_ms = _median_ms(lambda: new_path(repository, payloads), args.repeat)
+
+        # Alterar 1% do catálogo invalida só esses fragmentos
+        with store.batch():
+            for product in repository.get_all()[::100]:
+                product.stock += 1
+                repository.update(product)
+        start = time.perf_counter()
+        refreshed = new_path(repository, payloads)
+        after_update_ms = (time.perf_counter() - start) * 1000
+        assert refreshed == old_path(repository)
+
+    encoder = "jsonable_encoder + json.dumps" if jsonable_encoder else "json.dumps"
+    print(f"produtos: {args.products}  tamanho da resposta: {len(cold) / 1024:.0f} KiB")
+    print(f"{'antigo (' + encoder + ')':<42} {old_ms:>9.1f} ms")
+    print(f"{'novo, cache frio':<42} {cold_ms:>9.1f} ms")
+    print(f"{'novo, cache quente':<42} {warm_ms:>9.1f} ms")
+    print(f"{'novo, após alterar 1% dos produtos':<42} {after_update_ms:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
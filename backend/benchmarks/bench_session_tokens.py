@@ -0,0 +1,103 @@
+"""
+Benchmark de autenticação: credenciais a cada chamada x token de sessão.
+
+Compara o custo por chamada de:
+
+- credenciais (como antes): o cliente reenvia email e senha; cada chamada
+  busca o usuário pelo email e recalcula o hash da senha com a KDF
+  (UserService.login). Por ser lento, é medido em menos chamadas (--logins);
+- token: o cliente envia o token emitido no login; cada chamada confere a
+  expiração e o cache de revogados (UserService.authenticate), sem
+  consultar o repositório. A assinatura HMAC é conferida na primeira
+  chamada de cada token ("token, 1ª chamada") e fica em cache nas demais.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.bench_session_tokens [--users 5000] [--calls 20000]
+        [--logins 50] [--revoked 1000] [--kdf pbkdf2]
+"""
+
+import argparse
+import asyncio
+import random
+import secrets
+import tempfile
+import time
+from application.services import UserService
+from infrastructure.adapters import (
+    AsyncUserRepositoryBridge,
+    HmacSessionTokens,
+    JsonDocumentStore,
+    JsonUserRepository,
+    PooledPasswordHasher,
+    make_kdf,
+)
+from benchmarks.dataset import write_dataset
+
+# Senha cujo hash é DEFAULT_PASSWORD_HASH (ver benchmarks.dataset)
+PASSWORD = "admin"
+
+
+async def run(path: str, args: argparse.Namespace) -> None:
+    repository = JsonUserRepository(JsonDocumentStore(path))
+    tokens = HmacSessionTokens(secrets.token_bytes(32))
+    hasher = PooledPasswordHasher(make_kdf(args.kdf), workers=1)
+    service = UserService(
+        AsyncUserRepositoryBridge(repository, inline_reads=True), hasher, tokens
+    )
+
+    rng = random.Random(42)
+    emails = [f"usuario{i}@email.com" for i in range(args.logins)]
+    # O primeiro login migra o hash legado (SHA-256) para a KDF
+    for email in emails:
+        await service.login(email, PASSWORD)
+
+    start = time.perf_counter()
+    for email in emails:
+        await service.login(email, PASSWORD)
+    credentials = (time.perf_counter() - start) / args.logins
+    hasher.close()
+
+    # Tokens de sessão emitidos no login, e parte deles já revogada (logout)
+    sessions = [service.issue_session(repository.get_by_id(f"user-{i:07d}"))
+                for i in range(args.users)]
+    for _ in range(args.revoked):
+        service.logout(tokens.issue(f"user-{rng.randrange(args.users):07d}"))
+    calls = [sessions[rng.randrange(args.users)] for _ in range(args.calls)]
+
+    # 1ª chamada de cada token: confere a assinatura (sem cache)
+    cold = HmacSessionTokens(secrets.token_bytes(32), max_cached=0)
+    cold_calls = [cold.issue(f"user-{i % args.users:07d}") for i in range(args.calls)]
+    start = time.perf_counter()
+    for token in cold_calls:
+        cold.verify(token)
+    first = (time.perf_counter() - start) / args.calls
+
+    start = time.perf_counter()
+    for token in calls:
+        service.authenticate(token)
+    verified = (time.perf_counter() - start) / args.calls
+
+    print(f"{args.calls} chamadas autenticadas, {args.users} usuários, "
+          f"{args.revoked} tokens revogados, KDF {args.kdf}")
+    print(f"credenciais        {credentials * 1e6:>12.2f} µs/chamada")
+    print(f"token, 1ª chamada  {first * 1e6:>12.2f} µs/chamada")
+    print(f"token              {verified * 1e6:>12.2f} µs/chamada")
+    print(f"ganho              {credentials / verified:>12.0f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--revoked", type=int, default=1_000)
+    parser.add_argument("--kdf", default="pbkdf2")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=10, users=args.users)
+        asyncio.run(run(path, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Gerador de dados sintéticos para os benchmarks.
+
+Produz catálogos, usuários e pedidos no mesmo formato do data.json,
+de forma determinística (semente fixa), para que execuções diferentes
+meçam exatamente o mesmo conjunto de dados.
+
+Também grava um data.json avulso (ex.: de 1 mil a 1 milhão de registros):
+    python -m benchmarks.dataset <diretório> [--products 1000000]
+        [--users 1000000] [--orders 1000000]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+from typing import List
+
+CATEGORIES = [
+    "Calças", "Camisas", "Camisetas", "Jaquetas",
+    "Moletons", "Saias", "Shorts", "Vestidos",
+]
+GENDERS = ["masculino", "feminino", "unissex"]
+BRANDS = [
+    "Adventure Gear", "Bella Donna", "Classic Fit", "Comfort Zone", "Denim Co.",
+    "Elegance", "Sport Active", "Street Culture", "Tropical Wear", "Urban Style",
+]
+LETTER_SIZES = ["PP", "P", "M", "G", "GG", "XGG"]
+NUMBER_SIZES = ["34", "36", "38", "40", "42", "44", "46"]
+COLORS = [
+    "Branco", "Preto", "Cinza", "Azul Marinho", "Verde", "Bege",
+    "Vermelho", "Rosa", "Caqui", "Jeans Claro", "Lavanda", "Laranja",
+]
+ADJECTIVES = [
+    "Básica", "Estampada", "Slim", "Oversized", "Clássica", "Esportiva",
+    "Algodão", "Linho", "Jeans", "Floral", "Listrada", "Acolchoada",
+]
+
+# Hash SHA-256 de "admin", o mesmo dos usuários de exemplo
+DEFAULT_PASSWORD_HASH = hashlib.sha256(b"admin").hexdigest()
+
+
+def make_products(count: int, seed: int = 42) -> List[dict]:
+    """Gera `count` produtos sintéticos."""
+    rng = random.Random(seed)
+    products = []
+    for i in range(count):
+        category = rng.choice(CATEGORIES)
+        sizes = NUMBER_SIZES if category in ("Calças", "Shorts") else LETTER_SIZES
+        name = f"{category[:-1]} {rng.choice(ADJECTIVES)} {i}"
+        products.append({
+            "id": f"prod-{i:07d}",
+            "name": name,
+            "description": f"{name} com acabamento {rng.choice(ADJECTIVES).lower()}.",
+            "price": round(rng.uniform(19.9, 899.9), 2),
+            "category": category,
+            "sizes": rng.sample(sizes, rng.randint(2, len(sizes))),
+            "colors": rng.sample(COLORS, rng.randint(1, 4)),
+            "image_url": f"https://example.com/img/{i}.jpg",
+            "stock": rng.randint(0, 500),
+            "brand": rng.choice(BRANDS),
+            "gender": rng.choice(GENDERS),
+            "rating": round(rng.uniform(1.0, 5.0), 1),
+            "reviews_count": rng.randint(0, 5000),
+        })
+    return products
+
+
+def make_users(count: int) -> List[dict]:
+    """Gera `count` usuários sintéticos (senha "admin")."""
+    return [
+        {
+            "id": f"user-{i:07d}",
+            "name": f"Usuário {i}",
+            "email": f"usuario{i}@email.com",
+            "password_hash": DEFAULT_PASSWORD_HASH,
+            "address": f"Rua {i}, {i % 1000} - São Paulo, SP",
+            "phone": None,
+        }
+        for i in range(count)
+    ]
+
+
+def make_orders(
+    count: int, users: List[dict], products: List[dict], seed: int = 42
+) -> List[dict]:
+    """Gera `count` pedidos distribuídos entre os usuários informados."""
+    rng = random.Random(seed)
+    orders = []
+    for i in range(count):
+        items = []
+        for product in rng.sample(products, min(len(products), rng.randint(1, 4))):
+            quantity = rng.randint(1, 3)
+            items.append({
+                "product_id": product["id"],
+                "product_name": product["name"],
+                "quantity": quantity,
+                "size": product["sizes"][0],
+                "color": product["colors"][0],
+                "unit_price": product["price"],
+                "subtotal": quantity * product["price"],
+            })
+        orders.append({
+            "id": f"order-{i:08d}",
+            "user_id": rng.choice(users)["id"],
+            "items": items,
+            "status": "pendente",
+            "total": sum(item["subtotal"] for item in items),
+            "created_at": f"2026-01-01T00:00:00.{i:06d}",
+            "shipping_address": "Rua das Flores, 123 - São Paulo, SP",
+        })
+    return orders
+
+
+def write_dataset(
+    directory: str, products: int, users: int = 0, orders: int = 0
+) -> str:
+    """Grava um data.json sintético em `directory` e retorna seu caminho."""
+    product_list = make_products(products)
+    user_list = make_users(users)
+    order_list = make_orders(orders, user_list, product_list) if users else []
+
+    path = os.path.join(directory, "data.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"products": product_list, "users": user_list, "orders": order_list},
+            f,
+            ensure_ascii=False,
+        )
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Grava um data.json sintético.")
+    parser.add_argument("directory")
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--orders", type=int, default=1000)
+    args = parser.parse_args()
+    path = write_dataset(args.directory, args.products, args.users, args.orders)
+    print(f"{path}: {args.products} produtos, {args.users} usuários, {args.orders} pedidos")
+
+
+if __name__ == "__main__":
+    main()
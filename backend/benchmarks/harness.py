@@ -0,0 +1,149 @@
+"""
+Medição e relatório da suíte de benchmarks.
+
+Cada caso é executado algumas vezes sem medição (aquecimento) e depois
+`iterations` vezes, cronometrando cada chamada isoladamente. O resultado
+de um caso traz os percentis p50/p95/p99, a média e as operações por
+segundo; o relatório reúne os casos com os dados da execução (commit,
+Python, parâmetros) em JSON, para que duas execuções possam ser
+comparadas (ver compare).
+"""
+
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def percentile(sorted_samples: List[float], q: float) -> float:
+    """Percentil q (0-100) pelo método do posto mais próximo."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(name: str, samples_ns: List[int], **labels: Any) -> Dict[str, Any]:
+    """Resultado de um caso a partir das durações (ns) de cada chamada."""
+    samples = sorted(s / 1000 for s in samples_ns)
+    total_s = sum(samples_ns) / 1e9
+    return {
+        "name": name,
+        **labels,
+        "iterations": len(samples),
+        "p50_us": round(percentile(samples, 50), 2),
+        "p95_us": round(percentile(samples, 95), 2),
+        "p99_us": round(percentile(samples, 99), 2),
+        "mean_us": round(sum(samples) / len(samples), 2) if samples else 0.0,
+        "ops_per_sec": round(len(samples) / total_s, 1) if total_s else 0.0,
+    }
+
+
+def measure(
+    name: str,
+    func: Callable[[int], Any],
+    iterations: int,
+    warmup: int = 3,
+    **labels: Any,
+) -> Dict[str, Any]:
+    """Mede func(i) para i em range(iterations), após `warmup` chamadas."""
+    for i in range(warmup):
+        func(i)
+    samples = []
+    clock = time.perf_counter_ns
+    for i in range(iterations):
+        start = clock()
+        func(warmup + i)
+        samples.append(clock() - start)
+    return summarize(name, samples, **labels)
+
+
+async def measure_async(
+    name: str,
+    func: Callable[[int], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 3,
+    **labels: Any,
+) -> Dict[str, Any]:
+    """Versão de measure para casos de uso assíncronos (await func(i))."""
+    for i in range(warmup):
+        await func(i)
+    samples = []
+    clock = time.perf_counter_ns
+    for i in range(iterations):
+        start = clock()
+        await func(warmup + i)
+        samples.append(clock() - start)
+    return summarize(name, samples, **labels)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_report(results: Iterable[Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Relatório JSON de uma execução da suíte."""
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "params": params,
+        "results": list(results),
+    }
+
+
+def _case_key(result: Dict[str, Any]) -> Tuple[str, str, Any]:
+    return result["group"], result["name"], result.get("size")
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Casos presentes nos dois relatórios, com a razão novo/antigo do p50 e
+    do p99 (acima de 1 = mais lento no relatório novo).
+    """
+    previous = {_case_key(r): r for r in old["results"]}
+    rows = []
+    for result in new["results"]:
+        before = previous.get(_case_key(result))
+        if before is None:
+            continue
+        rows.append({
+            "group": result["group"],
+            "name": result["name"],
+            "size": result.get("size"),
+            "p50_ratio": _ratio(result["p50_us"], before["p50_us"]),
+            "p99_ratio": _ratio(result["p99_us"], before["p99_us"]),
+        })
+    return rows
+
+
+def _ratio(new: float, old: float) -> Optional[float]:
+    return round(new / old, 3) if old else None
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_report(report: Dict[str, Any], path: Optional[str]) -> None:
+    """Grava o relatório em path (ou na saída padrão, se path for None)."""
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if path is None:
+        print(text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
@@ -0,0 +1,532 @@
+"""
+Gerador de carga com um mix de tráfego realista.
+
+Dispara contra a API uma mistura configurável de operações de clientes:
+navegação no catálogo, filtros, busca, detalhe de produto, login,
+checkout (POST /api/orders/) e cancelamento. Por padrão a aplicação
+(main.app) roda no próprio processo, via ASGI, sobre um data.json
+sintético; com --url a carga vai para uma API já em execução (ex.: um
+uvicorn local).
+
+Modos de chegada:
+- laço fechado (--rate 0): `concurrency` clientes, cada um emendando uma
+  requisição na outra;
+- laço aberto (--rate R): chegadas de Poisson a R req/s, com no máximo
+  `concurrency` requisições em andamento. A latência é medida a partir
+  do instante previsto para a chegada, então o tempo de fila entra na
+  medição (sem omissão coordenada).
+
+Ao final, reporta por operação as contagens (ok, recusadas com 4xx,
+erros com 5xx ou falha de transporte), os percentis e um histograma de
+latência, e verifica a consistência de estoque e pedidos:
+- nenhum produto com estoque negativo;
+- estoque final = inicial - itens dos pedidos criados e não cancelados;
+- cada pedido criado existe, com o status esperado;
+- no modo local (JSON), o data.json relido do disco confere com a API.
+
+Exige httpx (e FastAPI no modo local).
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.load_generator [--duration 30] [--concurrency 32]
+        [--rate 0] [--mix browse=40,filter=20,search=15,detail=10,login=3,checkout=10,cancel=2]
+        [--products 10000] [--users 1000] [--hot-products 20] [--stock 200]
+        [--url http://localhost:8000] [--login email:senha] [--json resultado.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from benchmarks.dataset import ADJECTIVES, GENDERS, LETTER_SIZES, write_dataset
+from benchmarks.harness import summarize
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx ausente
+    httpx = None
+
+DEFAULT_MIX = "browse=40,filter=20,search=15,detail=10,login=3,checkout=10,cancel=2"
+# Limites superiores (ms) das faixas do histograma; a última faixa é aberta
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# Usuários de exemplo do data.json (modo --url sem --login)
+DEFAULT_LOGINS = ["joao@email.com:admin", "maria@email.com:admin", "carlos@email.com:admin"]
+SORTS = (None, "price", "-price", "-rating", "name", "-reviews_count")
+
+
+class EndpointStats:
+    """Latências e desfechos das requisições de uma operação."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples_ns: List[int] = []
+        self.outcomes: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.failures: Counter = Counter()
+
+    def record(self, elapsed_ns: int, status: Optional[int], failure: str = "") -> None:
+        self.samples_ns.append(elapsed_ns)
+        if status is None:
+            self.outcomes["erro"] += 1
+            self.failures[failure] += 1
+            return
+        self.statuses[status] += 1
+        if status < 400:
+            self.outcomes["ok"] += 1
+        elif status < 500:
+            self.outcomes["recusada"] += 1
+        else:
+            self.outcomes["erro"] += 1
+
+    def histogram(self) -> List[Tuple[str, int]]:
+        """Contagem por faixa de latência (ms)."""
+        counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        for sample in self.samples_ns:
+            ms = sample / 1e6
+            index = next(
+                (i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if ms <= bound),
+                len(HISTOGRAM_BOUNDS_MS),
+            )
+            counts[index] += 1
+        labels = [f"<= {b} ms" for b in HISTOGRAM_BOUNDS_MS]
+        labels.append(f"> {HISTOGRAM_BOUNDS_MS[-1]} ms")
+        return list(zip(labels, counts))
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            **summarize(self.name, self.samples_ns),
+            "ok": self.outcomes["ok"],
+            "rejected": self.outcomes["recusada"],
+            "errors": self.outcomes["erro"],
+            "statuses": {str(s): c for s, c in sorted(self.statuses.items())},
+            "failures": dict(self.failures),
+            "histogram": self.histogram(),
+        }
+
+
+class LoadGenerator:
+    """Executa o mix de operações contra a API e acompanha os pedidos criados."""
+
+    def __init__(
+        self,
+        client,
+        mix: Dict[str, int],
+        hot_products: List[dict],
+        user_ids: List[str],
+        logins: List[Tuple[str, str]],
+        seed: int = 7,
+    ):
+        self._client = client
+        self._operations = list(mix)
+        self._weights = [mix[name] for name in self._operations]
+        self._hot = hot_products
+        self._user_ids = user_ids
+        self._logins = logins
+        self._rng = random.Random(seed)
+        self.stats: Dict[str, EndpointStats] = {}
+        # Pedidos criados: id -> quantidades por produto
+        self.created: Dict[str, Dict[str, int]] = {}
+        self.cancelled: set = set()
+        self._open_orders: List[str] = []
+        # Checkouts/cancelamentos sem resposta: o desfecho no servidor é incerto
+        self.uncertain = 0
+
+    # --- Operações ---
+
+    async def _browse(self):
+        params = {"limit": 20}
+        sort = self._rng.choice(SORTS)
+        if sort:
+            params["sort"] = sort
+        return "GET /api/products/ (navegação)", await self._client.get(
+            "/api/products/", params=params
+        )
+
+    async def _filter(self):
+        low = self._rng.choice((0, 50, 100, 200))
+        params = {
+            "gender": self._rng.choice(GENDERS),
+            "min_price": low,
+            "max_price": low + self._rng.choice((100, 300, 600)),
+            "limit": 20,
+            "sort": self._rng.choice(("price", "-price", "-rating")),
+        }
+        if self._rng.random() < 0.5:
+            params["size"] = self._rng.choice(LETTER_SIZES)
+        return "GET /api/products/ (filtros)", await self._client.get(
+            "/api/products/", params=params
+        )
+
+    async def _search(self):
+        term = self._rng.choice(ADJECTIVES).lower()
+        return "GET /api/products/?search", await self._client.get(
+            "/api/products/", params={"search": term, "limit": 20}
+        )
+
+    async def _detail(self):
+        product = self._rng.choice(self._hot)
+        return "GET /api/products/{id}", await self._client.get(
+            f"/api/products/{product['id']}"
+        )
+
+    async def _login(self):
+        email, password = self._rng.choice(self._logins)
+        return "POST /api/users/login", await self._client.post(
+            "/api/users/login", json={"email": email, "password": password}
+        )
+
+    async def _checkout(self):
+        products = self._rng.sample(self._hot, min(len(self._hot), self._rng.randint(1, 2)))
+        items = [
+            {
+                "product_id": p["id"],
+                "product_name": p["name"],
+                "quantity": self._rng.randint(1, 3),
+                "size": p["sizes"][0],
+                "color": p["colors"][0],
+                "unit_price": p["price"],
+            }
+            for p in products
+        ]
+        body = {
+            "user_id": self._rng.choice(self._user_ids),
+            "items": items,
+            "shipping_address": "Rua das Flores, 123 - São Paulo, SP",
+        }
+        try:
+            response = await self._client.post("/api/orders/", json=body)
+        except Exception:
+            self.uncertain += 1
+            raise
+        if response.status_code == 200:
+            order_id = response.json()["order"]["id"]
+            quantities: Dict[str, int] = Counter()
+            for item in items:
+                quantities[item["product_id"]] += item["quantity"]
+            self.created[order_id] = dict(quantities)
+            self._open_orders.append(order_id)
+        elif response.status_code >= 500:
+            self.uncertain += 1
+        return "POST /api/orders/", response
+
+    async def _cancel(self):
+        if not self._open_orders:
+            # Nada a cancelar ainda: vira um checkout
+            return await self._checkout()
+        index = self._rng.randrange(len(self._open_orders))
+        order_id = self._open_orders.pop(index)
+        try:
+            response = await self._client.put(f"/api/orders/{order_id}/cancel")
+        except Exception:
+            self.uncertain += 1
+            raise
+        if response.status_code == 200:
+            self.cancelled.add(order_id)
+        elif response.status_code >= 500:
+            self.uncertain += 1
+        return "PUT /api/orders/{id}/cancel", response
+
+    # --- Execução ---
+
+    async def _one(self, scheduled_ns: Optional[int] = None) -> None:
+        operation = self._rng.choices(self._operations, self._weights)[0]
+        start = scheduled_ns if scheduled_ns is not None else time.perf_counter_ns()
+        name = operation
+        try:
+            name, response = await getattr(self, f"_{operation}")()
+            status, failure = response.status_code, ""
+        except Exception as e:
+            status, failure = None, type(e).__name__
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats.setdefault(name, EndpointStats(name))
+        stats.record(time.perf_counter_ns() - start, status, failure)
+
+    async def run_closed(self, concurrency: int, duration: float, requests: int) -> int:
+        """`concurrency` clientes em laço fechado; retorna o total de requisições."""
+        deadline = time.monotonic() + duration
+        issued = 0
+
+        async def client_loop():
+            nonlocal issued
+            while time.monotonic() < deadline and (not requests or issued < requests):
+                issued += 1
+                await self._one()
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        return issued
+
+    async def run_open(
+        self, rate: float, concurrency: int, duration: float, requests: int
+    ) -> int:
+        """Chegadas de Poisson a `rate` req/s; retorna o total de requisições."""
+        in_flight = asyncio.Semaphore(concurrency)
+        tasks = []
+        start = time.perf_counter_ns()
+        deadline = start + int(duration * 1e9)
+        next_arrival = start
+
+        async def arrival(scheduled_ns: int):
+            async with in_flight:
+                await self._one(scheduled_ns)
+
+        while next_arrival < deadline and (not requests or len(tasks) < requests):
+            delay = (next_arrival - time.perf_counter_ns()) / 1e9
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(arrival(next_arrival)))
+            next_arrival += int(self._rng.expovariate(rate) * 1e9)
+        await asyncio.gather(*tasks)
+        return len(tasks)
+
+    # --- Consistência ---
+
+    async def stock_of(self, product_ids: List[str]) -> Dict[str, int]:
+        stock = {}
+        for product_id in product_ids:
+            response = await self._client.get(f"/api/products/{product_id}")
+            response.raise_for_status()
+            stock[product_id] = response.json()["stock"]
+        return stock
+
+    async def check(self, initial_stock: Dict[str, int]) -> List[Tuple[str, bool, str]]:
+        """Verificações de estoque e pedidos: (nome, passou, detalhe)."""
+        checks = []
+        final = await self.stock_of(list(initial_stock))
+
+        negative = [i for i, s in final.items() if s < 0]
+        checks.append(("estoque nunca negativo", not negative, ", ".join(negative)))
+
+        sold: Counter = Counter()
+        for order_id, quantities in self.created.items():
+            if order_id not in self.cancelled:
+                sold.update(quantities)
+        mismatched = [
+            f"{i}: esperado {initial_stock[i] - sold[i]}, encontrado {final[i]}"
+            for i in initial_stock
+            if initial_stock[i] - sold[i] != final[i]
+        ]
+        detail = "; ".join(mismatched[:5])
+        if mismatched and self.uncertain:
+            detail += f" ({self.uncertain} checkouts/cancelamentos sem resposta)"
+        checks.append(("estoque final = inicial - vendido", not mismatched, detail))
+
+        wrong_status = []
+        for order_id in self.created:
+            response = await self._client.get(f"/api/orders/{order_id}")
+            expected = "cancelado" if order_id in self.cancelled else "pendente"
+            if response.status_code != 200:
+                wrong_status.append(f"{order_id}: HTTP {response.status_code}")
+            elif response.json()["status"] != expected:
+                wrong_status.append(f"{order_id}: {response.json()['status']} != {expected}")
+        checks.append((
+            f"{len(self.created)} pedidos criados com o status esperado",
+            not wrong_status, "; ".join(wrong_status[:5]),
+        ))
+        self.final_stock = final
+        return checks
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if not hasattr(LoadGenerator, f"_{name}") or not weight.strip().isdigit():
+            raise argparse.ArgumentTypeError(f"item de mix inválido: '{part}'")
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("o mix precisa de ao menos um peso positivo")
+    return mix
+
+
+async def _login_all(client, logins: List[Tuple[str, str]]) -> List[str]:
+    """Faz login com cada credencial (migrando hashes antigos) e retorna os ids."""
+    user_ids = []
+    for email, password in logins:
+        response = await client.post(
+            "/api/users/login", json={"email": email, "password": password}
+        )
+        response.raise_for_status()
+        user_ids.append(response.json()["user"]["id"])
+    return user_ids
+
+
+async def _drive(client, args: argparse.Namespace, logins: List[Tuple[str, str]]) -> Dict[str, Any]:
+    catalog = await client.get("/api/products/", params={"limit": args.hot_products})
+    catalog.raise_for_status()
+    hot = catalog.json()["products"]
+    user_ids = await _login_all(client, logins)
+
+    generator = LoadGenerator(client, args.mix, hot, user_ids, logins, args.seed)
+    initial_stock = await generator.stock_of([p["id"] for p in hot])
+
+    start = time.perf_counter()
+    if args.rate > 0:
+        issued = await generator.run_open(args.rate, args.concurrency, args.duration, args.requests)
+    else:
+        issued = await generator.run_closed(args.concurrency, args.duration, args.requests)
+    elapsed = time.perf_counter() - start
+
+    checks = await generator.check(initial_stock)
+    return {
+        "generator": generator,
+        "issued": issued,
+        "elapsed": elapsed,
+        "checks": checks,
+        "initial_stock": initial_stock,
+    }
+
+
+async def _run_local(args: argparse.Namespace) -> Dict[str, Any]:
+    """Sobe main.app no próprio processo sobre um data.json sintético."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=args.products, users=args.users)
+        _set_stock(path, args.hot_products, args.stock)
+        os.environ.update({
+            "DATABASE_PATH": path,
+            "STORAGE_BACKEND": "json",
+            "WATCH_INTERVAL_MS": "0",
+            "WORKERS": "1",
+        })
+        from main import app
+
+        logins = args.login or [f"usuario{i}@email.com:admin" for i in range(min(args.users, 20))]
+        logins = [tuple(item.split(":", 1)) for item in logins]
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadgen") as client:
+                result = await _drive(client, args, logins)
+        # Após o encerramento (flush), o disco precisa conferir com a API
+        result["checks"].append(_check_disk(path, result))
+        return result
+
+
+def _set_stock(path: str, count: int, stock: int) -> None:
+    from infrastructure.adapters import JsonDocumentStore, JsonProductRepository
+
+    store = JsonDocumentStore(path)
+    products = JsonProductRepository(store)
+    with store.batch():
+        for product in products.get_all()[:count]:
+            product.stock = stock
+            products.update(product)
+    store.close()
+
+
+def _check_disk(path: str, result: Dict[str, Any]) -> Tuple[str, bool, str]:
+    from infrastructure.adapters import (
+        JsonDocumentStore,
+        JsonOrderRepository,
+        JsonProductRepository,
+    )
+
+    store = JsonDocumentStore(path)
+    products = JsonProductRepository(store)
+    orders = JsonOrderRepository(store)
+    generator = result["generator"]
+    problems = [
+        f"{i}: disco {products.get_by_id(i).stock}, API {s}"
+        for i, s in generator.final_stock.items()
+        if products.get_by_id(i).stock != s
+    ]
+    problems += [
+        f"pedido {i} ausente no disco"
+        for i in generator.created
+        if orders.get_by_id(i) is None
+    ]
+    store.close()
+    return ("data.json relido confere com a API", not problems, "; ".join(problems[:5]))
+
+
+async def _run_remote(args: argparse.Namespace) -> Dict[str, Any]:
+    logins = [tuple(item.split(":", 1)) for item in (args.login or DEFAULT_LOGINS)]
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+        return await _drive(client, args, logins)
+
+
+def _report(args: argparse.Namespace, result: Dict[str, Any]) -> Dict[str, Any]:
+    generator = result["generator"]
+    endpoints = [s.summary() for s in sorted(generator.stats.values(), key=lambda s: s.name)]
+    total = sum(e["iterations"] for e in endpoints)
+    errors = sum(e["errors"] for e in endpoints)
+    rejected = sum(e["rejected"] for e in endpoints)
+
+    mode = args.url or "local (ASGI)"
+    arrival = f"{args.rate:g} req/s (laço aberto)" if args.rate > 0 else "laço fechado"
+    print(f"\nalvo: {mode}  chegadas: {arrival}  concorrência: {args.concurrency}")
+    print(f"{total} requisições em {result['elapsed']:.1f} s "
+          f"({total / result['elapsed']:.0f} req/s), "
+          f"{errors} erros ({errors / max(total, 1):.2%}), {rejected} recusadas (4xx)\n")
+    print(f"{'operação':<34} {'req':>7} {'ok':>7} {'4xx':>6} {'erro':>6} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for e in endpoints:
+        print(f"{e['name']:<34} {e['iterations']:>7} {e['ok']:>7} {e['rejected']:>6} "
+              f"{e['errors']:>6} {e['p50_us'] / 1000:>8.1f} {e['p95_us'] / 1000:>8.1f} "
+              f"{e['p99_us'] / 1000:>8.1f}")
+
+    for e in endpoints:
+        print(f"\n{e['name']}")
+        peak = max(count for _, count in e["histogram"]) or 1
+        for label, count in e["histogram"]:
+            if count:
+                print(f"  {label:>11} {count:>7} {'#' * max(1, round(40 * count / peak))}")
+
+    print("\nconsistência:")
+    for name, passed, detail in result["checks"]:
+        print(f"  [{'ok' if passed else 'FALHOU'}] {name}" + (f" - {detail}" if detail else ""))
+
+    return {
+        "params": {
+            "target": mode, "rate": args.rate, "concurrency": args.concurrency,
+            "duration": args.duration, "requests": args.requests, "mix": args.mix,
+        },
+        "requests": total,
+        "elapsed_s": round(result["elapsed"], 3),
+        "errors": errors,
+        "rejected": rejected,
+        "endpoints": endpoints,
+        "checks": [{"name": n, "passed": p, "detail": d} for n, p, d in result["checks"]],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=float, default=30.0, help="segundos de carga")
+    parser.add_argument("--requests", type=int, default=0,
+                        help="limite de requisições (0 = só a duração)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="chegadas por segundo (0 = laço fechado)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--products", type=int, default=10_000, help="modo local")
+    parser.add_argument("--users", type=int, default=1000, help="modo local")
+    parser.add_argument("--hot-products", type=int, default=20,
+                        help="produtos disputados nos checkouts")
+    parser.add_argument("--stock", type=int, default=200,
+                        help="estoque inicial dos produtos disputados (modo local)")
+    parser.add_argument("--url", help="API em execução (em vez do modo local)")
+    parser.add_argument("--login", action="append", help="credencial email:senha (repetível)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="grava o relatório em JSON")
+    args = parser.parse_args()
+
+    if httpx is None:
+        sys.exit("O gerador de carga exige httpx (pip install httpx).")
+    result = asyncio.run(_run_remote(args) if args.url else _run_local(args))
+    report = _report(args, result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if not all(passed for _, passed, _ in result["checks"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
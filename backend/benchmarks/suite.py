@@ -0,0 +1,108 @@
+"""
+Suíte de benchmarks: repositórios, serviços e rotas HTTP.
+
+Executa as partes escolhidas para cada tamanho de dataset sintético
+(produtos, usuários e pedidos em igual quantidade) e grava um relatório
+JSON com p50/p95/p99 (µs) e operações por segundo de cada caso. Dois
+relatórios podem ser comparados com o subcomando compare.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.suite run [--sizes 1000,10000] [--parts repositories,services,routes]
+        [--iterations 1000] [--write-iterations 20] [--hash-iterations 5]
+        [--durability sync] [--output resultado.json]
+    python -m benchmarks.suite compare antes.json depois.json [--threshold 1.2]
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List
+from benchmarks import suite_repositories, suite_routes, suite_services
+from benchmarks.harness import compare, dump_report, load_report, make_report
+
+PARTS = ("repositories", "services", "routes")
+
+
+def run(args: argparse.Namespace) -> None:
+    parts = args.parts.split(",")
+    unknown = set(parts) - set(PARTS)
+    if unknown:
+        sys.exit(f"Partes inválidas: {', '.join(sorted(unknown))}. Use: {', '.join(PARTS)}.")
+
+    results: List[Dict[str, Any]] = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        if "repositories" in parts:
+            print(f"repositórios, tamanho {size}...", file=sys.stderr)
+            results += suite_repositories.run(
+                size, args.iterations, args.write_iterations, args.durability
+            )
+        if "services" in parts:
+            print(f"serviços, tamanho {size}...", file=sys.stderr)
+            results += suite_services.run(
+                size, args.iterations, args.write_iterations, args.hash_iterations,
+                args.durability,
+            )
+        if "routes" in parts:
+            print(f"rotas, tamanho {size}...", file=sys.stderr)
+            results += suite_routes.run(
+                size, args.iterations, args.write_iterations, args.hash_iterations,
+                args.durability,
+            )
+
+    params = {
+        name: getattr(args, name)
+        for name in ("sizes", "parts", "iterations", "write_iterations",
+                     "hash_iterations", "durability")
+    }
+    dump_report(make_report(results, params), args.output)
+
+
+def compare_reports(args: argparse.Namespace) -> None:
+    rows = compare(load_report(args.before), load_report(args.after))
+    print(f"{'grupo':<13} {'caso':<48} {'tamanho':>9} {'p50':>7} {'p99':>7}")
+    regressions = 0
+    for row in rows:
+        slower = (row["p50_ratio"] or 0) > args.threshold
+        regressions += slower
+        print(
+            f"{row['group']:<13} {row['name']:<48} {row['size'] or '':>9} "
+            f"{_ratio(row['p50_ratio']):>7} {_ratio(row['p99_ratio']):>7}"
+            + ("  <- mais lento" if slower else "")
+        )
+    print(f"\n{len(rows)} casos comparados, {regressions} acima de {args.threshold}x no p50")
+
+
+def _ratio(value) -> str:
+    return "-" if value is None else f"{value:.2f}x"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="executa a suíte e grava o relatório JSON")
+    run_parser.add_argument("--sizes", default="1000,10000")
+    run_parser.add_argument("--parts", default=",".join(PARTS))
+    run_parser.add_argument("--iterations", type=int, default=1000,
+                            help="medições de cada leitura")
+    run_parser.add_argument("--write-iterations", type=int, default=20,
+                            help="medições de cada escrita")
+    run_parser.add_argument("--hash-iterations", type=int, default=5,
+                            help="medições de register e login (KDF)")
+    run_parser.add_argument("--durability", default="sync",
+                            choices=("sync", "interval", "off"))
+    run_parser.add_argument("--output", help="arquivo do relatório (padrão: saída padrão)")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="compara dois relatórios")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument("--threshold", type=float, default=1.2,
+                                help="razão do p50 a partir da qual o caso é destacado")
+    compare_parser.set_defaults(handler=compare_reports)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
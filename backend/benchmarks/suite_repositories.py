@@ -0,0 +1,159 @@
+"""
+Suíte de micro-benchmarks dos repositórios JSON.
+
+Mede cada método de JsonProductRepository, JsonUserRepository e
+JsonOrderRepository sobre um data.json sintético com `size` produtos,
+usuários e pedidos. As leituras usam chaves sorteadas (semente fixa);
+as escritas rodam com a durabilidade informada, então em "sync" cada
+escrita inclui a gravação do documento (o custo de _save_data).
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.suite run --parts repositories [--sizes 1000,10000]
+"""
+
+import random
+import tempfile
+from typing import Any, Dict, List
+from domain.entities.order import Order, OrderItem
+from domain.entities.product import Product
+from domain.entities.user import User
+from infrastructure.adapters import (
+    JsonDocumentStore,
+    JsonOrderRepository,
+    JsonProductRepository,
+    JsonUserRepository,
+)
+from benchmarks.dataset import make_products, write_dataset
+from benchmarks.harness import measure
+
+WARMUP = 3
+# Produtos incluídos por chamada de upsert_many
+BATCH = 10
+
+
+def run(
+    size: int, iterations: int, write_iterations: int, durability: str = "sync"
+) -> List[Dict[str, Any]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=size, users=size, orders=size)
+        store = JsonDocumentStore(path, durability=durability)
+        try:
+            products = JsonProductRepository(store)
+            users = JsonUserRepository(store)
+            orders = JsonOrderRepository(store)
+            labels = {"group": "repositories", "size": size, "durability": durability}
+            return (
+                _product_cases(products, iterations, write_iterations, labels)
+                + _user_cases(users, size, iterations, write_iterations, labels)
+                + _order_cases(orders, size, iterations, write_iterations, labels)
+            )
+        finally:
+            store.close()
+
+
+def _sample(population: List[str], count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [rng.choice(population) for _ in range(count)]
+
+
+def _product_cases(
+    repo: JsonProductRepository, reads: int, writes: int, labels: dict
+) -> List[Dict[str, Any]]:
+    all_products = repo.get_all()
+    ids = _sample([p.id for p in all_products], WARMUP + reads)
+    categories = _sample(repo.get_categories(), WARMUP + reads)
+    calls = WARMUP + writes
+    to_update = [repo.get_by_id(i) for i in ids[:calls]]
+    # Produtos com estoque para todas as reservas (uma unidade por chamada)
+    stocked = [p.id for p in all_products if p.stock >= calls]
+    reservations = [{stocked[i % len(stocked)]: 1} for i in range(calls)]
+    fresh = [
+        [Product.from_dict({**raw, "id": f"bench-{i}-{k}"}) for k, raw in enumerate(batch)]
+        for i, batch in enumerate(_chunks(make_products(calls * BATCH, seed=11), BATCH))
+    ]
+
+    def measure_read(name, func):
+        return measure(f"product.{name}", func, reads, WARMUP, **labels)
+
+    def measure_write(name, func):
+        return measure(f"product.{name}", func, writes, WARMUP, **labels)
+
+    return [
+        measure_read("get_all", lambda i: repo.get_all()),
+        measure_read("get_by_id", lambda i: repo.get_by_id(ids[i])),
+        measure_read("get_by_category", lambda i: repo.get_by_category(categories[i])),
+        measure_read("search", lambda i: repo.search("básica")),
+        measure_read("get_categories", lambda i: repo.get_categories()),
+        measure_read("filter_products", lambda i: repo.filter_products(
+            gender="feminino", min_price=100, max_price=300,
+        )),
+        measure_read("filter_products_page", lambda i: repo.filter_products_page(
+            category=categories[i], sort="-rating", limit=20,
+        )),
+        measure_write("update", lambda i: repo.update(to_update[i])),
+        measure_write("upsert_many", lambda i: repo.upsert_many(fresh[i])),
+        measure_write("reserve_stock", lambda i: repo.reserve_stock(reservations[i])),
+        measure_write("release_stock", lambda i: repo.release_stock(reservations[i])),
+    ]
+
+
+def _user_cases(
+    repo: JsonUserRepository, size: int, reads: int, writes: int, labels: dict
+) -> List[Dict[str, Any]]:
+    ids = _sample([f"user-{i:07d}" for i in range(size)], WARMUP + reads)
+    emails = [f"usuario{int(i[5:])}@email.com" for i in ids]
+    to_update = [repo.get_by_id(i) for i in ids[:WARMUP + writes]]
+    new_users = [
+        User(
+            id=f"bench-user-{i}",
+            name=f"Benchmark {i}",
+            email=f"benchmark{i}@email.com",
+            password_hash=to_update[0].password_hash,
+        )
+        for i in range(WARMUP + writes)
+    ]
+
+    def measure_case(name, func, iterations):
+        return measure(f"user.{name}", func, iterations, WARMUP, **labels)
+
+    return [
+        measure_case("get_by_id", lambda i: repo.get_by_id(ids[i]), reads),
+        measure_case("get_by_email", lambda i: repo.get_by_email(emails[i]), reads),
+        measure_case("create", lambda i: repo.create(new_users[i]), writes),
+        measure_case("update", lambda i: repo.update(to_update[i]), writes),
+    ]
+
+
+def _order_cases(
+    repo: JsonOrderRepository, size: int, reads: int, writes: int, labels: dict
+) -> List[Dict[str, Any]]:
+    order_ids = _sample([f"order-{i:08d}" for i in range(size)], WARMUP + reads)
+    user_ids = _sample([f"user-{i:07d}" for i in range(size)], WARMUP + reads, seed=8)
+    template = repo.get_by_id(order_ids[0])
+    new_orders = [
+        Order(
+            id=f"bench-order-{i}",
+            user_id=user_ids[i % len(user_ids)],
+            items=[OrderItem.from_dict(item.to_dict()) for item in template.items],
+            shipping_address=template.shipping_address,
+        )
+        for i in range(WARMUP + writes)
+    ]
+    to_update = [repo.get_by_id(i) for i in order_ids[:WARMUP + writes]]
+
+    def measure_case(name, func, iterations):
+        return measure(f"order.{name}", func, iterations, WARMUP, **labels)
+
+    return [
+        measure_case("get_by_id", lambda i: repo.get_by_id(order_ids[i]), reads),
+        measure_case("get_by_user_id", lambda i: repo.get_by_user_id(user_ids[i]), reads),
+        measure_case("get_page_by_user_id", lambda i: repo.get_page_by_user_id(
+            user_ids[i], sort="-created_at", limit=20,
+        ), reads),
+        measure_case("create", lambda i: repo.create(new_orders[i]), writes),
+        measure_case("update", lambda i: repo.update(to_update[i]), writes),
+    ]
+
+
+def _chunks(items: list, size: int) -> List[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
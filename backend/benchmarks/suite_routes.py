@@ -0,0 +1,164 @@
+"""
+Suíte de benchmarks ponta a ponta das rotas HTTP.
+
+Cada requisição passa pela aplicação FastAPI inteira (main.app) através
+do TestClient: validação, serviços, repositórios e serialização. Como o
+Composition Root lê a configuração (DATABASE_PATH, DURABILITY...) ao ser
+importado, cada tamanho de catálogo roda em um processo filho, que
+devolve os resultados em JSON pela saída padrão.
+
+Exige FastAPI e httpx; sem eles a suíte é ignorada com um aviso.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.suite run --parts routes [--sizes 1000,10000]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List
+from benchmarks.dataset import write_dataset
+from benchmarks.harness import measure
+
+try:
+    from fastapi.testclient import TestClient
+except (ImportError, RuntimeError):  # pragma: no cover - FastAPI/httpx ausentes
+    TestClient = None
+
+WARMUP = 3
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(
+    size: int,
+    iterations: int,
+    write_iterations: int,
+    hash_iterations: int,
+    durability: str = "sync",
+) -> List[Dict[str, Any]]:
+    if TestClient is None:
+        print("suite_routes: FastAPI/httpx não instalados, rotas ignoradas", file=sys.stderr)
+        return []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_PATH": write_dataset(tmp, products=size, users=size, orders=size),
+            "DURABILITY": durability,
+            "WATCH_INTERVAL_MS": "0",
+            "WORKERS": "1",
+        }
+        args = [str(size), str(iterations), str(write_iterations), str(hash_iterations)]
+        child = subprocess.run(
+            [sys.executable, "-m", "benchmarks.suite_routes", *args],
+            cwd=_BACKEND_DIR, env=env, capture_output=True, text=True,
+        )
+    if child.returncode != 0:
+        raise RuntimeError(f"suite_routes falhou (tamanho {size}):\n{child.stderr}")
+    return json.loads(child.stdout)
+
+
+def _expect(response, status: int = 200):
+    if response.status_code != status:
+        raise AssertionError(
+            f"{response.request.method} {response.request.url}: "
+            f"{response.status_code} {response.text[:200]}"
+        )
+    return response
+
+
+def _cases(
+    client, size: int, reads: int, writes: int, hashes: int, durability: str
+) -> List[Dict[str, Any]]:
+    rng = random.Random(7)
+    calls = WARMUP + max(reads, writes, hashes)
+    product_ids = [f"prod-{rng.randrange(size):07d}" for _ in range(calls)]
+    user_ids = [f"user-{rng.randrange(size):07d}" for _ in range(calls)]
+    order_ids = [f"order-{rng.randrange(size):08d}" for _ in range(calls)]
+
+    login = {"email": "usuario0@email.com", "password": "admin"}
+    token = _expect(client.post("/api/users/login", json=login)).json()["token"]
+    auth = {"Authorization": f"Bearer {token}"}
+
+    # Pedidos de uma unidade dos produtos com mais estoque
+    catalog = _expect(client.get("/api/products/", params={"limit": 200})).json()["products"]
+    stocked = sorted(catalog, key=lambda p: -p["stock"])[:10]
+    new_orders = []
+    for i in range(WARMUP + writes):
+        product = stocked[i % len(stocked)]
+        new_orders.append({
+            "user_id": user_ids[i],
+            "shipping_address": "Rua das Flores, 123",
+            "items": [{
+                "product_id": product["id"],
+                "product_name": product["name"],
+                "quantity": 1,
+                "size": product["sizes"][0],
+                "color": product["colors"][0],
+                "unit_price": product["price"],
+            }],
+        })
+    created: List[str] = []
+
+    def create_order(i: int) -> None:
+        response = _expect(client.post("/api/orders/", json=new_orders[i]))
+        created.append(response.json()["order"]["id"])
+
+    labels = {"group": "routes", "size": size, "durability": durability}
+
+    def get(name: str, path, params=None, headers=None):
+        return measure(
+            f"GET {name}",
+            lambda i: _expect(client.get(
+                path(i) if callable(path) else path, params=params, headers=headers
+            )),
+            reads, WARMUP, **labels,
+        )
+
+    return [
+        get("/", "/"),
+        get("/api/products/?limit=20", "/api/products/", {"limit": 20}),
+        get("/api/products/ (filtros + sort)", "/api/products/", {
+            "gender": "feminino", "min_price": 100, "max_price": 300,
+            "sort": "-rating", "limit": 20,
+        }),
+        get("/api/products/?search", "/api/products/", {"search": "básica", "limit": 20}),
+        get("/api/products/categories", "/api/products/categories"),
+        get("/api/products/{id}", lambda i: f"/api/products/{product_ids[i]}"),
+        measure("POST /api/users/login",
+                lambda i: _expect(client.post("/api/users/login", json=login)),
+                hashes, WARMUP, **labels),
+        get("/api/users/me", "/api/users/me", headers=auth),
+        get("/api/users/{id}", lambda i: f"/api/users/{user_ids[i]}"),
+        get("/api/orders/user/{id}?limit=20", lambda i: f"/api/orders/user/{user_ids[i]}",
+            {"sort": "-created_at", "limit": 20}),
+        get("/api/orders/{id}", lambda i: f"/api/orders/{order_ids[i]}"),
+        measure("POST /api/orders/", create_order, writes, WARMUP, **labels),
+        measure("PUT /api/orders/{id}/cancel",
+                lambda i: _expect(client.put(f"/api/orders/{created[i]}/cancel")),
+                writes, WARMUP, **labels),
+    ]
+
+
+def main() -> None:
+    """Processo filho: mede as rotas sobre o DATABASE_PATH do ambiente."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    for name in ("size", "iterations", "write_iterations", "hash_iterations"):
+        parser.add_argument(name, type=int)
+    args = parser.parse_args()
+
+    from main import app
+
+    with TestClient(app) as client:
+        results = _cases(
+            client, args.size, args.iterations, args.write_iterations,
+            args.hash_iterations, os.environ.get("DURABILITY", "sync"),
+        )
+    json.dump(results, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
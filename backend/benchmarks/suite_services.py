@@ -0,0 +1,165 @@
+"""
+Suíte de benchmarks dos casos de uso (services).
+
+Monta os serviços como o Composition Root faz para o backend JSON
+(pontes assíncronas com leituras no event loop, unidade de trabalho,
+hash em pool, tokens HMAC) e mede cada caso de uso dentro de um event
+loop. Os casos que calculam a KDF (register e login) usam
+`hash_iterations` medições, já que cada chamada custa centenas de ms.
+
+Uso (a partir do diretório backend):
+    python -m benchmarks.suite run --parts services [--sizes 1000,10000]
+"""
+
+import asyncio
+import random
+import secrets
+import tempfile
+from typing import Any, Dict, List
+from domain.entities.cart import Cart, CartItem
+from application.services import OrderService, ProductService, UserService
+from infrastructure.adapters import (
+    AsyncOrderRepositoryBridge,
+    AsyncProductRepositoryBridge,
+    AsyncUnitOfWorkBridge,
+    AsyncUserRepositoryBridge,
+    HmacSessionTokens,
+    JsonDocumentStore,
+    JsonOrderRepository,
+    JsonProductRepository,
+    JsonUnitOfWork,
+    JsonUserRepository,
+    PooledPasswordHasher,
+    make_kdf,
+)
+from benchmarks.dataset import write_dataset
+from benchmarks.harness import measure_async
+
+WARMUP = 3
+
+
+def run(
+    size: int,
+    iterations: int,
+    write_iterations: int,
+    hash_iterations: int,
+    durability: str = "sync",
+    kdf: str = "pbkdf2",
+) -> List[Dict[str, Any]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(tmp, products=size, users=size, orders=size)
+        store = JsonDocumentStore(path, durability=durability)
+        hasher = PooledPasswordHasher(make_kdf(kdf))
+        try:
+            unit_of_work = AsyncUnitOfWorkBridge(JsonUnitOfWork(store))
+            products = AsyncProductRepositoryBridge(JsonProductRepository(store), True)
+            users = AsyncUserRepositoryBridge(JsonUserRepository(store), True)
+            orders = AsyncOrderRepositoryBridge(JsonOrderRepository(store), True)
+            services = (
+                ProductService(products, unit_of_work),
+                UserService(users, hasher, HmacSessionTokens(secrets.token_bytes(32))),
+                OrderService(orders, products, unit_of_work),
+            )
+            labels = {"group": "services", "size": size, "durability": durability}
+            counts = (iterations, write_iterations, hash_iterations)
+            return asyncio.run(_cases(size, *services, *counts, labels))
+        finally:
+            hasher.close()
+            store.close()
+
+
+async def _cases(
+    size: int,
+    products: ProductService,
+    users: UserService,
+    orders: OrderService,
+    reads: int,
+    writes: int,
+    hashes: int,
+    labels: dict,
+) -> List[Dict[str, Any]]:
+    rng = random.Random(7)
+    calls = WARMUP + max(reads, writes, hashes)
+    product_ids = [f"prod-{rng.randrange(size):07d}" for _ in range(calls)]
+    user_ids = [f"user-{rng.randrange(size):07d}" for _ in range(calls)]
+    order_ids = [f"order-{rng.randrange(size):08d}" for _ in range(calls)]
+    categories = await products.get_categories()
+
+    # Um usuário fixo para o login: o aquecimento migra o hash legado
+    # (SHA-256) para a KDF, e as medições verificam só a KDF
+    login_email = "usuario0@email.com"
+    token = users.issue_session(await users.get_user_by_id("user-0000000"))
+
+    # Carrinhos de uma unidade dos produtos com mais estoque
+    stocked = sorted(await products.list_all_products(), key=lambda p: -p.stock)[:10]
+    carts = []
+    for i in range(WARMUP + writes):
+        product = stocked[i % len(stocked)]
+        carts.append(Cart(user_id=user_ids[i], items=[CartItem(
+            product_id=product.id,
+            product_name=product.name,
+            quantity=1,
+            size=product.sizes[0],
+            color=product.colors[0],
+            unit_price=product.price,
+        )]))
+    created: List[str] = []
+
+    async def create_order(i: int) -> None:
+        order = await orders.create_order_from_cart(carts[i], "Rua das Flores, 123")
+        created.append(order.id)
+
+    async def measure_case(name, func, iterations):
+        return await measure_async(name, func, iterations, WARMUP, **labels)
+
+    return [
+        await measure_case("product.list_all_products",
+                           lambda i: products.list_all_products(), reads),
+        await measure_case("product.get_product_by_id",
+                           lambda i: products.get_product_by_id(product_ids[i]), reads),
+        await measure_case("product.list_by_category",
+                           lambda i: products.list_by_category(categories[i % len(categories)]),
+                           reads),
+        await measure_case("product.search_products",
+                           lambda i: products.search_products("básica"), reads),
+        await measure_case("product.get_categories",
+                           lambda i: products.get_categories(), reads),
+        await measure_case("product.filter_products",
+                           lambda i: products.filter_products(
+                               gender="feminino", min_price=100, max_price=300
+                           ), reads),
+        await measure_case("product.filter_products_page",
+                           lambda i: products.filter_products_page(
+                               category=categories[i % len(categories)],
+                               sort="-rating", limit=20,
+                           ), reads),
+        await measure_case("user.get_user_by_id",
+                           lambda i: users.get_user_by_id(user_ids[i]), reads),
+        await measure_case("user.update_profile",
+                           lambda i: users.update_profile(user_ids[i], phone=f"11 9{i:08d}"),
+                           writes),
+        await measure_case("user.register",
+                           lambda i: users.register(
+                               f"Benchmark {i}", f"benchmark{i}@email.com", "benchmark"
+                           ), hashes),
+        await measure_case("user.login",
+                           lambda i: users.login(login_email, "admin"), hashes),
+        await measure_case("user.authenticate",
+                           lambda i: _awaitable(users.authenticate, token), reads),
+        await measure_case("order.create_order_from_cart", create_order, writes),
+        await measure_case("order.get_order",
+                           lambda i: orders.get_order(order_ids[i]), reads),
+        await measure_case("order.get_user_orders",
+                           lambda i: orders.get_user_orders(user_ids[i]), reads),
+        await measure_case("order.get_user_orders_page",
+                           lambda i: orders.get_user_orders_page(
+                               user_ids[i], sort="-created_at", limit=20
+                           ), reads),
+        await measure_case("order.cancel_order",
+                           lambda i: orders.cancel_order(created[i]), writes),
+    ]
+
+
+async def _awaitable(func, *args):
+    """Mede uma chamada síncrona do serviço com o mesmo harness assíncrono."""
+    return func(*args)
@@ -6,9 +6,10 @@ Princípio SRP: Responsável apenas pela lógica do carrinho.
 
 from dataclasses import dataclass, field
 from typing import List, Optional
+from .interning import intern_str
 
 
-@dataclass
+@dataclass(slots=True)
 class CartItem:
     product_id: str
     product_name: str
@@ -40,14 +41,14 @@ class CartItem:
             product_id=data["product_id"],
             product_name=data["product_name"],
             quantity=data["quantity"],
-            size=data["size"],
-            color=data["color"],
+            size=intern_str(data["size"]),
+            color=intern_str(data["color"]),
             unit_price=data["unit_price"],
             image_url=data.get("image_url", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Cart:
     user_id: str
     items: List[CartItem] = field(default_factory=list)
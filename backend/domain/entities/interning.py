@@ -0,0 +1,33 @@
+"""
+Compartilhamento de valores repetidos entre entidades.
+
+Categoria, marca, gênero, tamanhos e cores se repetem em milhares de
+produtos (e de itens de pedido), mas cada json.loads cria uma cópia nova
+de cada string. Os from_dict das entidades passam esses campos por aqui:
+valores iguais passam a ser o mesmo objeto, guardado uma única vez.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Tuple
+
+# Limite de combinações distintas guardadas (tamanhos e cores têm poucas;
+# o limite só protege contra dados atípicos)
+MAX_SHARED_TUPLES = 4096
+
+_tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def intern_str(value: Any) -> Any:
+    """Versão compartilhada de uma string (outros tipos passam intactos)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_tuple(values: Iterable[Any]) -> Tuple[Any, ...]:
+    """Tupla imutável e compartilhada com os valores (também compartilhados)."""
+    key = tuple(intern_str(v) for v in values)
+    shared = _tuples.get(key)
+    if shared is not None:
+        return shared
+    if len(_tuples) >= MAX_SHARED_TUPLES:
+        return key
+    return _tuples.setdefault(key, key)
@@ -2,12 +2,16 @@
 Entidade Order - representa um pedido no sistema.
 
 Princípio SRP: Responsável apenas por representar dados e regras de um pedido.
+
+Sem __dict__ por instância (slots). Nos itens, as strings que se repetem
+entre pedidos (produto, tamanho, cor) são compartilhadas (ver interning).
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import List
 from datetime import datetime
+from .interning import intern_str
 
 
 class OrderStatus(str, Enum):
@@ -18,7 +22,7 @@ class OrderStatus(str, Enum):
     CANCELLED = "cancelado"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     product_id: str
     product_name: str
@@ -45,16 +49,16 @@ class OrderItem:
     @staticmethod
     def from_dict(data: dict) -> "OrderItem":
         return OrderItem(
-            product_id=data["product_id"],
-            product_name=data["product_name"],
+            product_id=intern_str(data["product_id"]),
+            product_name=intern_str(data["product_name"]),
             quantity=data["quantity"],
-            size=data["size"],
-            color=data["color"],
+            size=intern_str(data["size"]),
+            color=intern_str(data["color"]),
             unit_price=data["unit_price"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     id: str
     user_id: str
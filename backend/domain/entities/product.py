@@ -3,21 +3,26 @@ Entidade Product - representa um produto no catálogo de roupas.
 
 Princípio SRP (Single Responsibility): Esta classe é responsável apenas
 por representar os dados e regras de negócio de um produto.
+
+Sem __dict__ por instância (slots) e com tamanhos e cores em tuplas
+imutáveis; os campos de baixa cardinalidade são compartilhados entre os
+produtos (ver interning).
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Tuple
+from .interning import intern_str, intern_tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     id: str
     name: str
     description: str
     price: float
     category: str
-    sizes: List[str]
-    colors: List[str]
+    sizes: Tuple[str, ...]
+    colors: Tuple[str, ...]
     image_url: str
     stock: int
     brand: str
@@ -31,7 +36,8 @@ class Product:
 
     def has_size(self, size: str) -> bool:
         """Verifica se o produto está disponível no tamanho especificado."""
-        return size.upper() in [s.upper() for s in self.sizes]
+        target = size.upper()
+        return any(s.upper() == target for s in self.sizes)
 
     def has_color(self, color: str) -> bool:
         """Verifica se o produto está disponível na cor especificada."""
@@ -60,8 +66,8 @@ class Product:
             "description": self.description,
             "price": self.price,
             "category": self.category,
-            "sizes": self.sizes,
-            "colors": self.colors,
+            "sizes": list(self.sizes),
+            "colors": list(self.colors),
             "image_url": self.image_url,
             "stock": self.stock,
             "brand": self.brand,
@@ -78,13 +84,13 @@ class Product:
             name=data["name"],
             description=data["description"],
             price=data["price"],
-            category=data["category"],
-            sizes=data.get("sizes", []),
-            colors=data.get("colors", []),
+            category=intern_str(data["category"]),
+            sizes=intern_tuple(data.get("sizes", ())),
+            colors=intern_tuple(data.get("colors", ())),
             image_url=data.get("image_url", ""),
             stock=data.get("stock", 0),
-            brand=data.get("brand", ""),
-            gender=data.get("gender", "unissex"),
+            brand=intern_str(data.get("brand", "")),
+            gender=intern_str(data.get("gender", "unissex")),
             rating=data.get("rating", 0.0),
             reviews_count=data.get("reviews_count", 0),
         )
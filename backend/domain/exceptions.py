@@ -57,7 +57,40 @@ class InvalidCredentialsException(DomainException):
         super().__init__("Email ou senha inválidos.")
 
 
+class InvalidTokenException(DomainException):
+    """Token de sessão inválido, expirado ou revogado."""
+    def __init__(self):
+        super().__init__("Sessão inválida ou expirada.")
+
+
+class HashingOverloadedException(DomainException):
+    """Fila de cálculo de hashes de senha cheia."""
+    def __init__(self):
+        super().__init__("Servidor ocupado. Tente novamente em instantes.")
+
+
+class InvalidImportRecordException(DomainException):
+    """Registro inválido em uma importação de catálogo."""
+    def __init__(self, record: int, reason: str):
+        super().__init__(f"Registro {record} inválido: {reason}")
+        self.record = record
+        self.reason = reason
+
+
 class EmptyCartException(DomainException):
     """Carrinho vazio."""
     def __init__(self):
         super().__init__("O carrinho está vazio.")
+
+
+class InvalidCursorException(DomainException):
+    """Cursor de paginação inválido ou de outra consulta."""
+    def __init__(self):
+        super().__init__("Cursor de paginação inválido.")
+
+
+class InvalidSortException(DomainException):
+    """Campo de ordenação não suportado."""
+    def __init__(self, sort: str):
+        super().__init__(f"Ordenação '{sort}' não suportada.")
+        self.sort = sort
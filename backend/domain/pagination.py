@@ -0,0 +1,125 @@
+"""
+Paginação por cursor.
+
+Uma página traz os itens, o total de resultados da consulta e um cursor
+opaco para buscar a página seguinte. O cursor registra a posição da
+última entrega (a chave de ordenação e o id do último item), de modo que
+a próxima página continua exatamente dali, sem recontar as anteriores.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+from .entities.order import Order
+from .entities.product import Product
+from .exceptions import InvalidCursorException, InvalidSortException
+
+T = TypeVar("T")
+
+# Campos aceitos em `sort` na listagem de produtos ("-campo" = decrescente)
+PRODUCT_SORT_FIELDS = ("price", "rating", "reviews_count", "name")
+
+# Campos aceitos em `sort` no histórico de pedidos (padrão: mais antigos primeiro)
+ORDER_SORT_FIELDS = ("created_at",)
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+def parse_sort(sort: Optional[str], allowed: Sequence[str]) -> Tuple[Optional[str], bool]:
+    """Converte "campo" / "-campo" em (campo, decrescente)."""
+    if not sort:
+        return None, False
+    descending = sort.startswith("-")
+    field = sort[1:] if descending else sort
+    if field not in allowed:
+        raise InvalidSortException(sort)
+    return field, descending
+
+
+def product_sort_key(product: Product, field: str) -> Any:
+    """Valor de ordenação de um produto (nomes sem diferenciar maiúsculas)."""
+    if field == "name":
+        return product.name.casefold()
+    return getattr(product, field)
+
+
+def order_sort_key(order: Order) -> Tuple[str, str]:
+    """Chave (created_at, id) do histórico de pedidos: total e estável."""
+    return order.created_at, order.id
+
+
+def encode_cursor(payload: dict) -> str:
+    """Codifica a posição da página em um token opaco (base64 url-safe)."""
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decodifica um token gerado por encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorException()
+    if not isinstance(payload, dict):
+        raise InvalidCursorException()
+    return payload
+
+
+def encode_keyset_cursor(sort: Optional[str], key: Any, last_id: str) -> str:
+    """Cursor keyset: a chave de ordenação e o id do último item entregue."""
+    return encode_cursor({"sort": sort or "", "after": [key, last_id]})
+
+
+def decode_keyset_cursor(cursor: str, sort: Optional[str]) -> Tuple[Any, str]:
+    """Valida um cursor keyset e retorna a posição (chave, id)."""
+    payload = decode_cursor(cursor)
+    after = payload.get("after")
+    if (
+        payload.get("sort") != (sort or "")
+        or not isinstance(after, list)
+        or len(after) != 2
+        or not isinstance(after[1], str)
+    ):
+        raise InvalidCursorException()
+    return after[0], after[1]
+
+
+def decode_order_cursor(cursor: str, sort: Optional[str]) -> Tuple[str, str]:
+    """Cursor keyset do histórico de pedidos: a posição (created_at, id)."""
+    created_at, order_id = decode_keyset_cursor(cursor, sort)
+    if not isinstance(created_at, str):
+        raise InvalidCursorException()
+    return created_at, order_id
+
+
+def paginate_by_offset(
+    items: List[T], sort: Optional[str], limit: Optional[int], cursor: Optional[str]
+) -> Page[T]:
+    """
+    Pagina uma lista já materializada e ordenada, usando o deslocamento
+    como cursor. Usado quando a ordem não tem uma chave estável (ex.:
+    relevância da busca) ou quando o adapter não mantém índices ordenados.
+    """
+    offset = 0
+    if cursor:
+        payload = decode_cursor(cursor)
+        offset = payload.get("offset")
+        if payload.get("sort") != (sort or "") or not isinstance(offset, int) or offset < 0:
+            raise InvalidCursorException()
+
+    if limit is None:
+        return Page(items=items[offset:], total=len(items))
+
+    end = offset + limit
+    next_cursor = (
+        encode_cursor({"sort": sort or "", "offset": end}) if end < len(items) else None
+    )
+    return Page(items=items[offset:end], total=len(items), next_cursor=next_cursor)
@@ -1,9 +1,23 @@
 from .product_repository_port import ProductRepositoryPort
 from .user_repository_port import UserRepositoryPort
 from .order_repository_port import OrderRepositoryPort
+from .unit_of_work_port import UnitOfWorkPort
+from .async_product_repository_port import AsyncProductRepositoryPort
+from .async_user_repository_port import AsyncUserRepositoryPort
+from .async_order_repository_port import AsyncOrderRepositoryPort
+from .async_unit_of_work_port import AsyncUnitOfWorkPort
+from .session_token_port import SessionTokenPort
+from .password_hasher_port import PasswordHasherPort
 
 __all__ = [
     "ProductRepositoryPort",
     "UserRepositoryPort",
     "OrderRepositoryPort",
+    "UnitOfWorkPort",
+    "AsyncProductRepositoryPort",
+    "AsyncUserRepositoryPort",
+    "AsyncOrderRepositoryPort",
+    "AsyncUnitOfWorkPort",
+    "SessionTokenPort",
+    "PasswordHasherPort",
 ]
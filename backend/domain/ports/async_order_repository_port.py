@@ -0,0 +1,48 @@
+"""
+Port (interface) assíncrono para o repositório de pedidos.
+
+Mesmas operações de OrderRepositoryPort, como corrotinas.
+
+Princípio DIP: O domínio define a interface.
+Princípio ISP: Interface específica para operações de pedido.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from ..entities.order import Order
+from ..pagination import Page
+
+
+class AsyncOrderRepositoryPort(ABC):
+    """Interface assíncrona das operações de persistência de pedidos."""
+
+    @abstractmethod
+    async def create(self, order: Order) -> Order:
+        """Cria um novo pedido."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, order_id: str) -> Optional[Order]:
+        """Retorna um pedido pelo ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_user_id(self, user_id: str) -> List[Order]:
+        """Retorna todos os pedidos de um usuário."""
+        pass
+
+    @abstractmethod
+    async def get_page_by_user_id(
+        self,
+        user_id: str,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Order]:
+        """Página do histórico de pedidos de um usuário (keyset)."""
+        pass
+
+    @abstractmethod
+    async def update(self, order: Order) -> None:
+        """Atualiza um pedido."""
+        pass
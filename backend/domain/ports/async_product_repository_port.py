@@ -0,0 +1,111 @@
+"""
+Port (interface) assíncrono para o repositório de produtos.
+
+Mesmas operações de ProductRepositoryPort, como corrotinas: o serviço
+aguarda o repositório sem ocupar uma thread enquanto há E/S pendente.
+
+Princípio DIP: O domínio define a interface; a infraestrutura decide se
+atende em memória, em uma thread auxiliar ou com um driver assíncrono.
+Princípio ISP: Interface específica para operações de produto.
+"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, List, Optional
+from ..entities.product import Product
+from ..pagination import Page
+
+
+class AsyncProductRepositoryPort(ABC):
+    """Interface assíncrona das operações de persistência de produtos."""
+
+    @abstractmethod
+    async def get_all(self) -> List[Product]:
+        """Retorna todos os produtos."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, product_id: str) -> Optional[Product]:
+        """Retorna um produto pelo ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_category(self, category: str) -> List[Product]:
+        """Retorna produtos filtrados por categoria."""
+        pass
+
+    @abstractmethod
+    async def search(self, query: str) -> List[Product]:
+        """Busca produtos por nome, descrição ou marca."""
+        pass
+
+    @abstractmethod
+    async def update(self, product: Product) -> None:
+        """Atualiza um produto."""
+        pass
+
+    @abstractmethod
+    async def upsert_many(self, products: List[Product]) -> int:
+        """Inclui ou atualiza vários produtos; retorna quantos foram incluídos."""
+        pass
+
+    @abstractmethod
+    def iter_batches(self, batch_size: int = 1000) -> AsyncIterator[List[Product]]:
+        """Percorre o catálogo inteiro em lotes (`async for`)."""
+        pass
+
+    @abstractmethod
+    async def get_categories(self) -> List[str]:
+        """Retorna todas as categorias disponíveis."""
+        pass
+
+    @abstractmethod
+    async def filter_products(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Product]:
+        """Filtra produtos com múltiplos critérios (ver ProductRepositoryPort)."""
+        pass
+
+    @abstractmethod
+    async def filter_products_page(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Product]:
+        """Versão ordenada e paginada de filter_products."""
+        pass
+
+    @abstractmethod
+    async def reserve_stock(self, quantities: Dict[str, int]) -> None:
+        """Baixa o estoque de vários produtos de forma atômica (tudo ou nada)."""
+        pass
+
+    @abstractmethod
+    async def release_stock(self, quantities: Dict[str, int]) -> None:
+        """Devolve ao estoque as quantidades informadas."""
+        pass
+
+    # As versões são consultadas a cada requisição de catálogo (ETag) e a
+    # cada produto serializado: continuam síncronas e devem ser O(1), sem E/S.
+
+    @abstractmethod
+    def catalog_version(self) -> int:
+        """Versão do catálogo: muda sempre que algum produto é alterado."""
+        pass
+
+    @abstractmethod
+    def product_version(self, product_id: str) -> Optional[int]:
+        """Versão de um produto, ou None se ele não existir."""
+        pass
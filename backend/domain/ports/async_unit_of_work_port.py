@@ -0,0 +1,23 @@
+"""
+Port (interface) assíncrono para a unidade de trabalho.
+
+Princípio DIP: Os serviços assíncronos delimitam as suas operações de
+escrita sem saber como a infraestrutura as agrupa.
+Princípio ISP: Interface mínima, apenas para delimitar a operação.
+"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager
+
+
+class AsyncUnitOfWorkPort(ABC):
+    """Interface assíncrona que agrupa as escritas de um caso de uso."""
+
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[None]:
+        """
+        Delimita uma unidade de trabalho (`async with`): as escritas feitas
+        dentro do bloco são persistidas uma única vez, ao final. Unidades
+        aninhadas participam da mais externa.
+        """
+        pass
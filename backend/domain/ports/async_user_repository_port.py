@@ -0,0 +1,41 @@
+"""
+Port (interface) assíncrono para o repositório de usuários.
+
+Mesmas operações de UserRepositoryPort, como corrotinas.
+
+Princípio DIP: O domínio define a interface.
+Princípio ISP: Interface específica para operações de usuário.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities.user import User
+
+
+class AsyncUserRepositoryPort(ABC):
+    """Interface assíncrona das operações de persistência de usuários."""
+
+    @abstractmethod
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Retorna um usuário pelo ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Retorna um usuário pelo email."""
+        pass
+
+    @abstractmethod
+    async def create(self, user: User) -> User:
+        """
+        Cria um novo usuário.
+
+        Lança UserAlreadyExistsException se o email (sem diferenciar
+        maiúsculas) já estiver cadastrado; a conferência é atômica.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, user: User) -> None:
+        """Atualiza um usuário."""
+        pass
@@ -8,6 +8,14 @@ Princípio ISP: Interface específica para operações de pedido.
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.order import Order
+from ..pagination import (
+    ORDER_SORT_FIELDS,
+    Page,
+    decode_order_cursor,
+    encode_keyset_cursor,
+    order_sort_key,
+    parse_sort,
+)
 
 
 class OrderRepositoryPort(ABC):
@@ -28,6 +36,39 @@ class OrderRepositoryPort(ABC):
         """Retorna todos os pedidos de um usuário."""
         pass
 
+    def get_page_by_user_id(
+        self,
+        user_id: str,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Order]:
+        """
+        Página do histórico de pedidos de um usuário, em ordem de
+        (created_at, id): "created_at" (padrão, mais antigos primeiro) ou
+        "-created_at". Sem `limit`, a página traz todos os pedidos.
+        `cursor` é o next_cursor da página anterior (keyset).
+
+        Implementação padrão: ordena get_by_user_id em memória. Adapters
+        devem sobrescrevê-la para que a página N custe o mesmo que a 1ª.
+        """
+        _, descending = parse_sort(sort, ORDER_SORT_FIELDS)
+        orders = sorted(
+            self.get_by_user_id(user_id), key=order_sort_key, reverse=descending
+        )
+        total = len(orders)
+        if cursor:
+            after = decode_order_cursor(cursor, sort)
+            orders = [
+                o for o in orders
+                if (order_sort_key(o) < after if descending else order_sort_key(o) > after)
+            ]
+        next_cursor = None
+        if limit is not None and len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = encode_keyset_cursor(sort, *order_sort_key(orders[-1]))
+        return Page(items=orders, total=total, next_cursor=next_cursor)
+
     @abstractmethod
     def update(self, order: Order) -> None:
         """Atualiza um pedido."""
@@ -0,0 +1,39 @@
+"""
+Port (interface) para o hash de senhas.
+
+Princípio DIP: O serviço de usuários gera e confere hashes de senha sem
+saber qual KDF é usada nem onde o cálculo roda.
+Princípio ISP: Interface mínima: gerar, conferir e decidir se um hash
+antigo deve ser refeito.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class PasswordHasherPort(ABC):
+    """Interface assíncrona para o hash de senhas."""
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """
+        Gera o hash da senha com a KDF atual.
+
+        Lança HashingOverloadedException se não houver capacidade para
+        calcular o hash agora.
+        """
+        pass
+
+    @abstractmethod
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """
+        Confere a senha com um hash armazenado (atual ou legado).
+
+        Lança HashingOverloadedException se não houver capacidade para
+        calcular o hash agora.
+        """
+        pass
+
+    @abstractmethod
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Indica se o hash foi gerado com uma KDF ou parâmetros antigos."""
+        pass
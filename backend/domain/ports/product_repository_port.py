@@ -9,8 +9,15 @@ Princípio ISP: Interface específica para operações de produto.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from ..entities.product import Product
+from ..pagination import (
+    PRODUCT_SORT_FIELDS,
+    Page,
+    paginate_by_offset,
+    parse_sort,
+    product_sort_key,
+)
 
 
 class ProductRepositoryPort(ABC):
@@ -26,6 +33,11 @@ class ProductRepositoryPort(ABC):
         """Retorna um produto pelo ID."""
         pass
 
+    @abstractmethod
+    def count(self) -> int:
+        """Quantidade de produtos no catálogo (sem materializá-los)."""
+        pass
+
     @abstractmethod
     def get_by_category(self, category: str) -> List[Product]:
         """Retorna produtos filtrados por categoria."""
@@ -33,7 +45,11 @@ class ProductRepositoryPort(ABC):
 
     @abstractmethod
     def search(self, query: str) -> List[Product]:
-        """Busca produtos por nome ou descrição."""
+        """
+        Busca produtos por nome, descrição ou marca.
+
+        A busca ignora maiúsculas e acentos ("calca" encontra "Calça").
+        """
         pass
 
     @abstractmethod
@@ -41,7 +57,150 @@ class ProductRepositoryPort(ABC):
         """Atualiza um produto."""
         pass
 
+    @abstractmethod
+    def upsert_many(self, products: List[Product]) -> int:
+        """
+        Inclui os produtos novos e atualiza os existentes (pelo id) em uma
+        única operação de escrita. Retorna quantos produtos foram incluídos.
+        """
+        pass
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[Product]]:
+        """
+        Percorre o catálogo inteiro em lotes de até batch_size produtos,
+        na ordem de inserção (ex.: exportação).
+
+        Implementação padrão: fatia get_all(). Adapters que não mantêm o
+        catálogo em memória devem sobrescrevê-la para ler um lote por vez.
+        """
+        products = self.get_all()
+        for start in range(0, len(products), batch_size):
+            yield products[start:start + batch_size]
+
     @abstractmethod
     def get_categories(self) -> List[str]:
         """Retorna todas as categorias disponíveis."""
         pass
+
+    @abstractmethod
+    def reserve_stock(self, quantities: Dict[str, int]) -> None:
+        """
+        Baixa o estoque de vários produtos de forma atômica.
+
+        `quantities` mapeia id do produto -> quantidade. Ou todas as baixas
+        são aplicadas, ou nenhuma: se algum produto não existir ou não tiver
+        estoque suficiente, levanta ProductNotFoundException ou
+        InsufficientStockException sem alterar nada. Deve ser seguro sob
+        chamadas concorrentes (o estoque nunca fica negativo).
+        """
+        pass
+
+    @abstractmethod
+    def release_stock(self, quantities: Dict[str, int]) -> None:
+        """
+        Devolve ao estoque as quantidades informadas (ex.: pedido cancelado).
+
+        Produtos que não existem mais no catálogo são ignorados.
+        """
+        pass
+
+    @abstractmethod
+    def catalog_version(self) -> int:
+        """
+        Versão do catálogo: muda sempre que algum produto é alterado.
+
+        Usada para validar caches (ex.: ETag das rotas de produtos). Deve
+        ser O(1); o valor só tem significado dentro do processo atual.
+        """
+        pass
+
+    @abstractmethod
+    def product_version(self, product_id: str) -> Optional[int]:
+        """
+        Versão de um produto: muda sempre que ele é alterado.
+
+        Retorna None se o produto não existir. Deve ser O(1).
+        """
+        pass
+
+    def filter_products(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Product]:
+        """
+        Filtra produtos com múltiplos critérios.
+
+        A lista base vem da busca textual (se houver `search`), senão da
+        categoria, senão do catálogo inteiro; os demais critérios são
+        aplicados sobre ela, preservando a ordem. O filtro de gênero também
+        aceita produtos "unissex".
+
+        Implementação padrão, em memória. Adapters com índices podem
+        sobrescrevê-la, mantendo exatamente a mesma semântica.
+        """
+        if search:
+            products = self.search(search)
+        elif category:
+            products = self.get_by_category(category)
+        else:
+            products = self.get_all()
+
+        if gender:
+            products = [
+                p for p in products
+                if p.gender.lower() == gender.lower() or p.gender.lower() == "unissex"
+            ]
+
+        if min_price is not None:
+            products = [p for p in products if p.price >= min_price]
+
+        if max_price is not None:
+            products = [p for p in products if p.price <= max_price]
+
+        if size:
+            products = [p for p in products if p.has_size(size)]
+
+        return products
+
+    def filter_products_page(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Product]:
+        """
+        Versão ordenada e paginada de filter_products.
+
+        `sort` aceita um dos PRODUCT_SORT_FIELDS, com prefixo "-" para ordem
+        decrescente (empates são desfeitos pelo id); sem `sort`, vale a
+        ordem de filter_products. Sem `limit`, a página traz todos os
+        resultados. `cursor` é o next_cursor devolvido pela página anterior.
+
+        Implementação padrão: ordena o resultado completo e pagina por
+        deslocamento. Adapters com índices ordenados podem sobrescrevê-la.
+        """
+        field, descending = parse_sort(sort, PRODUCT_SORT_FIELDS)
+        products = self.filter_products(
+            category=category,
+            gender=gender,
+            min_price=min_price,
+            max_price=max_price,
+            size=size,
+            search=search,
+        )
+        if field is not None:
+            products.sort(
+                key=lambda p: (product_sort_key(p, field), p.id), reverse=descending
+            )
+        return paginate_by_offset(products, sort, limit, cursor)
@@ -0,0 +1,40 @@
+"""
+Port (interface) para os tokens de sessão.
+
+Princípio DIP: O serviço de usuários emite e valida sessões sem conhecer
+o formato do token nem como ele é assinado.
+
+Princípio ISP: Interface mínima: emitir, validar e revogar.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class SessionTokenPort(ABC):
+    """Interface para tokens de sessão com expiração."""
+
+    @property
+    @abstractmethod
+    def ttl(self) -> int:
+        """Validade dos tokens emitidos, em segundos."""
+        pass
+
+    @abstractmethod
+    def issue(self, user_id: str) -> str:
+        """Emite um token de sessão para o usuário."""
+        pass
+
+    @abstractmethod
+    def verify(self, token: str) -> str:
+        """
+        Valida o token e retorna o id do usuário.
+
+        Lança InvalidTokenException se o token for inválido, expirado ou
+        revogado.
+        """
+        pass
+
+    @abstractmethod
+    def revoke(self, token: str) -> None:
+        """Revoga um token válido (logout). Tokens inválidos são ignorados."""
+        pass
@@ -0,0 +1,25 @@
+"""
+Port (interface) para a unidade de trabalho.
+
+Princípio DIP: Os serviços delimitam as suas operações de escrita sem
+saber como a infraestrutura as agrupa (um flush do documento JSON, uma
+transação SQLite, etc).
+
+Princípio ISP: Interface mínima, apenas para delimitar a operação.
+"""
+
+from abc import ABC, abstractmethod
+from typing import ContextManager
+
+
+class UnitOfWorkPort(ABC):
+    """Interface que agrupa as escritas de um caso de uso em uma só persistência."""
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+        """
+        Delimita uma unidade de trabalho: as escritas feitas dentro do
+        bloco são persistidas uma única vez, ao final. Unidades aninhadas
+        participam da mais externa.
+        """
+        pass
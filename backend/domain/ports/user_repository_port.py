@@ -25,7 +25,12 @@ class UserRepositoryPort(ABC):
 
     @abstractmethod
     def create(self, user: User) -> User:
-        """Cria um novo usuário."""
+        """
+        Cria um novo usuário.
+
+        Lança UserAlreadyExistsException se o email (sem diferenciar
+        maiúsculas) já estiver cadastrado; a conferência é atômica.
+        """
         pass
 
     @abstractmethod
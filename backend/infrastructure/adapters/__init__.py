@@ -1,9 +1,46 @@
+from .json_document_store import JsonDocumentStore
+from .json_document_watcher import JsonDocumentWatcher
 from .json_product_repository import JsonProductRepository
 from .json_user_repository import JsonUserRepository
 from .json_order_repository import JsonOrderRepository
+from .json_unit_of_work import JsonUnitOfWork
+from .hmac_session_tokens import HmacSessionTokens
+from .metrics_registry import MetricsRegistry
+from .password_kdf import Pbkdf2Kdf, ScryptKdf, Sha256Kdf, make_kdf
+from .pooled_password_hasher import PooledPasswordHasher
+from .sqlite_database import SqliteDatabase
+from .sqlite_product_repository import SqliteProductRepository
+from .sqlite_user_repository import SqliteUserRepository
+from .sqlite_order_repository import SqliteOrderRepository
+from .sqlite_unit_of_work import SqliteUnitOfWork
+from .async_bridge import (
+    AsyncProductRepositoryBridge,
+    AsyncUserRepositoryBridge,
+    AsyncOrderRepositoryBridge,
+    AsyncUnitOfWorkBridge,
+)
 
 __all__ = [
+    "JsonDocumentStore",
+    "JsonDocumentWatcher",
     "JsonProductRepository",
     "JsonUserRepository",
     "JsonOrderRepository",
+    "JsonUnitOfWork",
+    "HmacSessionTokens",
+    "MetricsRegistry",
+    "Pbkdf2Kdf",
+    "ScryptKdf",
+    "Sha256Kdf",
+    "make_kdf",
+    "PooledPasswordHasher",
+    "SqliteDatabase",
+    "SqliteProductRepository",
+    "SqliteUserRepository",
+    "SqliteOrderRepository",
+    "SqliteUnitOfWork",
+    "AsyncProductRepositoryBridge",
+    "AsyncUserRepositoryBridge",
+    "AsyncOrderRepositoryBridge",
+    "AsyncUnitOfWorkBridge",
 ]
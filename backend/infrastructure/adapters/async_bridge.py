@@ -0,0 +1,306 @@
+"""
+Ponte entre os repositórios síncronos e os ports assíncronos.
+
+Princípio LSP/DIP: Qualquer implementação síncrona (JSON, SQLite) passa
+a atender os ports assíncronos sem ser reescrita.
+
+- Leituras: nos repositórios em memória (JSON), são respondidas direto
+  no event loop, sem ocupar uma thread do pool. Nos demais (SQLite), vão
+  para uma thread auxiliar.
+- Escritas: sempre em uma thread auxiliar, porque podem gravar em disco
+  (flush do data.json, journal, COMMIT).
+- Unidade de trabalho: todas as operações de uma mesma unidade rodam na
+  mesma thread (uma transação SQLite pertence à conexão de uma thread),
+  enquanto as demais requisições continuam livres.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+from domain.entities.order import Order
+from domain.entities.product import Product
+from domain.entities.user import User
+from domain.pagination import Page
+from domain.ports import (
+    AsyncOrderRepositoryPort,
+    AsyncProductRepositoryPort,
+    AsyncUnitOfWorkPort,
+    AsyncUserRepositoryPort,
+    OrderRepositoryPort,
+    ProductRepositoryPort,
+    UnitOfWorkPort,
+    UserRepositoryPort,
+)
+
+# Thread da unidade de trabalho em andamento na tarefa atual (se houver)
+_unit_of_work_executor: ContextVar[Optional[ThreadPoolExecutor]] = ContextVar(
+    "_unit_of_work_executor", default=None
+)
+
+
+async def _in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Executa func fora do event loop (na thread da unidade de trabalho, se houver)."""
+    executor = _unit_of_work_executor.get()
+    if executor is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+class _RepositoryBridge:
+    """Base das pontes: decide onde cada chamada ao repositório síncrono roda."""
+
+    def __init__(self, repository: Any, inline_reads: bool = False):
+        self._repository = repository
+        self._inline_reads = inline_reads
+
+    async def _read(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self._inline_reads:
+            return func(*args, **kwargs)
+        return await _in_thread(func, *args, **kwargs)
+
+    async def _write(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # Uma escrita já despachada para a thread não pode ser interrompida:
+        # se a tarefa for cancelada, espera a escrita terminar antes de
+        # propagar o cancelamento, e o chamador sabe que ela foi aplicada.
+        task = asyncio.ensure_future(_in_thread(func, *args, **kwargs))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            await asyncio.wait({task})
+            if not task.cancelled():
+                task.exception()  # marca a exceção (se houver) como tratada
+            raise
+
+
+class AsyncProductRepositoryBridge(_RepositoryBridge, AsyncProductRepositoryPort):
+    """AsyncProductRepositoryPort sobre um ProductRepositoryPort síncrono."""
+
+    def __init__(self, repository: ProductRepositoryPort, inline_reads: bool = False):
+        super().__init__(repository, inline_reads)
+
+    async def get_all(self) -> List[Product]:
+        return await self._read(self._repository.get_all)
+
+    async def get_by_id(self, product_id: str) -> Optional[Product]:
+        return await self._read(self._repository.get_by_id, product_id)
+
+    async def get_by_category(self, category: str) -> List[Product]:
+        return await self._read(self._repository.get_by_category, category)
+
+    async def search(self, query: str) -> List[Product]:
+        return await self._read(self._repository.search, query)
+
+    async def update(self, product: Product) -> None:
+        await self._write(self._repository.update, product)
+
+    async def upsert_many(self, products: List[Product]) -> int:
+        return await self._write(self._repository.upsert_many, products)
+
+    async def iter_batches(self, batch_size: int = 1000) -> AsyncIterator[List[Product]]:
+        # Cada lote é lido por inteiro em uma chamada: o gerador síncrono
+        # pode avançar em threads diferentes sem manter um cursor aberto
+        batches = self._repository.iter_batches(batch_size)
+        while True:
+            batch = await self._read(next, batches, None)
+            if batch is None:
+                return
+            yield batch
+
+    async def get_categories(self) -> List[str]:
+        return await self._read(self._repository.get_categories)
+
+    async def filter_products(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Product]:
+        return await self._read(
+            self._repository.filter_products,
+            category, gender, min_price, max_price, size, search,
+        )
+
+    async def filter_products_page(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Product]:
+        return await self._read(
+            self._repository.filter_products_page,
+            category, gender, min_price, max_price, size, search, sort, limit, cursor,
+        )
+
+    async def reserve_stock(self, quantities: Dict[str, int]) -> None:
+        await self._write(self._repository.reserve_stock, quantities)
+
+    async def release_stock(self, quantities: Dict[str, int]) -> None:
+        await self._write(self._repository.release_stock, quantities)
+
+    def catalog_version(self) -> int:
+        return self._repository.catalog_version()
+
+    def product_version(self, product_id: str) -> Optional[int]:
+        return self._repository.product_version(product_id)
+
+
+class AsyncUserRepositoryBridge(_RepositoryBridge, AsyncUserRepositoryPort):
+    """AsyncUserRepositoryPort sobre um UserRepositoryPort síncrono."""
+
+    def __init__(self, repository: UserRepositoryPort, inline_reads: bool = False):
+        super().__init__(repository, inline_reads)
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        return await self._read(self._repository.get_by_id, user_id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self._read(self._repository.get_by_email, email)
+
+    async def create(self, user: User) -> User:
+        return await self._write(self._repository.create, user)
+
+    async def update(self, user: User) -> None:
+        await self._write(self._repository.update, user)
+
+
+class AsyncOrderRepositoryBridge(_RepositoryBridge, AsyncOrderRepositoryPort):
+    """AsyncOrderRepositoryPort sobre um OrderRepositoryPort síncrono."""
+
+    def __init__(self, repository: OrderRepositoryPort, inline_reads: bool = False):
+        super().__init__(repository, inline_reads)
+
+    async def create(self, order: Order) -> Order:
+        return await self._write(self._repository.create, order)
+
+    async def get_by_id(self, order_id: str) -> Optional[Order]:
+        return await self._read(self._repository.get_by_id, order_id)
+
+    async def get_by_user_id(self, user_id: str) -> List[Order]:
+        return await self._read(self._repository.get_by_user_id, user_id)
+
+    async def get_page_by_user_id(
+        self,
+        user_id: str,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Order]:
+        return await self._read(
+            self._repository.get_page_by_user_id, user_id, sort, limit, cursor
+        )
+
+    async def update(self, order: Order) -> None:
+        await self._write(self._repository.update, order)
+
+
+class AsyncUnitOfWorkBridge(AsyncUnitOfWorkPort):
+    """
+    AsyncUnitOfWorkPort sobre um UnitOfWorkPort síncrono.
+
+    Cada unidade recebe uma thread própria (reaproveitada entre unidades),
+    onde são abertas e fechadas a unidade síncrona e executadas todas as
+    chamadas das pontes feitas dentro do bloco. No máximo max_threads
+    unidades rodam ao mesmo tempo (por padrão, o mesmo limite do pool do
+    asyncio.to_thread); as demais esperam uma thread livre no event loop.
+    close() encerra as threads no fim da aplicação.
+
+    Com exclusive=True, as unidades esperam a vez em uma fila do event loop
+    em vez de disputar o banco: no SQLite só há um escritor por vez, e uma
+    transação em espera no busy_timeout dorme em intervalos de milissegundos.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: UnitOfWorkPort,
+        exclusive: bool = False,
+        max_threads: Optional[int] = None,
+    ):
+        if max_threads is None:
+            max_threads = min(32, (os.cpu_count() or 1) + 4)
+        if max_threads < 1:
+            raise ValueError("max_threads deve ser >= 1")
+        self._unit_of_work = unit_of_work
+        self._exclusive = asyncio.Lock() if exclusive else None
+        self._slots = asyncio.Semaphore(max_threads)
+        # Threads livres (usadas apenas a partir do event loop)
+        self._idle: List[ThreadPoolExecutor] = []
+        self._closed = False
+
+    def close(self) -> None:
+        """Encerra as threads livres; as em uso são encerradas ao serem devolvidas."""
+        self._closed = True
+        while self._idle:
+            self._idle.pop().shutdown(wait=True)
+
+    def transaction(self) -> AsyncContextManager[None]:
+        return self._transaction()
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[None]:
+        if _unit_of_work_executor.get() is not None:
+            # Aninhada: participa da unidade mais externa
+            yield
+            return
+
+        if self._exclusive is None:
+            async with self._slots, self._run_in_thread():
+                yield
+        else:
+            async with self._exclusive, self._slots, self._run_in_thread():
+                yield
+
+    @asynccontextmanager
+    async def _run_in_thread(self) -> AsyncIterator[None]:
+        executor = (
+            self._idle.pop()
+            if self._idle
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="unit-of-work")
+        )
+        token = _unit_of_work_executor.set(executor)
+        context = self._unit_of_work.transaction()
+        entered = asyncio.get_running_loop().run_in_executor(executor, context.__enter__)
+        exiting = False
+        try:
+            await entered
+            try:
+                yield
+            except BaseException as exc:
+                exiting = True
+                if not await _in_thread(context.__exit__, type(exc), exc, exc.__traceback__):
+                    raise
+            else:
+                exiting = True
+                await _in_thread(context.__exit__, None, None, None)
+        finally:
+            _unit_of_work_executor.reset(token)
+            if not exiting and entered.cancelled():
+                # Tarefa cancelada antes do bloco: a unidade já foi (ou ainda
+                # será) aberta na thread, então é fechada lá, com rollback.
+                cancelled = asyncio.CancelledError()
+                executor.submit(context.__exit__, type(cancelled), cancelled, None)
+            if self._closed:
+                executor.shutdown(wait=False)
+            else:
+                self._idle.append(executor)
@@ -0,0 +1,144 @@
+"""
+Tokens de sessão assinados com HMAC (biblioteca padrão).
+
+Princípio DIP: Implementa SessionTokenPort.
+
+O token carrega o id do usuário, a expiração e um identificador
+aleatório, e é assinado com HMAC-SHA256:
+
+    base64url(["user_id", expiração, "jti"]) + "." + base64url(assinatura)
+
+A validação não consulta o repositório de usuários: confere a assinatura
+(comparação em tempo constante), a expiração e um cache pequeno de tokens
+revogados. O cache guarda apenas o identificador de cada token revogado
+e só até a expiração dele, quando o token deixaria de valer de qualquer
+forma.
+
+Um cliente reenvia o mesmo token em todas as chamadas da sessão; os
+tokens cuja assinatura já foi conferida ficam em um cache limitado
+(max_cached), e as chamadas seguintes checam apenas a expiração e a
+revogação, sem recalcular o HMAC.
+
+As revogações ficam na memória do processo: com vários workers, um
+logout vale no worker que o recebeu, e os demais aceitam o token até a
+expiração.
+"""
+
+import base64
+import hashlib
+import heapq
+import hmac
+import json
+import secrets
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from domain.exceptions import InvalidTokenException
+from domain.ports import SessionTokenPort
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class HmacSessionTokens(SessionTokenPort):
+    """Tokens de sessão sem estado, assinados com HMAC-SHA256."""
+
+    def __init__(
+        self,
+        secret: bytes,
+        ttl: int = 8 * 3600,
+        max_cached: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        if len(secret) < 16:
+            raise ValueError("O segredo das sessões deve ter ao menos 16 bytes.")
+        self._secret = secret
+        self._ttl = ttl
+        self._clock = clock
+        self._max_cached = max_cached
+        # Tokens já conferidos: token -> (user_id, expiração, jti)
+        self._verified: Dict[str, Tuple[str, int, str]] = {}
+        # Consultas ao cache de tokens conferidos (ver cache_stats)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Revogados: jti -> expiração, e um heap por expiração para a limpeza
+        self._revoked: Dict[str, int] = {}
+        self._expirations: List[Tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> int:
+        return self._ttl
+
+    def cache_stats(self) -> Tuple[int, int]:
+        """(acertos, falhas) do cache de tokens já conferidos."""
+        return self._cache_hits, self._cache_misses
+
+    def _sign(self, payload: str) -> str:
+        digest = hmac.new(self._secret, payload.encode("ascii"), hashlib.sha256).digest()
+        return _b64encode(digest)
+
+    def issue(self, user_id: str) -> str:
+        expires = int(self._clock()) + self._ttl
+        claims = json.dumps([user_id, expires, secrets.token_urlsafe(12)], separators=(",", ":"))
+        payload = _b64encode(claims.encode("utf-8"))
+        return f"{payload}.{self._sign(payload)}"
+
+    def _claims(self, token: str) -> Tuple[str, int, str]:
+        """Confere assinatura e expiração; retorna (user_id, expiração, jti)."""
+        # Tokens emitidos aqui são ASCII; qualquer outro caractere faria o
+        # encode e o compare_digest falharem (um erro 500, não um 401)
+        if not token.isascii():
+            raise InvalidTokenException()
+        payload, _, signature = token.partition(".")
+        if not signature or not hmac.compare_digest(signature, self._sign(payload)):
+            raise InvalidTokenException()
+        try:
+            user_id, expires, jti = json.loads(_b64decode(payload))
+            expired = expires <= self._clock()
+        except (ValueError, TypeError):
+            raise InvalidTokenException()
+        if expired:
+            raise InvalidTokenException()
+        return user_id, expires, jti
+
+    def verify(self, token: str) -> str:
+        claims = self._verified.get(token)
+        if claims is None:
+            self._cache_misses += 1
+            claims = self._claims(token)
+            if self._max_cached > 0:
+                with self._lock:
+                    if len(self._verified) >= self._max_cached:
+                        # Descarta o mais antigo (ordem de inserção do dict)
+                        del self._verified[next(iter(self._verified))]
+                    self._verified[token] = claims
+        else:
+            self._cache_hits += 1
+        user_id, expires, jti = claims
+        if expires <= self._clock() or jti in self._revoked:
+            raise InvalidTokenException()
+        return user_id
+
+    def revoke(self, token: str) -> None:
+        try:
+            _, expires, jti = self._claims(token)
+        except InvalidTokenException:
+            return
+        with self._lock:
+            self._prune()
+            if jti not in self._revoked:
+                self._revoked[jti] = expires
+                heapq.heappush(self._expirations, (expires, jti))
+
+    def _prune(self) -> None:
+        """Descarta as revogações de tokens que já expiraram."""
+        now = self._clock()
+        while self._expirations and self._expirations[0][0] <= now:
+            _, jti = heapq.heappop(self._expirations)
+            del self._revoked[jti]
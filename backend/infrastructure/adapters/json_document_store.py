@@ -0,0 +1,770 @@
+"""
+Documento JSON compartilhado pelos adapters JSON.
+
+Os três repositórios JSON persistem no mesmo arquivo. Em vez de cada um
+analisar o arquivo inteiro na inicialização e reler/reescrever o arquivo
+a cada alteração, todos se apoiam em uma única instância deste store:
+
+- o arquivo é analisado uma única vez;
+- cada repositório registra sua coleção ("products", "users", "orders")
+  e marca a coleção como suja quando a altera;
+- somente coleções sujas são serializadas novamente; as demais reutilizam
+  o texto já codificado na escrita anterior;
+- escritas feitas dentro de um batch() são agrupadas em uma única
+  escrita atômica (arquivo temporário + rename).
+
+Durabilidade (troca entre latência e janela de perda):
+
+- "sync": cada operação (ou unidade de trabalho) só retorna depois de
+  gravada e sincronizada no disco (fsync);
+- "interval" (write-behind): as operações alteram a memória e marcam o
+  store como sujo; uma thread de fundo grava a cada flush_interval
+  segundos, ou assim que max_dirty alterações se acumulam. Um único
+  fsync confirma todas as alterações do grupo (group commit);
+- "off": como "interval", mas sem fsync: o sistema operacional decide
+  quando os dados chegam ao disco.
+
+Nos modos de fundo, close() faz o flush final (sempre com fsync).
+
+Modo compartilhado (shared=True, vários processos sobre o mesmo arquivo,
+como os workers do uvicorn; exige durabilidade "sync"):
+
+- cada batch roda com um lock exclusivo (fcntl) no arquivo <base>.lock,
+  e antes de alterar qualquer coisa recarrega o que outros processos
+  gravaram;
+- cada gravação atualiza o carimbo <base>.stamp: um contador de
+  alterações por coleção e a posição (em bytes) de cada coleção no
+  documento;
+- is_stale() compara o carimbo com o último visto (um stat, sem lock);
+  refresh() recarrega somente as coleções cujo contador mudou, lendo
+  apenas o trecho do arquivo de cada uma.
+
+Edições externas (o arquivo alterado fora da API, ver JsonDocumentWatcher)
+são detectadas pelo stat do arquivo (inode, mtime e tamanho). Somente as
+coleções cujo conteúdo mudou são entregues aos loaders; se a coleção tem
+alterações ainda não gravadas, o loader recebe a memória atual com as
+entradas editadas externamente aplicadas por id (merge a três vias com o
+conteúdo anterior do arquivo). Antes de cada gravação o stat é conferido,
+para que a gravação nunca sobrescreva uma edição externa. Uma coleção que
+o loader rejeita (ex.: um produto sem "name") não altera a memória: o
+documento editado é copiado para <base>.rejected.json, a rejeição é
+registrada no log e a coleção é regravada a partir da memória, sem
+interromper a escrita em andamento.
+
+Métricas (ver MetricsRegistry): a duração da análise na inicialização,
+as alterações marcadas por coleção (as chamadas de _save_data dos
+repositórios), as serializações de cada coleção (quantidade, bytes e
+duração), as gravações do documento (quantidade, bytes e duração,
+incluindo fsync e rename) e as edições externas rejeitadas por coleção.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from .metrics_registry import MetricsRegistry
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sem fcntl (Windows)
+    fcntl = None
+
+DURABILITY_MODES = ("sync", "interval", "off")
+
+logger = logging.getLogger(__name__)
+
+
+class JsonDocumentStore:
+    """Estado em memória do data.json com escrita agrupada e atômica."""
+
+    def __init__(
+        self,
+        file_path: str,
+        durability: str = "sync",
+        flush_interval: float = 1.0,
+        max_dirty: int = 0,
+        shared: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"Durabilidade inválida: '{durability}'. "
+                f"Use {', '.join(repr(m) for m in DURABILITY_MODES)}."
+            )
+        if shared and durability != "sync":
+            raise ValueError(
+                "O modo compartilhado entre processos exige durabilidade 'sync'."
+            )
+        if shared and fcntl is None:
+            raise RuntimeError("O modo compartilhado exige fcntl (Unix).")
+        self._file_path = file_path
+        self._durability = durability
+        self._flush_interval = flush_interval
+        self._max_dirty = max_dirty
+        self._shared = shared
+        # Reentrante: repositórios podem agrupar mutação + persistência
+        # sob o mesmo lock usado pelo flush.
+        self.lock = threading.RLock()
+        self._keys: List[str] = []
+        self._raw: Dict[str, Any] = {}
+        self._fragments: Dict[str, bytes] = {}
+        self._dumpers: Dict[str, Callable[[], Any]] = {}
+        self._loaders: Dict[str, Callable[[Optional[list]], None]] = {}
+        self._dirty: Set[str] = set()
+        self._batch_depth = 0
+        # Alterações ainda não gravadas (coleções e registros externos)
+        self._pending = 0
+        # Arquivos externos (journal) sincronizados em cada group commit
+        self._sync_hooks: List[Callable[[], None]] = []
+        # Serializa as gravações em disco, que acontecem fora do lock
+        self._write_lock = threading.Lock()
+        self._generation = 0
+        self._written_generation = 0
+        self._wakeup = threading.Condition(self.lock)
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        # Stat do data.json correspondente ao estado em memória
+        self._document_stat: Optional[Tuple[int, int, int]] = None
+        self._init_metrics(metrics or MetricsRegistry())
+
+        # --- Modo compartilhado ---
+        base = os.path.splitext(file_path)[0]
+        self._lock_path = base + ".lock"
+        self._stamp_path = base + ".stamp"
+        self._rejected_path = base + ".rejected.json"
+        self._lock_fd: Optional[int] = None
+        self._file_lock_depth = 0
+        # Um batch por vez no processo: cada um segura o lock do arquivo
+        # só durante a própria execução, sem deixar os outros processos
+        # esperando por uma sequência de batches sobrepostos
+        self._writer = threading.RLock() if shared else None
+        # Último carimbo lido ou gravado, e o stat do arquivo dele
+        self._stamp: Dict[str, Any] = {"collections": {}}
+        self._stamp_stat: Optional[Tuple[int, int, int]] = None
+        # Coleções alteradas desde a última gravação do carimbo
+        self._changed: Set[str] = set()
+
+        if shared:
+            self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            with self._file_locked(fcntl.LOCK_SH):
+                self._load()
+                self._stamp_stat, self._stamp = self._read_stamp()
+        else:
+            self._load()
+        if durability != "sync":
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="json-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _init_metrics(self, metrics: MetricsRegistry) -> None:
+        self._metrics = metrics
+        self._load_seconds = metrics.gauge(
+            "json_store_load_seconds",
+            "Duração da leitura e análise do data.json na inicialização.",
+        ).labels()
+        self._document_bytes = metrics.gauge(
+            "json_store_document_bytes", "Tamanho do data.json na última leitura ou gravação."
+        ).labels()
+        metrics.gauge_function(
+            "json_store_pending_changes", "Alterações ainda não gravadas no disco.",
+            lambda: self._pending,
+        )
+        self._save_calls = metrics.counter(
+            "json_store_save_calls_total",
+            "Alterações marcadas por coleção (chamadas de _save_data dos repositórios).",
+            ("collection",),
+        )
+        self._dumps = metrics.counter(
+            "json_store_dumps_total", "Serializações de uma coleção para gravação.",
+            ("collection",),
+        )
+        self._dump_bytes = metrics.counter(
+            "json_store_dump_bytes_total", "Bytes de JSON produzidos pelas serializações.",
+            ("collection",),
+        )
+        self._dump_seconds = metrics.histogram(
+            "json_store_dump_seconds", "Duração da serialização de uma coleção.",
+            ("collection",),
+        )
+        self._writes = metrics.counter(
+            "json_store_writes_total", "Gravações do documento (temporário + rename)."
+        ).labels()
+        self._write_bytes = metrics.counter(
+            "json_store_write_bytes_total", "Bytes gravados no data.json."
+        ).labels()
+        self._write_seconds = metrics.histogram(
+            "json_store_write_seconds", "Duração de uma gravação do documento, com fsync."
+        ).labels()
+        self._rejected_edits = metrics.counter(
+            "json_store_rejected_edits_total",
+            "Edições externas de uma coleção rejeitadas pelo loader.",
+            ("collection",),
+        )
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Registro onde o store (e os arquivos externos, como o journal) medem a E/S."""
+        return self._metrics
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def durability(self) -> str:
+        return self._durability
+
+    @property
+    def shared(self) -> bool:
+        return self._shared
+
+    def _load(self) -> None:
+        """Analisa o arquivo JSON (uma única vez para todos os repositórios)."""
+        start = time.perf_counter()
+        self._document_stat = self._stat_key(self._file_path)
+        with open(self._file_path, "r", encoding="utf-8") as f:
+            self._raw = json.load(f)
+        self._keys = list(self._raw)
+        self._fragments = {}
+        self._load_seconds.set(time.perf_counter() - start)
+        if self._document_stat is not None:
+            self._document_bytes.set(self._document_stat[2])
+
+    def collection(self, name: str) -> list:
+        """Retorna o conteúdo bruto de uma coleção, como lido do arquivo."""
+        return self._raw.get(name, [])
+
+    def register(
+        self,
+        name: str,
+        dumper: Callable[[], Any],
+        loader: Optional[Callable[[Optional[list]], None]] = None,
+    ) -> None:
+        """
+        Registra o repositório dono de uma coleção.
+
+        dumper é chamado no flush, somente quando a coleção estiver suja,
+        e deve retornar o conteúdo serializável da coleção.
+
+        loader é chamado quando outro processo (modo compartilhado) ou uma
+        edição externa altera a coleção: recebe o novo conteúdo, ou None se
+        a coleção no documento não mudou (a alteração está fora dele, ver
+        mark_changed). Deve aplicar apenas as entradas que mudaram.
+        """
+        with self.lock:
+            self._dumpers[name] = dumper
+            if loader is not None:
+                self._loaders[name] = loader
+            if name not in self._keys:
+                self._keys.append(name)
+
+    def add_sync_hook(self, hook: Callable[[], None]) -> None:
+        """
+        Registra a sincronização de um arquivo externo ao documento (como o
+        journal de pedidos), executada a cada group commit com fsync.
+        """
+        with self.lock:
+            self._sync_hooks.append(hook)
+
+    def mark_dirty(self, name: str) -> None:
+        """Marca uma coleção como alterada e agenda sua persistência."""
+        self._save_calls.labels(name).inc()
+        with self.lock:
+            self._dirty.add(name)
+            self._changed.add(name)
+            self._pending += 1
+            flush = self._batch_depth == 0 and self._schedule_flush()
+        if flush:
+            self.flush()
+
+    def mark_changed(self, name: str) -> None:
+        """
+        Registra uma alteração da coleção gravada fora do documento (como
+        um registro no journal de pedidos).
+
+        No modo "sync" o próprio arquivo sincroniza a escrita; nos modos de
+        fundo ela é confirmada pelo próximo group commit. No modo
+        compartilhado, a alteração é anunciada aos outros processos no
+        carimbo.
+        """
+        self._save_calls.labels(name).inc()
+        if self._durability == "sync" and not self._shared:
+            return
+        with self.lock:
+            self._changed.add(name)
+            self._pending += 1
+            flush = self._batch_depth == 0 and self._schedule_flush()
+        if flush:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Agrupa as escritas feitas dentro do bloco em um único flush.
+
+        Batches podem ser aninhados (e concorrentes): o flush acontece
+        quando o último deles termina. No modo compartilhado, os batches
+        do processo rodam um por vez, com o lock do arquivo e sobre o
+        estado mais recente gravado pelos outros processos.
+        """
+        if self._writer is not None:
+            self._writer.acquire()
+        try:
+            with self.lock:
+                if self._shared and self._batch_depth == 0:
+                    self._lock_file(fcntl.LOCK_EX)
+                    try:
+                        self._refresh_locked()
+                    except BaseException:
+                        self._unlock_file()
+                        raise
+                self._batch_depth += 1
+            flush = False
+            try:
+                yield
+            finally:
+                with self.lock:
+                    self._batch_depth -= 1
+                    if self._batch_depth == 0:
+                        try:
+                            flush = bool(self._pending) and self._schedule_flush()
+                        finally:
+                            if self._shared:
+                                self._unlock_file()
+                if flush:
+                    self.flush()
+        finally:
+            if self._writer is not None:
+                self._writer.release()
+
+    def _schedule_flush(self) -> bool:
+        """
+        Agenda a persistência das alterações pendentes (chamado sob o lock).
+
+        Retorna True quando quem chamou deve executar flush() depois de
+        liberar o lock (modo "sync"): assim a gravação e o fsync não
+        seguram as outras requisições. No modo compartilhado o flush
+        acontece aqui mesmo, ainda com o lock do arquivo do batch.
+        """
+        if self._durability == "sync":
+            if not self._shared:
+                return True
+            self.flush()
+        elif self._max_dirty and self._pending >= self._max_dirty:
+            self._wakeup.notify()
+        return False
+
+    def _flush_loop(self) -> None:
+        """Thread de fundo dos modos "interval" e "off"."""
+        while True:
+            with self.lock:
+                if not self._closed:
+                    self._wakeup.wait(self._flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except OSError:
+                # As alterações continuam pendentes e são regravadas na
+                # próxima rodada (ou no flush final)
+                pass
+
+    def _fragment(self, name: str) -> bytes:
+        """Retorna o JSON de uma coleção, serializando-a se necessário."""
+        if name in self._dirty or name not in self._fragments:
+            start = time.perf_counter()
+            if name in self._dirty or name not in self._raw:
+                value = self._dumpers[name]()
+            else:
+                value = self._raw[name]
+            text = json.dumps(value, ensure_ascii=False, indent=2)
+            # Mesma indentação de json.dump(documento, indent=2)
+            fragment = self._fragments[name] = text.replace("\n", "\n  ").encode("utf-8")
+            self._dumps.labels(name).inc()
+            self._dump_bytes.labels(name).inc(len(fragment))
+            self._dump_seconds.labels(name).observe(time.perf_counter() - start)
+            if name in self._dumpers:
+                # O repositório é a fonte da verdade; o bruto não é mais necessário
+                self._raw.pop(name, None)
+        return self._fragments[name]
+
+    def _render(self) -> Tuple[bytes, Dict[str, List[int]]]:
+        """Monta o documento e a posição [início, fim) de cada coleção."""
+        parts = [b"{\n"]
+        offset = 2
+        ranges: Dict[str, List[int]] = {}
+        for i, name in enumerate(self._keys):
+            head = (",\n" if i else "") + f"  {json.dumps(name)}: "
+            head_bytes = head.encode("utf-8")
+            fragment = self._fragment(name)
+            offset += len(head_bytes)
+            ranges[name] = [offset, offset + len(fragment)]
+            offset += len(fragment)
+            parts += (head_bytes, fragment)
+        parts.append(b"\n}")
+        return b"".join(parts), ranges
+
+    def flush(self, fsync: Optional[bool] = None) -> None:
+        """
+        Grava as coleções sujas no arquivo (temporário + rename).
+
+        O documento é montado sob o lock; a gravação e o fsync acontecem
+        fora dele, para que as requisições sigam alterando a memória
+        enquanto o disco trabalha. Gravações concorrentes são serializadas
+        e um documento nunca sobrescreve outro montado depois dele.
+
+        Exceção: no modo compartilhado, a gravação inteira acontece sob o
+        lock (e o lock do arquivo), para que o carimbo acompanhe a ordem
+        das gravações; quem chama flush() segurando o lock também grava
+        com ele.
+        """
+        if fsync is None:
+            fsync = self._durability != "off"
+        if self._shared:
+            with self.lock, self._file_locked(fcntl.LOCK_EX):
+                if self._pending:
+                    # Fora de um batch, outro processo pode ter gravado:
+                    # as coleções não alteradas aqui são atualizadas antes
+                    self._refresh_locked(skip=self._dirty)
+                    self._flush(fsync)
+        else:
+            self._flush(fsync)
+
+    def _flush(self, fsync: bool) -> None:
+        with self.lock:
+            if not self._pending:
+                return
+            if self._dirty and not self._shared:
+                # (no modo compartilhado, conferido por _refresh_locked)
+                self._check_external_locked()
+            names = set(self._dirty)
+            document = None
+            if names:
+                document, ranges = self._render()
+            changed = self._changed
+            self._dirty.clear()
+            self._changed = set()
+            self._pending = 0
+            self._generation += 1
+            generation = self._generation
+            # No modo "sync" os arquivos externos já sincronizam a cada escrita
+            hooks = list(self._sync_hooks) if fsync and self._durability != "sync" else []
+
+        try:
+            with self._write_lock:
+                if document is not None and generation > self._written_generation:
+                    self._write(document, fsync)
+                    self._written_generation = generation
+                    self._document_stat = self._stat_key(self._file_path)
+                for hook in hooks:
+                    hook()
+                if self._shared:
+                    self._write_stamp(changed, names, ranges if document else None)
+        except BaseException:
+            with self.lock:
+                self._dirty |= names
+                self._changed |= changed
+                self._pending += 1
+            raise
+
+    def _write(self, document: bytes, fsync: bool) -> None:
+        start = time.perf_counter()
+        tmp_path = self._file_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(document)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self._file_path)
+        self._write_seconds.observe(time.perf_counter() - start)
+        self._writes.inc()
+        self._write_bytes.inc(len(document))
+        self._document_bytes.set(len(document))
+
+    # --- Modo compartilhado ---
+
+    def _lock_file(self, mode: int) -> None:
+        """Adquire o lock do arquivo (reentrante dentro do processo)."""
+        if self._file_lock_depth == 0:
+            fcntl.flock(self._lock_fd, mode)
+        self._file_lock_depth += 1
+
+    def _unlock_file(self) -> None:
+        self._file_lock_depth -= 1
+        if self._file_lock_depth == 0:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _file_locked(self, mode: int) -> Iterator[None]:
+        with self.lock:
+            self._lock_file(mode)
+            try:
+                yield
+            finally:
+                self._unlock_file()
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _read_stamp(self) -> Tuple[Optional[Tuple[int, int, int]], Dict[str, Any]]:
+        stat = self._stat_key(self._stamp_path)
+        if stat is None:
+            return None, {"collections": {}}
+        with open(self._stamp_path, "r", encoding="utf-8") as f:
+            return stat, json.load(f)
+
+    def _write_stamp(
+        self,
+        changed: Set[str],
+        rewritten: Set[str],
+        ranges: Optional[Dict[str, List[int]]],
+    ) -> None:
+        """Anuncia as coleções alteradas (chamado com o lock do arquivo)."""
+        stamp = self._stamp
+        collections = stamp["collections"]
+        for name in changed | rewritten:
+            entry = collections.setdefault(name, {"changes": 0, "snapshot": 0})
+            entry["changes"] += 1
+            if name in rewritten:
+                entry["snapshot"] += 1
+        if ranges is not None:
+            for name, bounds in ranges.items():
+                collections.setdefault(name, {"changes": 0, "snapshot": 0})["range"] = bounds
+            stamp["document"] = list(self._document_stat)
+
+        tmp_path = self._stamp_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stamp, f)
+        os.replace(tmp_path, self._stamp_path)
+        self._stamp_stat = self._stat_key(self._stamp_path)
+
+    def is_stale(self) -> bool:
+        """Indica (com um stat) se outro processo gravou desde a última leitura."""
+        return self._shared and self._stat_key(self._stamp_path) != self._stamp_stat
+
+    def refresh(self) -> None:
+        """Recarrega as coleções alteradas por outros processos."""
+        if not self._shared:
+            return
+        with self.lock:
+            if self._file_lock_depth:
+                # Um batch deste processo está com o lock: já está atualizado
+                return
+            with self._file_locked(fcntl.LOCK_SH):
+                # Edições externas ficam para o watcher ou para o próximo
+                # batch: aplicá-las exige regravar o documento
+                self._refresh_locked(external=False)
+
+    def _refresh_locked(self, skip: Set[str] = frozenset(), external: bool = True) -> None:
+        """
+        Aplica as alterações de outros processos (com o lock do arquivo).
+
+        Coleções cujo conteúdo no documento mudou são lidas do trecho
+        indicado no carimbo e entregues ao loader; as demais alterações
+        (ex.: journal) chegam ao loader como None. Com external=True (lock
+        exclusivo), aplica também as edições externas ao documento.
+        """
+        stat = self._stat_key(self._stamp_path)
+        if stat != self._stamp_stat:
+            self._refresh_from_stamp(skip)
+        if external:
+            # Os outros processos conhecem apenas o que está no carimbo:
+            # as coleções editadas externamente são regravadas e anunciadas
+            for name in self._check_external_locked():
+                self._dirty.add(name)
+                self._changed.add(name)
+                self._pending += 1
+
+    def _refresh_from_stamp(self, skip: Set[str]) -> None:
+        stat, stamp = self._read_stamp()
+        known = self._stamp["collections"]
+        current = stamp["collections"]
+        stale = [
+            name
+            for name, entry in current.items()
+            if entry["changes"] != known.get(name, {}).get("changes", 0)
+            and name in self._loaders
+            and name not in skip
+        ]
+        rewritten = [
+            name
+            for name in stale
+            if current[name]["snapshot"] != known.get(name, {}).get("snapshot", 0)
+        ]
+        fragments = self._read_fragments(rewritten, stamp)
+        for name in stale:
+            if name in fragments:
+                self._fragments[name] = fragments[name]
+                self._raw.pop(name, None)
+                self._loaders[name](json.loads(fragments[name]))
+            else:
+                self._loaders[name](None)
+        self._stamp = stamp
+        self._stamp_stat = stat
+        if stamp.get("document") is not None:
+            self._document_stat = tuple(stamp["document"])
+
+    def _read_fragments(
+        self, names: List[str], stamp: Dict[str, Any]
+    ) -> Dict[str, bytes]:
+        """Lê do documento apenas os trechos das coleções pedidas."""
+        if not names:
+            return {}
+        fragments = {}
+        document = stamp.get("document")
+        if document is not None and list(self._stat_key(self._file_path)) == document:
+            with open(self._file_path, "rb") as f:
+                for name in names:
+                    start, end = stamp["collections"][name]["range"]
+                    f.seek(start)
+                    fragments[name] = f.read(end - start)
+            return fragments
+
+        # Documento sem carimbo correspondente: análise completa
+        with open(self._file_path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        for name in names:
+            text = json.dumps(raw.get(name, []), ensure_ascii=False, indent=2)
+            fragments[name] = text.replace("\n", "\n  ").encode("utf-8")
+        return fragments
+
+    # --- Edições externas ---
+
+    def reload_if_changed(self) -> bool:
+        """
+        Aplica as edições feitas no arquivo fora da API (chamado pelo
+        watcher). Retorna True se o arquivo havia mudado.
+        """
+        if self._stat_key(self._file_path) == self._document_stat:
+            return False
+        if self._shared:
+            # O batch confere o arquivo com o lock exclusivo e anuncia as
+            # coleções editadas aos outros processos
+            with self.batch():
+                pass
+        else:
+            with self.lock:
+                self._check_external_locked()
+                # Uma coleção rejeitada volta ao arquivo na próxima gravação
+                flush = bool(self._pending) and self._batch_depth == 0 and self._schedule_flush()
+            if flush:
+                self.flush()
+        return True
+
+    def _check_external_locked(self) -> Set[str]:
+        """
+        Detecta e aplica uma edição externa do documento (sob o lock).
+        Retorna as coleções entregues aos loaders.
+
+        Os loaders validam a coleção inteira antes de alterar a memória;
+        uma coleção rejeitada fica como estava e é marcada como suja, para
+        que a próxima gravação devolva ao arquivo o estado da memória.
+        """
+        reloaded: Set[str] = set()
+        stat = self._stat_key(self._file_path)
+        if stat is None or stat == self._document_stat:
+            return reloaded
+        try:
+            with open(self._file_path, "rb") as f:
+                content = f.read()
+            document = json.loads(content)
+        except ValueError:
+            # Arquivo no meio de uma edição: tenta de novo na próxima vez
+            return reloaded
+
+        rejected: Dict[str, str] = {}
+        if not isinstance(document, dict):
+            rejected = {name: "o documento não é um objeto JSON" for name in self._dumpers}
+            document = {}
+        for name, incoming in document.items():
+            if name not in self._keys:
+                self._keys.append(name)
+            base = self._base(name)
+            if incoming == base:
+                continue
+            loader = self._loaders.get(name)
+            if loader is not None:
+                try:
+                    if name in self._dirty:
+                        loader(_merge_by_id(self._dumpers[name](), base, incoming))
+                    else:
+                        loader(incoming)
+                except Exception as exc:
+                    rejected[name] = f"{type(exc).__name__}: {exc}"
+                    continue
+                reloaded.add(name)
+            # O conteúdo do arquivo passa a ser a base da próxima comparação
+            self._raw[name] = incoming
+            self._fragments.pop(name, None)
+        if rejected:
+            self._reject_external(content, rejected)
+        self._document_stat = stat
+        return reloaded
+
+    def _reject_external(self, content: bytes, rejected: Dict[str, str]) -> None:
+        """Guarda o documento rejeitado e agenda a regravação das coleções."""
+        try:
+            with open(self._rejected_path, "wb") as f:
+                f.write(content)
+            kept = f"cópia em {self._rejected_path}"
+        except OSError as exc:
+            kept = f"cópia não gravada ({exc})"
+        for name, reason in rejected.items():
+            logger.warning(
+                "Edição externa da coleção '%s' em %s rejeitada (%s); %s",
+                name, self._file_path, reason, kept,
+            )
+            self._rejected_edits.labels(name).inc()
+            self._dirty.add(name)
+            self._changed.add(name)
+            self._pending += 1
+
+    def _base(self, name: str) -> Any:
+        """Conteúdo da coleção na última leitura ou gravação do documento."""
+        if name in self._raw:
+            return self._raw[name]
+        if name in self._fragments:
+            return json.loads(self._fragments[name])
+        return None
+
+    def close(self) -> None:
+        """
+        Encerra a thread de flush e persiste as alterações pendentes com
+        fsync (usado no encerramento da aplicação).
+        """
+        with self.lock:
+            self._closed = True
+            self._wakeup.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush(fsync=True)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+def _merge_by_id(current: list, base: list, incoming: list) -> list:
+    """
+    Aplica a current (memória) as entradas que mudaram de base para
+    incoming (arquivo), identificadas pelo campo "id".
+    """
+    base_by_id = {entry["id"]: entry for entry in base or ()}
+    merged = {entry["id"]: entry for entry in current}
+    incoming_ids = set()
+    for entry in incoming:
+        incoming_ids.add(entry["id"])
+        if base_by_id.get(entry["id"]) != entry:
+            merged[entry["id"]] = entry
+    for entry_id in base_by_id:
+        if entry_id not in incoming_ids:
+            merged.pop(entry_id, None)
+    return list(merged.values())
@@ -0,0 +1,49 @@
+"""
+Recarga a quente de edições externas do data.json.
+
+Quando o arquivo é editado fora da API (ex.: a equipe de merchandising
+altera preços, estoque ou inclui produtos), uma thread de fundo percebe a
+mudança comparando o stat do arquivo (mtime e tamanho) a intervalos
+regulares, sem abrir o arquivo. Ao detectar uma mudança, o store aplica
+somente as coleções e as entradas alteradas (ver
+JsonDocumentStore.reload_if_changed), sem reiniciar a aplicação.
+"""
+
+import threading
+from typing import Optional
+from .json_document_store import JsonDocumentStore
+
+
+class JsonDocumentWatcher:
+    """Verifica periodicamente se o documento foi editado fora da API."""
+
+    def __init__(self, store: JsonDocumentStore, interval: float = 1.0):
+        self._store = store
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Inicia a verificação em uma thread de fundo."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="json-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Interrompe a verificação (usado no encerramento)."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._store.reload_if_changed()
+            except (OSError, ValueError, KeyError, TypeError):
+                # Arquivo inacessível ou com entradas inválidas: o estado
+                # atual é mantido e a edição é reavaliada na próxima volta
+                pass
@@ -3,59 +3,194 @@ Adapter JSON para o repositório de pedidos.
 
 Princípio LSP: Substituível por qualquer implementação de OrderRepositoryPort.
 Princípio DIP: Implementa a interface definida no domínio.
+
+Os pedidos são persistidos em um journal append-only (ver OrderJournal):
+o data.json guarda apenas o snapshot, atualizado na compactação.
 """
 
-import json
-from typing import List, Optional
+import bisect
+import os
+from typing import Dict, List, Optional, Tuple
 from domain.ports import OrderRepositoryPort
 from domain.entities.order import Order
+from domain.pagination import (
+    ORDER_SORT_FIELDS,
+    Page,
+    decode_order_cursor,
+    encode_keyset_cursor,
+    parse_sort,
+)
+from .json_document_store import JsonDocumentStore
+from .order_journal import OrderJournal
 
 
 class JsonOrderRepository(OrderRepositoryPort):
     """Implementação do repositório de pedidos usando arquivo JSON."""
 
-    def __init__(self, json_file_path: str):
-        self._file_path = json_file_path
-        self._orders: List[Order] = []
-        self._load_data()
+    def __init__(self, store: JsonDocumentStore, compact_every: int = 1000):
+        self._store = store
+        self._compact_every = compact_every
+        # No modo "sync" cada registro é sincronizado ao ser anexado; nos
+        # modos de fundo, pelo group commit do store
+        self._journal = OrderJournal(
+            os.path.splitext(store.file_path)[0] + ".orders.journal",
+            fsync=store.durability == "sync",
+            metrics=store.metrics,
+        )
+        # Índice de chave primária: id -> pedido (preserva a ordem de criação)
+        self._orders: Dict[str, Order] = {}
+        # Índice secundário: user_id -> ids dos pedidos, ordenados por
+        # (created_at, id); a paginação do histórico é uma busca binária
+        self._ids_by_user: Dict[str, List[str]] = {}
+        self._load_data(self._store.collection("orders"))
+        self._store.register("orders", self._dump_data, self._reload)
+        self._store.add_sync_hook(self._journal.sync)
+
+    def _load_data(self, snapshot: list) -> None:
+        """Carrega o snapshot do documento JSON e aplica o journal sobre ele."""
+        raw_orders: Dict[str, dict] = {o["id"]: o for o in snapshot}
+        for record in self._journal.replay():
+            raw_orders[record["order"]["id"]] = record["order"]
+
+        orders = {
+            order_id: Order.from_dict(raw) for order_id, raw in raw_orders.items()
+        }
+        ids_by_user: Dict[str, List[str]] = {}
+        for order in orders.values():
+            ids_by_user.setdefault(order.user_id, []).append(order.id)
+        for ids in ids_by_user.values():
+            # Já estão quase sempre em ordem: o sort é praticamente linear
+            ids.sort(key=lambda order_id: self._key(orders[order_id]))
+        self._ids_by_user = ids_by_user
+        self._orders = orders
+
+    def _reload(self, snapshot: Optional[list]) -> None:
+        """
+        Aplica os pedidos gravados por outro processo: um snapshot novo
+        (compactação) recarrega tudo; senão basta ler o final do journal.
+        """
+        if snapshot is not None:
+            self._load_data(snapshot)
+        elif self._journal.size() < self._journal.offset:
+            # Journal truncado sem snapshot novo: os registros são estados
+            # completos, então reaplicá-los sobre a memória é seguro
+            self._load_data(self._dump_data())
+        else:
+            for record in self._journal.replay(self._journal.offset):
+                self._put(Order.from_dict(record["order"]))
+
+    def _put(self, order: Order) -> None:
+        previous = self._orders.get(order.id)
+        self._orders[order.id] = order
+        if previous is None:
+            self._index(order)
+        elif previous.user_id != order.user_id:
+            self._move_to_user(order, previous.user_id)
+
+    @staticmethod
+    def _key(order: Order) -> Tuple[str, str]:
+        return order.created_at, order.id
 
-    def _load_data(self) -> None:
-        """Carrega os dados do arquivo JSON."""
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self._orders = [Order.from_dict(o) for o in data.get("orders", [])]
+    def _order_key(self, order_id: str) -> Tuple[str, str]:
+        return self._key(self._orders[order_id])
 
-    def _save_data(self) -> None:
-        """Persiste os dados no arquivo JSON."""
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    def _index(self, order: Order) -> None:
+        """Inclui o pedido no índice do usuário, mantendo a ordem."""
+        ids = self._ids_by_user.setdefault(order.user_id, [])
+        if not ids or self._order_key(ids[-1]) <= self._key(order):
+            # Caso comum: o pedido novo é o mais recente
+            ids.append(order.id)
+        else:
+            bisect.insort(ids, order.id, key=self._order_key)
 
-        data["orders"] = [o.to_dict() for o in self._orders]
+    def _dump_data(self) -> list:
+        """Serializa a coleção (somente na compactação do journal)."""
+        return [o.to_dict() for o in self._orders.values()]
 
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _save_data(self, order: Order) -> None:
+        """Anexa o estado atual do pedido ao journal (custo O(1))."""
+        # O lock do store impede que um flush concorrente grave um snapshot
+        # entre o append e a eventual compactação.
+        with self._store.lock:
+            self._journal.append({"op": "put", "order": order.to_dict()})
+            if self._journal.records >= self._compact_every:
+                self._compact()
+            else:
+                self._store.mark_changed("orders")
+
+    def _compact(self) -> None:
+        """
+        Compacta o journal em um snapshot no data.json e trunca o log.
+
+        A escrita do snapshot é atômica (arquivo temporário + rename). Se o
+        processo cair entre o rename e o truncamento, o replay apenas
+        reaplica registros já presentes no snapshot.
+        """
+        self._store.mark_dirty("orders")
+        self._store.flush()
+        self._journal.reset()
 
     def create(self, order: Order) -> Order:
         """Cria um novo pedido."""
-        self._orders.append(order)
-        self._save_data()
+        with self._store.batch():
+            self._orders[order.id] = order
+            self._index(order)
+            self._save_data(order)
         return order
 
     def get_by_id(self, order_id: str) -> Optional[Order]:
         """Retorna um pedido pelo ID."""
-        for order in self._orders:
-            if order.id == order_id:
-                return order
-        return None
+        return self._orders.get(order_id)
 
     def get_by_user_id(self, user_id: str) -> List[Order]:
         """Retorna todos os pedidos de um usuário."""
-        return [o for o in self._orders if o.user_id == user_id]
+        return [self._orders[i] for i in self._ids_by_user.get(user_id, [])]
+
+    def get_page_by_user_id(
+        self,
+        user_id: str,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Order]:
+        """
+        Página do histórico pelo índice ordenado do usuário: a posição do
+        cursor é achada por busca binária, então cada página custa
+        O(log n + limit), independentemente de quantas vieram antes.
+        """
+        _, descending = parse_sort(sort, ORDER_SORT_FIELDS)
+        ids = self._ids_by_user.get(user_id, [])
+        after = decode_order_cursor(cursor, sort) if cursor else None
+
+        if descending:
+            end = len(ids) if after is None else bisect.bisect_left(ids, after, key=self._order_key)
+            start = 0 if limit is None else max(0, end - limit - 1)
+            page = ids[start:end][::-1]
+        else:
+            start = 0 if after is None else bisect.bisect_right(ids, after, key=self._order_key)
+            end = len(ids) if limit is None else start + limit + 1
+            page = ids[start:end]
+
+        next_cursor = None
+        if limit is not None and len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_keyset_cursor(sort, *self._order_key(page[-1]))
+        return Page(
+            items=[self._orders[i] for i in page], total=len(ids), next_cursor=next_cursor
+        )
 
     def update(self, order: Order) -> None:
         """Atualiza um pedido."""
-        for i, o in enumerate(self._orders):
-            if o.id == order.id:
-                self._orders[i] = order
-                self._save_data()
+        with self._store.batch():
+            previous = self._orders.get(order.id)
+            if previous is None:
                 return
+            self._orders[order.id] = order
+            if previous.user_id != order.user_id:
+                self._move_to_user(order, previous.user_id)
+            self._save_data(order)
+
+    def _move_to_user(self, order: Order, previous_user_id: str) -> None:
+        """Transfere o pedido entre usuários no índice secundário (caso raro)."""
+        self._ids_by_user[previous_user_id].remove(order.id)
+        self._index(order)
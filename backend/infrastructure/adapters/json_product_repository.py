@@ -8,75 +8,337 @@ comportamento esperado.
 Princípio DIP: Implementa a interface definida no domínio.
 """
 
-import json
-from typing import List, Optional
+import itertools
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
 from domain.ports import ProductRepositoryPort
 from domain.entities.product import Product
+from domain.exceptions import (
+    InsufficientStockException,
+    InvalidCursorException,
+    ProductNotFoundException,
+)
+from domain.pagination import (
+    PRODUCT_SORT_FIELDS,
+    Page,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    paginate_by_offset,
+    parse_sort,
+)
+from .json_document_store import JsonDocumentStore
+from .product_column_index import ProductColumnIndex
+from .product_facet_index import ProductFacetIndex
+from .product_search_index import ProductSearchIndex
 
 
 class JsonProductRepository(ProductRepositoryPort):
     """Implementação do repositório de produtos usando arquivo JSON."""
 
-    def __init__(self, json_file_path: str):
-        self._file_path = json_file_path
-        self._products: List[Product] = []
-        self._load_data()
+    def __init__(self, store: JsonDocumentStore, columnar: bool = False):
+        self._store = store
+        # Motor dos filtros e ordenações: índices de facetas ou, com
+        # columnar=True, colunas NumPy (catálogos grandes)
+        self._facet_index_class = ProductColumnIndex if columnar else ProductFacetIndex
+        # Índice de chave primária: id -> produto (preserva a ordem de inserção)
+        self._products: Dict[str, Product] = {}
+        self._search_index = ProductSearchIndex()
+        self._facet_index = self._facet_index_class()
+        # Versões para validação de cache: o contador do catálogo e, para
+        # cada produto alterado, o valor do contador na última alteração
+        self._version_counter = itertools.count(1)
+        self._version = 0
+        self._product_versions: Dict[str, int] = {}
+        # Um lock por produto para as movimentações de estoque: checkouts
+        # com produtos diferentes não esperam uns pelos outros
+        self._stock_locks: Dict[str, threading.Lock] = {}
+        self._load_data(self._store.collection("products"))
+        self._store.register("products", self._dump_data, self._reload)
 
-    def _load_data(self) -> None:
-        """Carrega os dados do arquivo JSON."""
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self._products = [Product.from_dict(p) for p in data.get("products", [])]
+    def _load_data(self, raw_products: list) -> None:
+        """Carrega os dados do documento JSON compartilhado."""
+        products: Dict[str, Product] = {}
+        search_index = ProductSearchIndex()
+        for raw in raw_products:
+            product = Product.from_dict(raw)
+            products[product.id] = product
+            search_index.add(product)
+        search_index.prepare()
+        facet_index = self._facet_index_class()
+        facet_index.load(products.values())
+        # Estruturas montadas por inteiro antes de substituir as atuais
+        self._search_index = search_index
+        self._facet_index = facet_index
+        self._products = products
 
-    def _save_data(self) -> None:
-        """Persiste os dados no arquivo JSON."""
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    def _reload(self, raw_products: Optional[list]) -> None:
+        """
+        Aplica a coleção gravada por outro processo ou editada fora da API,
+        alterando somente os produtos novos, alterados ou removidos: os
+        índices são atualizados produto a produto e só esses produtos
+        ganham versão nova (os demais fragmentos em cache continuam válidos).
+        """
+        if raw_products is None:
+            return
+        incoming = {raw["id"]: raw for raw in raw_products}
+        # Converte tudo antes de alterar qualquer estrutura: uma entrada
+        # inválida descarta a recarga inteira
+        changed = [
+            Product.from_dict(raw)
+            for product_id, raw in incoming.items()
+            if product_id not in self._products
+            or self._products[product_id].to_dict() != raw
+        ]
+        removed = [i for i in list(self._products) if i not in incoming]
+        if not changed and not removed:
+            return
+        self._apply(changed, removed)
+        if removed:
+            # A listagem muda mesmo sem nenhum produto alterado
+            self._version = next(self._version_counter)
 
-        data["products"] = [p.to_dict() for p in self._products]
+    def _apply(self, changed: List[Product], removed: Iterable[str] = ()) -> None:
+        """
+        Inclui ou substitui produtos e remove outros, no dicionário e nos
+        índices, com os locks de estoque desses produtos: uma baixa de
+        estoque concorrente termina antes da troca ou começa depois dela,
+        e nunca é aplicada a um objeto que já saiu do catálogo.
 
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        O dicionário é alterado no lugar. As leituras copiam os valores de
+        uma vez (list()) e ignoram ids que os índices ainda devolvem, mas
+        que já foram removidos (ver _materialize).
+        """
+        removed = list(removed)
+        with self._stock_locked({p.id for p in changed}.union(removed)):
+            for product_id in removed:
+                self._search_index.remove(product_id)
+                self._facet_index.remove(product_id)
+                self._products.pop(product_id, None)
+                self._product_versions.pop(product_id, None)
+            for product in changed:
+                self._products[product.id] = product
+                self._search_index.add(product)
+                self._facet_index.add(product)
+                self._bump_version(product.id)
+            self._search_index.prepare()
+
+    def _dump_data(self) -> list:
+        """Serializa a coleção para o flush do documento."""
+        # list() copia os valores de uma vez: um upsert_many concorrente
+        # pode incluir produtos durante a serialização
+        return [p.to_dict() for p in list(self._products.values())]
+
+    def _save_data(self) -> None:
+        """Marca a coleção como alterada; o store agrupa e grava no arquivo."""
+        self._store.mark_dirty("products")
 
     def get_all(self) -> List[Product]:
         """Retorna todos os produtos."""
-        return list(self._products)
+        return list(self._products.values())
 
     def get_by_id(self, product_id: str) -> Optional[Product]:
         """Retorna um produto pelo ID."""
-        for product in self._products:
-            if product.id == product_id:
-                return product
-        return None
+        return self._products.get(product_id)
+
+    def count(self) -> int:
+        """Quantidade de produtos no catálogo."""
+        return len(self._products)
 
     def get_by_category(self, category: str) -> List[Product]:
         """Retorna produtos filtrados por categoria."""
-        return [
-            p for p in self._products
-            if p.category.lower() == category.lower()
-        ]
+        return self._by_ids(self._facet_index.filter(category=category))
 
     def search(self, query: str) -> List[Product]:
-        """Busca produtos por nome ou descrição."""
-        query_lower = query.lower()
-        return [
-            p for p in self._products
-            if query_lower in p.name.lower()
-            or query_lower in p.description.lower()
-            or query_lower in p.brand.lower()
-        ]
+        """Busca produtos por nome, marca ou descrição (índice invertido)."""
+        return self._materialize(self._search_index.search(query))
 
     def update(self, product: Product) -> None:
         """Atualiza um produto."""
-        for i, p in enumerate(self._products):
-            if p.id == product.id:
-                self._products[i] = product
+        with self._store.batch():
+            if product.id in self._products:
+                self._apply([product])
+                self._save_data()
+
+    def upsert_many(self, products: List[Product]) -> int:
+        """Inclui ou atualiza vários produtos com uma única marcação para o flush."""
+        with self._store.batch():
+            created = len({p.id for p in products if p.id not in self._products})
+            if products:
+                self._apply(products)
                 self._save_data()
-                return
+        return created
+
+    def reserve_stock(self, quantities: Dict[str, int]) -> None:
+        """Baixa o estoque de todos os produtos, ou de nenhum."""
+        with self._store.batch():
+            with self._stock_locked(quantities):
+                # Valida tudo antes de alterar qualquer produto
+                reserved = []
+                for product_id, quantity in quantities.items():
+                    product = self._products.get(product_id)
+                    if product is None:
+                        raise ProductNotFoundException(product_id)
+                    if quantity <= 0:
+                        raise ValueError("Quantidade deve ser maior que zero.")
+                    if product.stock < quantity:
+                        raise InsufficientStockException(product_id, product.stock, quantity)
+                    reserved.append((product, quantity))
+
+                for product, quantity in reserved:
+                    product.decrease_stock(quantity)
+                    self._bump_version(product.id)
+            # O estoque não é indexado: basta persistir (fora dos locks de
+            # estoque, ver _stock_locked)
+            self._save_data()
+
+    def release_stock(self, quantities: Dict[str, int]) -> None:
+        """Devolve as quantidades ao estoque (ignora produtos inexistentes)."""
+        with self._store.batch():
+            with self._stock_locked(quantities):
+                for product_id, quantity in quantities.items():
+                    product = self._products.get(product_id)
+                    if product is not None:
+                        product.stock += quantity
+                        self._bump_version(product_id)
+            self._save_data()
+
+    @contextmanager
+    def _stock_locked(self, product_ids: Iterable[str]) -> Iterator[None]:
+        """
+        Adquire os locks dos produtos sempre em ordem de id (sem deadlock).
+
+        Ordem entre locks: o lock do store vem antes (_reload roda sob ele);
+        quem segura locks de estoque não pode pedir o lock do store (por
+        isso _save_data é chamado depois de liberá-los).
+        """
+        with ExitStack() as stack:
+            for product_id in sorted(product_ids):
+                lock = self._stock_locks.get(product_id)
+                if lock is None:
+                    lock = self._stock_locks.setdefault(product_id, threading.Lock())
+                stack.enter_context(lock)
+            yield
+
+    def _bump_version(self, product_id: str) -> None:
+        # next() em itertools.count é atômico: updates concorrentes nunca
+        # recebem a mesma versão
+        self._version = next(self._version_counter)
+        self._product_versions[product_id] = self._version
+
+    def catalog_version(self) -> int:
+        """Versão do catálogo (incrementada a cada update)."""
+        return self._version
+
+    def product_version(self, product_id: str) -> Optional[int]:
+        """Versão de um produto (0 se nunca foi alterado neste processo)."""
+        if product_id not in self._products:
+            return None
+        return self._product_versions.get(product_id, 0)
 
     def get_categories(self) -> List[str]:
         """Retorna todas as categorias disponíveis."""
-        categories = set()
-        for product in self._products:
-            categories.add(product.category)
-        return sorted(list(categories))
+        return self._facet_index.categories()
+
+    def filter_products(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Product]:
+        """
+        Filtra produtos com múltiplos critérios usando os índices de facetas.
+
+        Mesma semântica da implementação padrão do port: com `search`, a
+        categoria é ignorada e a ordem de relevância é preservada.
+        """
+        return self._by_ids(
+            self._filtered_ids(category, gender, min_price, max_price, size, search)
+        )
+
+    def filter_products_page(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Product]:
+        """
+        Página ordenada pelo motor de filtros (índice de facetas ou colunas).
+
+        O cursor guarda a chave e o id do último item entregue (keyset), então
+        cada página custa o mesmo, independentemente de quantas vieram antes.
+        A ordem por relevância da busca não tem chave estável e continua
+        paginada por deslocamento.
+        """
+        field, descending = parse_sort(sort, PRODUCT_SORT_FIELDS)
+        if search and field is None:
+            ids = self._filtered_ids(category, gender, min_price, max_price, size, search)
+            return paginate_by_offset(self._by_ids(ids), sort, limit, cursor)
+
+        after = decode_keyset_cursor(cursor, sort) if cursor else None
+        try:
+            entries, total = self._facet_index.filtered_page(
+                category=None if search else category,
+                gender=gender,
+                min_price=min_price,
+                max_price=max_price,
+                size=size,
+                within=self._search_index.search(search) if search else None,
+                field=field,
+                descending=descending,
+                after=after,
+                limit=None if limit is None else limit + 1,
+            )
+        except TypeError:
+            # Chave do cursor de tipo incompatível com o campo ordenado
+            raise InvalidCursorException()
+
+        next_cursor = None
+        if limit is not None and len(entries) > limit:
+            entries = entries[:limit]
+            key, last_id = entries[-1]
+            next_cursor = encode_keyset_cursor(sort, key, last_id)
+        return Page(
+            items=self._materialize(i for _, i in entries),
+            total=total,
+            next_cursor=next_cursor,
+        )
+
+    def _filtered_ids(
+        self,
+        category: Optional[str],
+        gender: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+        size: Optional[str],
+        search: Optional[str],
+    ) -> Optional[List[str]]:
+        return self._facet_index.filter(
+            category=None if search else category,
+            gender=gender,
+            min_price=min_price,
+            max_price=max_price,
+            size=size,
+            within=self._search_index.search(search) if search else None,
+        )
+
+    def _by_ids(self, product_ids: Optional[List[str]]) -> List[Product]:
+        """Materializa ids em produtos (None significa o catálogo inteiro)."""
+        if product_ids is None:
+            return list(self._products.values())
+        return self._materialize(product_ids)
+
+    def _materialize(self, product_ids: Iterable[str]) -> List[Product]:
+        """Produtos dos ids, ignorando os removidos depois da consulta aos índices."""
+        products = self._products
+        return [p for p in map(products.get, product_ids) if p is not None]
+
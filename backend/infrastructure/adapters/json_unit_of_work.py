@@ -0,0 +1,25 @@
+"""
+Adapter JSON para a unidade de trabalho.
+
+Princípio DIP: Implementa UnitOfWorkPort sobre o JsonDocumentStore.
+
+As escritas de todos os repositórios JSON dentro da unidade são
+agrupadas em um único flush do data.json. Não há rollback: os dados em
+memória já refletem cada operação, e o serviço desfaz o que for preciso
+(ex.: devolve o estoque reservado se o pedido não puder ser criado).
+"""
+
+from typing import ContextManager
+from domain.ports import UnitOfWorkPort
+from .json_document_store import JsonDocumentStore
+
+
+class JsonUnitOfWork(UnitOfWorkPort):
+    """Unidade de trabalho como um batch do documento JSON compartilhado."""
+
+    def __init__(self, store: JsonDocumentStore):
+        self._store = store
+
+    def transaction(self) -> ContextManager[None]:
+        """Agrupa as escritas do bloco em um único flush."""
+        return self._store.batch()
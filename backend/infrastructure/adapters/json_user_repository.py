@@ -5,60 +5,96 @@ Princípio LSP: Substituível por qualquer implementação de UserRepositoryPort
 Princípio DIP: Implementa a interface definida no domínio.
 """
 
-import json
-from typing import Optional
+from typing import Dict, Optional
 from domain.ports import UserRepositoryPort
 from domain.entities.user import User
+from domain.exceptions import UserAlreadyExistsException
+from .json_document_store import JsonDocumentStore
+
+
+def _email_key(email: str) -> str:
+    """Normaliza o email para comparação sem diferenciar maiúsculas."""
+    return email.casefold()
 
 
 class JsonUserRepository(UserRepositoryPort):
     """Implementação do repositório de usuários usando arquivo JSON."""
 
-    def __init__(self, json_file_path: str):
-        self._file_path = json_file_path
-        self._users: list[User] = []
-        self._load_data()
+    def __init__(self, store: JsonDocumentStore):
+        self._store = store
+        # Índice de chave primária: id -> usuário
+        self._users: Dict[str, User] = {}
+        # Índice secundário: email normalizado (casefold) -> id do usuário
+        self._ids_by_email: Dict[str, str] = {}
+        self._email_keys: Dict[str, str] = {}
+        self._load_data(self._store.collection("users"))
+        self._store.register("users", self._dump_data, self._reload)
 
-    def _load_data(self) -> None:
-        """Carrega os dados do arquivo JSON."""
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self._users = [User.from_dict(u) for u in data.get("users", [])]
+    def _load_data(self, raw_users: list) -> None:
+        """Carrega os dados do documento JSON compartilhado."""
+        users: Dict[str, User] = {}
+        ids_by_email: Dict[str, str] = {}
+        email_keys: Dict[str, str] = {}
+        for raw in raw_users:
+            user = User.from_dict(raw)
+            users[user.id] = user
+            key = _email_key(user.email)
+            ids_by_email.setdefault(key, user.id)
+            email_keys[user.id] = key
+        self._ids_by_email = ids_by_email
+        self._email_keys = email_keys
+        self._users = users
 
-    def _save_data(self) -> None:
-        """Persiste os dados no arquivo JSON."""
-        with open(self._file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    def _reload(self, raw_users: Optional[list]) -> None:
+        """Recarrega a coleção gravada por outro processo."""
+        if raw_users is not None:
+            self._load_data(raw_users)
 
-        data["users"] = [u.to_dict_with_password() for u in self._users]
+    def _dump_data(self) -> list:
+        """Serializa a coleção para o flush do documento."""
+        return [u.to_dict_with_password() for u in self._users.values()]
 
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _save_data(self) -> None:
+        """Marca a coleção como alterada; o store agrupa e grava no arquivo."""
+        self._store.mark_dirty("users")
 
     def get_by_id(self, user_id: str) -> Optional[User]:
         """Retorna um usuário pelo ID."""
-        for user in self._users:
-            if user.id == user_id:
-                return user
-        return None
+        return self._users.get(user_id)
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Retorna um usuário pelo email."""
-        for user in self._users:
-            if user.email.lower() == email.lower():
-                return user
-        return None
+        user_id = self._ids_by_email.get(_email_key(email))
+        return self._users.get(user_id) if user_id is not None else None
 
     def create(self, user: User) -> User:
-        """Cria um novo usuário."""
-        self._users.append(user)
-        self._save_data()
+        """Cria um novo usuário (UserAlreadyExistsException se o email já existe)."""
+        # A conferência e a inclusão acontecem sob o lock do store: dois
+        # cadastros simultâneos com o mesmo email não passam os dois
+        with self._store.batch(), self._store.lock:
+            if _email_key(user.email) in self._ids_by_email:
+                raise UserAlreadyExistsException(user.email)
+            self._users[user.id] = user
+            self._index_email(user)
+            self._save_data()
         return user
 
     def update(self, user: User) -> None:
         """Atualiza um usuário."""
-        for i, u in enumerate(self._users):
-            if u.id == user.id:
-                self._users[i] = user
+        with self._store.batch():
+            if user.id in self._users:
+                self._users[user.id] = user
+                self._index_email(user)
                 self._save_data()
-                return
+
+    def _index_email(self, user: User) -> None:
+        """Mantém o índice de email coerente, inclusive se o email mudou."""
+        key = _email_key(user.email)
+        previous = self._email_keys.get(user.id)
+        if previous == key:
+            return
+        if previous is not None and self._ids_by_email.get(previous) == user.id:
+            del self._ids_by_email[previous]
+        # Em caso de emails duplicados, prevalece o primeiro cadastrado
+        self._ids_by_email.setdefault(key, user.id)
+        self._email_keys[user.id] = key
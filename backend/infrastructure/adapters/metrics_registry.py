@@ -0,0 +1,300 @@
+"""
+Registro de métricas no formato texto do Prometheus.
+
+Implementação mínima, sem dependências externas, dos três tipos usados
+pela aplicação:
+
+- Counter: valor que só cresce (ex.: gravações, bytes gravados);
+- Gauge: valor que sobe e desce (ex.: requisições em andamento);
+- Histogram: distribuição em faixas cumulativas, com soma e contagem
+  (ex.: latência por rota).
+
+Cada métrica pode ter rótulos; labels(*valores) devolve a série daquela
+combinação, que quem mede no caminho quente deve guardar e reutilizar.
+Métricas calculadas na hora da coleta (tamanho do catálogo, taxa de
+acerto de caches) são registradas como funções: nada é pago por
+requisição, apenas por coleta.
+
+Os valores ficam no processo: com vários workers, cada um expõe as
+próprias métricas (o Prometheus agrega pelas instâncias).
+"""
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Faixas (s) pensadas para latências de requisição e de E/S local
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+# Função de coleta: um valor, ou um valor por combinação de rótulos
+Collector = Callable[[], Union[float, Dict[LabelValues, float]]]
+
+
+class _Value:
+    """Série de um Counter ou Gauge."""
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Buckets:
+    """Série de um Histogram."""
+
+    __slots__ = ("_lock", "_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        # Contagem não cumulativa por faixa; a última é +Inf
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class _Metric(ABC):
+    """Métrica exposta por render(): nome, tipo, rótulos e amostras."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterator[Tuple[str, LabelValues, Tuple[Tuple[str, str], ...], float]]:
+        """(sufixo, valores dos rótulos, rótulos extras, valor) de cada amostra."""
+        pass
+
+
+class _SeriesMetric(_Metric):
+    """Família de séries com o mesmo nome, indexadas pelos valores dos rótulos."""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._series: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_series(self):
+        """Cria a série de uma nova combinação de rótulos."""
+        pass
+
+    def labels(self, *values: object):
+        """Série da combinação de rótulos informada (criada na primeira vez)."""
+        series = self._series.get(values)
+        if series is not None:
+            return series
+        key = tuple(str(v) for v in values)
+        series = self._series.get(key)
+        if series is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"A métrica '{self.name}' espera os rótulos {self.labelnames}."
+                )
+            with self._lock:
+                series = self._series.setdefault(key, self._new_series())
+        return series
+
+    def samples(self):
+        for key, series in list(self._series.items()):
+            yield "", key, (), series.value
+
+
+class Counter(_SeriesMetric):
+    kind = "counter"
+
+    def _new_series(self) -> _Value:
+        return _Value()
+
+
+class Gauge(_SeriesMetric):
+    kind = "gauge"
+
+    def _new_series(self) -> _Value:
+        return _Value()
+
+
+class Histogram(_SeriesMetric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_series(self) -> _Buckets:
+        return _Buckets(self.buckets)
+
+    def samples(self):
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for key, series in list(self._series.items()):
+            with series._lock:
+                counts, total, count = list(series.counts), series.sum, series.count
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                yield "_bucket", key, (("le", bound),), cumulative
+            yield "_sum", key, (), total
+            yield "_count", key, (), count
+
+
+class _CallbackMetric(_Metric):
+    """Métrica cujos valores são lidos de uma função na hora da coleta."""
+
+    def __init__(self, name, help_text, kind: str, collect: Collector, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self.kind = kind
+        self._collect = collect
+
+    def samples(self):
+        values = self._collect()
+        if not isinstance(values, dict):
+            values = {(): values}
+        for key, value in values.items():
+            yield "", tuple(str(v) for v in key), (), value
+
+
+class MetricsRegistry:
+    """Conjunto de métricas de um processo, exposto por render()."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        # Caches acompanhados: nome -> função (acertos, falhas)
+        self._caches: Dict[str, Callable[[], Tuple[int, int]]] = {}
+
+    def _get_or_create(self, name: str, factory: Callable[[], _Metric]) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(name, lambda: Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            name, lambda: Histogram(name, help_text, labelnames, buckets)
+        )
+
+    def gauge_function(
+        self, name: str, help_text: str, collect: Collector, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Gauge calculado por collect() a cada coleta."""
+        self._get_or_create(
+            name, lambda: _CallbackMetric(name, help_text, "gauge", collect, labelnames)
+        )
+
+    def counter_function(
+        self, name: str, help_text: str, collect: Collector, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Counter lido de um contador mantido por outro componente."""
+        self._get_or_create(
+            name, lambda: _CallbackMetric(name, help_text, "counter", collect, labelnames)
+        )
+
+    def register_cache(self, name: str, stats: Callable[[], Tuple[int, int]]) -> None:
+        """
+        Acompanha um cache: stats() retorna (acertos, falhas) acumulados.
+        Expõe cache_hits_total, cache_misses_total e cache_hit_ratio.
+        """
+        with self._lock:
+            self._caches[name] = stats
+        self.counter_function(
+            "cache_hits_total", "Acertos acumulados por cache.",
+            lambda: {(n,): hits for n, (hits, _) in self._cache_stats()}, ("cache",),
+        )
+        self.counter_function(
+            "cache_misses_total", "Falhas acumuladas por cache.",
+            lambda: {(n,): misses for n, (_, misses) in self._cache_stats()}, ("cache",),
+        )
+        self.gauge_function(
+            "cache_hit_ratio", "Acertos / consultas desde o início do processo.",
+            lambda: {
+                (n,): hits / (hits + misses) if hits + misses else 0.0
+                for n, (hits, misses) in self._cache_stats()
+            },
+            ("cache",),
+        )
+
+    def _cache_stats(self) -> List[Tuple[str, Tuple[int, int]]]:
+        return [(name, stats()) for name, stats in list(self._caches.items())]
+
+    def render(self) -> str:
+        """Todas as métricas no formato texto do Prometheus (versão 0.0.4)."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, key, extra, value in metric.samples():
+                pairs = list(zip(metric.labelnames, key)) + list(extra)
+                labels = ",".join(f'{n}="{_escape_label(v)}"' for n, v in pairs)
+                name = metric.name + suffix
+                lines.append(
+                    f"{name}{{{labels}}} {_format_value(value)}" if labels
+                    else f"{name} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None:
+        return "NaN"
+    value = float(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,73 @@
+"""
+Leitura e escrita de NDJSON (um objeto JSON por linha).
+
+Usado na exportação e na importação do catálogo (rotas e CLI). A leitura
+consome os bytes em pedaços e entrega um registro por vez, e a escrita
+codifica um lote por vez: a memória usada não depende do tamanho do
+arquivo, apenas do maior registro (limitado por max_line).
+"""
+
+import json
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Iterable
+from domain.exceptions import InvalidImportRecordException
+
+MEDIA_TYPE = "application/x-ndjson"
+
+# Mesmo formato da API: UTF-8, sem espaços
+_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+# Tamanho máximo de uma linha (um produto tem poucos KB)
+MAX_LINE = 1 << 20
+
+
+def encode_lines(records: Iterable[dict]) -> bytes:
+    """Codifica os registros como linhas NDJSON."""
+    return "".join([_ENCODER.encode(r) + "\n" for r in records]).encode("utf-8")
+
+
+async def read_file(file: BinaryIO, chunk_size: int = 1 << 16) -> AsyncIterator[bytes]:
+    """Lê um arquivo em pedaços, no formato esperado por iter_records."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def iter_records(
+    chunks: AsyncIterable[bytes], max_line: int = MAX_LINE
+) -> AsyncIterator[dict]:
+    """
+    Decodifica NDJSON recebido em pedaços arbitrários (ex.: corpo de uma
+    requisição). Linhas em branco são ignoradas; uma linha que não é JSON
+    válido, ou maior que max_line, interrompe a leitura com
+    InvalidImportRecordException (numerada como os registros).
+    """
+    number = 0
+    pending = b""
+
+    def decode(line: bytes) -> dict:
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise InvalidImportRecordException(number, "JSON inválido")
+
+    async for chunk in chunks:
+        pending += chunk
+        start = 0
+        while True:
+            end = pending.find(b"\n", start)
+            if end < 0:
+                break
+            line = pending[start:end].strip()
+            start = end + 1
+            if line:
+                number += 1
+                yield decode(line)
+        pending = pending[start:]
+        if len(pending) > max_line:
+            raise InvalidImportRecordException(number + 1, "linha longa demais")
+    line = pending.strip()
+    if line:
+        number += 1
+        yield decode(line)
@@ -0,0 +1,190 @@
+"""
+Journal append-only de pedidos.
+
+Em vez de reescrever o data.json inteiro a cada pedido criado ou
+atualizado, cada mutação é anexada como um registro (uma linha JSON)
+em um segmento de log. O custo de escrita por pedido passa a ser O(1),
+independente do tamanho do histórico.
+
+Periodicamente o log é compactado em um snapshot (a chave "orders" do
+data.json) e truncado. Na inicialização, o estado é reconstruído
+aplicando o log sobre o snapshot.
+
+Com fsync=False, append() apenas entrega a linha ao sistema operacional;
+quem usa o journal decide quando chamar sync() (ver JsonDocumentStore).
+
+Com um MetricsRegistry, cada append e cada sync são medidos (quantidade,
+bytes e duração, rotulados pela coleção do journal).
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Iterator, Optional
+from .metrics_registry import MetricsRegistry
+
+
+class OrderJournal:
+    """Segmento de log append-only com um registro JSON por linha."""
+
+    def __init__(
+        self,
+        journal_path: str,
+        fsync: bool = True,
+        metrics: Optional[MetricsRegistry] = None,
+        collection: str = "orders",
+    ):
+        self._path = journal_path
+        self._fsync = fsync
+        metrics = metrics or MetricsRegistry()
+        self._appends = metrics.counter(
+            "journal_appends_total", "Registros anexados ao journal.", ("collection",)
+        ).labels(collection)
+        self._append_bytes = metrics.counter(
+            "journal_append_bytes_total", "Bytes anexados ao journal.", ("collection",)
+        ).labels(collection)
+        self._append_seconds = metrics.histogram(
+            "journal_append_seconds",
+            "Duração de um append no journal (com fsync no modo sync).",
+            ("collection",),
+        ).labels(collection)
+        self._sync_seconds = metrics.histogram(
+            "journal_sync_seconds", "Duração do fsync do journal no group commit.",
+            ("collection",),
+        ).labels(collection)
+        self._lock = threading.Lock()
+        self._file = None
+        self._records = 0
+        # Posição (em bytes) até onde o log já foi lido ou escrito
+        self._offset = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def records(self) -> int:
+        """Quantidade de registros no log desde a última compactação."""
+        return self._records
+
+    @property
+    def offset(self) -> int:
+        """Posição no arquivo após o último registro lido ou anexado."""
+        return self._offset
+
+    def size(self) -> int:
+        """Tamanho atual do arquivo (inclui registros de outros processos)."""
+        try:
+            return os.path.getsize(self._path)
+        except FileNotFoundError:
+            return 0
+
+    def replay(self, offset: int = 0) -> Iterator[dict]:
+        """
+        Percorre os registros do log na ordem em que foram gravados,
+        a partir de offset (0 = desde o início).
+
+        Uma última linha incompleta (queda no meio de uma escrita) nunca
+        chegou a ser confirmada: o arquivo é truncado no fim do último
+        registro completo (com fsync), para que o próximo append não seja
+        colado aos bytes parciais. Linhas inválidas no meio do log (gravadas
+        assim por versões anteriores) são recuperadas pelo último registro
+        que contêm, ou ignoradas.
+        """
+        if offset == 0:
+            self._records = 0
+        self._offset = offset
+        if not os.path.exists(self._path):
+            return
+        torn = False
+        with open(self._path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    torn = True
+                    break
+                self._offset += len(line)
+                record = _parse_record(line.strip())
+                if record is not None:
+                    self._records += 1
+                    yield record
+        if torn:
+            self._truncate_torn_tail()
+
+    def _truncate_torn_tail(self) -> None:
+        """Descarta os bytes após o último registro completo."""
+        with self._lock:
+            with open(self._path, "r+b") as f:
+                f.truncate(self._offset)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def append(self, record: dict) -> None:
+        """Anexa um registro ao final do log."""
+        data = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            start = time.perf_counter()
+            if self._file is None:
+                self._file = open(self._path, "ab")
+            self._file.write(data + b"\n")
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            self._offset = self._file.tell()
+            self._records += 1
+            self._append_seconds.observe(time.perf_counter() - start)
+        self._appends.inc()
+        self._append_bytes.inc(len(data) + 1)
+
+    def sync(self) -> None:
+        """Sincroniza no disco os registros já anexados (group commit)."""
+        with self._lock:
+            if self._file is not None:
+                start = time.perf_counter()
+                os.fsync(self._file.fileno())
+                self._sync_seconds.observe(time.perf_counter() - start)
+
+    def reset(self) -> None:
+        """Trunca o log (chamado após a compactação em snapshot)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            # Trunca e reabre em modo append: um handle sem O_APPEND
+            # escreveria na própria posição, não no fim atual do arquivo
+            open(self._path, "wb").close()
+            self._file = open(self._path, "ab")
+            self._records = 0
+            self._offset = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# Início de cada registro: em JSON compacto, '{"op":' dentro de um texto
+# aparece escapado ('{\"op\":'), então só marca o começo de um registro
+_RECORD_START = b'{"op":'
+
+
+def _parse_record(line: bytes) -> Optional[dict]:
+    """
+    Registro de uma linha do log, ou None para uma linha vazia ou inválida.
+
+    Uma linha com bytes parciais seguidos de um registro completo (o append
+    feito após uma queda, antes de o log ser truncado) devolve o registro.
+    """
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        start = line.rfind(_RECORD_START)
+        if start <= 0:
+            return None
+        try:
+            return json.loads(line[start:])
+        except ValueError:
+            return None
@@ -0,0 +1,163 @@
+"""
+Estratégias de KDF (key derivation function) para senhas.
+
+Princípio OCP: Uma nova KDF é uma nova estratégia; o pool que executa o
+cálculo (ver PooledPasswordHasher) não muda.
+
+Os hashes são gravados no formato "esquema$parâmetros$salt$hash", o que
+permite conferir hashes antigos depois de trocar a KDF ou os parâmetros:
+
+    pbkdf2_sha256$600000$<salt>$<hash>
+    scrypt$16384$8$1$<salt>$<hash>
+
+Os hashes SHA-256 sem salt das versões anteriores (64 dígitos hex) são
+reconhecidos por Sha256Kdf, que só serve para conferir e migrar. Trocar
+a KDF configurada não invalida as senhas: as demais KDFs continuam
+conferindo os hashes delas (ver legacy_kdfs).
+
+As estratégias são objetos simples e serializáveis (pickle), para que o
+cálculo possa rodar em outro processo.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+from abc import ABC, abstractmethod
+from typing import List
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+class PasswordKdf(ABC):
+    """Estratégia de cálculo e conferência de hashes de senha."""
+
+    scheme: str = ""
+
+    def identifies(self, password_hash: str) -> bool:
+        """Indica se o hash foi gerado por esta KDF."""
+        return password_hash.startswith(self.scheme + "$")
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        pass
+
+    @abstractmethod
+    def verify(self, password: str, password_hash: str) -> bool:
+        pass
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Indica se o hash (desta KDF) usa parâmetros diferentes dos atuais."""
+        return False
+
+
+class Pbkdf2Kdf(PasswordKdf):
+    """PBKDF2-HMAC-SHA256 (hashlib.pbkdf2_hmac)."""
+
+    scheme = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 600_000):
+        self.iterations = iterations
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(16)
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, self.iterations)
+        return f"{self.scheme}${self.iterations}${_b64encode(salt)}${_b64encode(digest)}"
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        try:
+            _, iterations, salt, expected = password_hash.split("$")
+            digest = hashlib.pbkdf2_hmac(
+                "sha256", password.encode(), _b64decode(salt), int(iterations)
+            )
+            return hmac.compare_digest(digest, _b64decode(expected))
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return password_hash.split("$")[1] != str(self.iterations)
+
+
+class ScryptKdf(PasswordKdf):
+    """scrypt (hashlib.scrypt); custo de memória de 128 * n * r bytes."""
+
+    scheme = "scrypt"
+
+    def __init__(self, n: int = 2 ** 14, r: int = 8, p: int = 1):
+        self.n = n
+        self.r = r
+        self.p = p
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r, dklen=32
+        )
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(16)
+        digest = self._derive(password, salt, self.n, self.r, self.p)
+        return (
+            f"{self.scheme}${self.n}${self.r}${self.p}$"
+            f"{_b64encode(salt)}${_b64encode(digest)}"
+        )
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        try:
+            _, n, r, p, salt, expected = password_hash.split("$")
+            digest = self._derive(password, _b64decode(salt), int(n), int(r), int(p))
+            return hmac.compare_digest(digest, _b64decode(expected))
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return password_hash.split("$")[1:4] != [str(self.n), str(self.r), str(self.p)]
+
+
+class Sha256Kdf(PasswordKdf):
+    """
+    SHA-256 sem salt das versões anteriores. Barato demais para ser a KDF
+    atual: é usado apenas para conferir (e migrar) hashes legados.
+    """
+
+    scheme = "sha256"
+
+    def identifies(self, password_hash: str) -> bool:
+        return len(password_hash) == 64 and "$" not in password_hash
+
+    def hash(self, password: str) -> str:
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        return hmac.compare_digest(self.hash(password), password_hash)
+
+
+KDFS = {
+    "pbkdf2": Pbkdf2Kdf,
+    "scrypt": ScryptKdf,
+}
+
+
+def make_kdf(name: str) -> PasswordKdf:
+    """Cria a KDF pelo nome ("pbkdf2" ou "scrypt")."""
+    try:
+        return KDFS[name]()
+    except KeyError:
+        raise ValueError(
+            f"KDF inválida: '{name}'. Use uma de: {', '.join(KDFS)}."
+        ) from None
+
+
+def legacy_kdfs(current: PasswordKdf) -> List[PasswordKdf]:
+    """
+    KDFs aceitas só na conferência quando a atual é current: as demais de
+    KDFS e Sha256Kdf. Os parâmetros de custo vêm do próprio hash.
+    """
+    return [
+        kdf_class() for kdf_class in KDFS.values() if kdf_class.scheme != current.scheme
+    ] + [Sha256Kdf()]
@@ -0,0 +1,104 @@
+"""
+Hash de senhas em um pool limitado de workers.
+
+Princípio DIP: Implementa PasswordHasherPort.
+Princípio SRP: Decide onde e quando o hash roda; o cálculo em si é da
+estratégia de KDF (ver password_kdf).
+
+Uma KDF de verdade consome dezenas de milissegundos de CPU por chamada.
+Para que uma rajada de logins não trave o resto da API:
+
+- o cálculo roda fora do event loop, em um pool de `workers` threads
+  (hashlib libera o GIL em pbkdf2_hmac e scrypt) ou processos;
+- no máximo `workers + max_queue` cálculos ficam em andamento ou na fila;
+  acima disso a chamada é recusada na hora com
+  HashingOverloadedException, em vez de aumentar a fila e a latência;
+- hashes legados baratos (SHA-256) são conferidos direto no event loop.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Sequence
+from domain.exceptions import HashingOverloadedException
+from domain.ports import PasswordHasherPort
+from .password_kdf import PasswordKdf, Sha256Kdf, legacy_kdfs
+
+
+class PooledPasswordHasher(PasswordHasherPort):
+    """Calcula hashes com a KDF atual em um pool com fila limitada."""
+
+    def __init__(
+        self,
+        kdf: PasswordKdf,
+        legacy: Optional[Sequence[PasswordKdf]] = None,
+        workers: int = 2,
+        max_queue: int = 64,
+        processes: bool = False,
+    ):
+        self._kdf = kdf
+        # KDFs aceitas apenas na conferência (hashes gravados antes da atual);
+        # por padrão, todas as outras: trocar a KDF migra as senhas no login
+        self._legacy = list(legacy) if legacy is not None else legacy_kdfs(kdf)
+        self._workers = workers
+        self._max_queue = max_queue
+        self._processes = processes
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        # Cálculos em andamento ou na fila do pool
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+
+    @property
+    def kdf(self) -> PasswordKdf:
+        return self._kdf
+
+    def _pool(self) -> Executor:
+        """Cria o pool no primeiro uso (os processos só sobem se necessários)."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    pool_class = ProcessPoolExecutor if self._processes else ThreadPoolExecutor
+                    self._executor = pool_class(max_workers=self._workers)
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            raise HashingOverloadedException()
+        try:
+            future = self._pool().submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # A vaga só é liberada quando o cálculo termina de fato, mesmo que
+        # a requisição que o pediu seja cancelada antes
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+    def _kdf_for(self, password_hash: str) -> Optional[PasswordKdf]:
+        for kdf in (self._kdf, *self._legacy):
+            if kdf.identifies(password_hash):
+                return kdf
+        return None
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self._kdf.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        kdf = self._kdf_for(password_hash)
+        if kdf is None:
+            return False
+        if isinstance(kdf, Sha256Kdf):
+            return kdf.verify(password, password_hash)
+        return await self._run(kdf.verify, password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        if not self._kdf.identifies(password_hash):
+            return True
+        return self._kdf.needs_rehash(password_hash)
+
+    def close(self) -> None:
+        """Encerra o pool (aguarda os cálculos em andamento)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
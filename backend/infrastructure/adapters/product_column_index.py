@@ -0,0 +1,407 @@
+"""
+Motor colunar (NumPy) de filtragem e ordenação de produtos.
+
+Alternativa ao ProductFacetIndex para catálogos grandes, com a mesma
+interface. Cada atributo usado nos filtros e ordenações vira uma coluna
+NumPy, uma linha por produto na ordem de cadastro:
+- preço, avaliação e número de avaliações;
+- categoria e gênero como códigos inteiros;
+- um vetor booleano por tamanho;
+- o nome normalizado e, para ordenar por nome, a posição dele entre os
+  nomes do catálogo (recalculada na primeira ordenação por nome após
+  uma inclusão ou troca de nome).
+
+Um filtro é uma máscara booleana montada por operações vetorizadas, e
+a página é escolhida por seleção parcial (np.partition) sobre as linhas
+da máscara: só os ids da página voltam a ser objetos Python. Linhas de
+produtos removidos ficam marcadas como inativas e são compactadas
+quando passam da metade da tabela.
+
+Como no ProductFacetIndex, um lock protege as colunas: as consultas
+rodam no loop de eventos enquanto as escritas rodam em threads.
+
+Exige NumPy (dependência opcional).
+"""
+
+import heapq
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from domain.entities.product import Product
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy é opcional
+    np = None
+
+UNISEX = "unissex"
+
+# Código das categorias/gêneros que não existem no catálogo
+_NO_CODE = -1
+_MIN_CAPACITY = 1024
+
+
+class ProductColumnIndex:
+    """Colunas NumPy (preço, avaliação, categoria, gênero, tamanho...) do catálogo."""
+
+    def __init__(self):
+        if np is None:
+            raise RuntimeError("O índice colunar exige NumPy (pip install numpy).")
+        self._rows = 0
+        self._capacity = 0
+        # Índice direto: id -> linha
+        self._row_of: Dict[str, int] = {}
+        self._ids = np.empty(0, dtype=object)
+        self._alive = np.zeros(0, dtype=bool)
+        self._sequence = np.zeros(0, dtype=np.int64)
+        self._price = np.zeros(0, dtype=np.float64)
+        self._rating = np.zeros(0, dtype=np.float64)
+        self._reviews = np.zeros(0, dtype=np.int64)
+        self._names = np.empty(0, dtype=object)
+        # Posições dos nomes, válidas enquanto _ranks_version == _names_version
+        self._name_ranks = np.zeros(0, dtype=np.int64)
+        self._names_version = 0
+        self._ranks_version = -1
+        self._category = np.zeros(0, dtype=np.int32)
+        self._gender = np.zeros(0, dtype=np.int32)
+        self._sizes: Dict[str, Any] = {}
+        # Dicionários dos códigos (valor normalizado -> código)
+        self._category_codes: Dict[str, int] = {}
+        self._gender_codes: Dict[str, int] = {}
+        # Nomes de categoria como cadastrados, com a contagem de produtos
+        self._category_names: Dict[str, int] = {}
+        self._row_category_name: Dict[int, str] = {}
+        self._next_sequence = 0
+        # Reentrante: load() sobre colunas já povoadas chama add()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    # --- Manutenção das colunas ---
+
+    def load(self, products: Iterable[Product]) -> None:
+        """Carga inicial em lote: cada coluna é montada de uma vez."""
+        with self._lock:
+            products = list(products)
+            if self._rows:
+                for product in products:
+                    self.add(product)
+                return
+            count = len(products)
+            self._reserve(count)
+            self._rows = count
+            self._row_of = {p.id: row for row, p in enumerate(products)}
+            self._next_sequence = count
+            self._sequence[:count] = np.arange(count)
+            self._alive[:count] = True
+            self._ids[:count] = [p.id for p in products]
+            self._names[:count] = [p.name.casefold() for p in products]
+            self._names_version += 1
+            self._price[:count] = [p.price for p in products]
+            self._rating[:count] = [p.rating for p in products]
+            self._reviews[:count] = [p.reviews_count for p in products]
+            categories = self._category_codes
+            genders = self._gender_codes
+            self._category[:count] = [_code(categories, p.category.lower()) for p in products]
+            self._gender[:count] = [_code(genders, p.gender.lower()) for p in products]
+            rows_by_size: Dict[str, List[int]] = {}
+            for row, product in enumerate(products):
+                for size in {s.upper() for s in product.sizes}:
+                    rows_by_size.setdefault(size, []).append(row)
+                name = product.category
+                self._row_category_name[row] = name
+                self._category_names[name] = self._category_names.get(name, 0) + 1
+            for size, rows in rows_by_size.items():
+                column = np.zeros(self._capacity, dtype=bool)
+                column[rows] = True
+                self._sizes[size] = column
+
+    def add(self, product: Product) -> None:
+        """Indexa um produto novo ou atualiza a linha de um existente."""
+        with self._lock:
+            row = self._row_of.get(product.id)
+            if row is None:
+                self._reserve(self._rows + 1)
+                self._append_row(product)
+            else:
+                self._uncount_category(row)
+                self._write_row(row, product)
+
+    def remove(self, product_id: str) -> None:
+        """Marca a linha do produto como inativa."""
+        with self._lock:
+            row = self._row_of.pop(product_id, None)
+            if row is None:
+                return
+            self._uncount_category(row)
+            self._alive[row] = False
+            self._ids[row] = None
+            self._names[row] = None
+            if self._rows > _MIN_CAPACITY and len(self._row_of) < self._rows // 2:
+                self._compact()
+
+    def _append_row(self, product: Product) -> None:
+        row = self._rows
+        self._rows += 1
+        self._row_of[product.id] = row
+        self._sequence[row] = self._next_sequence
+        self._next_sequence += 1
+        self._write_row(row, product)
+
+    def _write_row(self, row: int, product: Product) -> None:
+        self._ids[row] = product.id
+        self._alive[row] = True
+        self._price[row] = product.price
+        self._rating[row] = product.rating
+        self._reviews[row] = product.reviews_count
+        name = product.name.casefold()
+        if self._names[row] != name:
+            self._names[row] = name
+            self._names_version += 1
+        self._category[row] = _code(self._category_codes, product.category.lower())
+        self._gender[row] = _code(self._gender_codes, product.gender.lower())
+        sizes = {s.upper() for s in product.sizes}
+        for size, column in self._sizes.items():
+            column[row] = size in sizes
+        for size in sizes - self._sizes.keys():
+            column = np.zeros(self._capacity, dtype=bool)
+            column[row] = True
+            self._sizes[size] = column
+        name = product.category
+        self._row_category_name[row] = name
+        self._category_names[name] = self._category_names.get(name, 0) + 1
+
+    def _uncount_category(self, row: int) -> None:
+        name = self._row_category_name.pop(row)
+        self._category_names[name] -= 1
+        if not self._category_names[name]:
+            del self._category_names[name]
+
+    def _reserve(self, rows: int) -> None:
+        """Garante capacidade para `rows` linhas (crescimento geométrico)."""
+        if rows <= self._capacity:
+            return
+        capacity = max(_MIN_CAPACITY, rows, self._capacity * 2)
+        for name in _COLUMNS:
+            setattr(self, name, _resized(getattr(self, name), capacity))
+        self._sizes = {s: _resized(c, capacity) for s, c in self._sizes.items()}
+        self._capacity = capacity
+
+    def _compact(self) -> None:
+        """Descarta as linhas inativas, preservando a ordem de cadastro."""
+        keep = np.flatnonzero(self._alive[:self._rows])
+        for name in _COLUMNS:
+            column = getattr(self, name)
+            compacted = np.zeros_like(column)
+            compacted[:len(keep)] = column[keep]
+            setattr(self, name, compacted)
+        for size, column in self._sizes.items():
+            compacted = np.zeros_like(column)
+            compacted[:len(keep)] = column[keep]
+            self._sizes[size] = compacted
+        self._row_category_name = {
+            new: self._row_category_name[old] for new, old in enumerate(keep.tolist())
+        }
+        self._row_of = {product_id: row for row, product_id in enumerate(self._ids[:len(keep)])}
+        self._rows = len(keep)
+        self._names_version += 1
+
+    # --- Consultas ---
+
+    def categories(self) -> List[str]:
+        """Categorias com ao menos um produto, em ordem alfabética."""
+        with self._lock:
+            return sorted(self._category_names)
+
+    def in_catalog_order(self, product_ids: Iterable[str]) -> List[str]:
+        """Ordena ids pela ordem de cadastro no catálogo."""
+        with self._lock:
+            return sorted(product_ids, key=self._row_of.__getitem__)
+
+    def filter(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        within: Optional[List[str]] = None,
+    ) -> Optional[List[str]]:
+        """
+        Retorna os ids que satisfazem todos os critérios informados.
+
+        Mesma semântica do ProductFacetIndex.filter: a ordem de `within` é
+        preservada; sem ele, vale a ordem de cadastro; None quando nenhum
+        critério foi informado.
+        """
+        with self._lock:
+            mask = self._mask(category, gender, min_price, max_price, size)
+            if within is not None:
+                row_of = self._row_of
+                rows = [row_of[i] for i in within if i in row_of]
+                if mask is None:
+                    return [self._ids[r] for r in rows]
+                return [self._ids[r] for r in rows if mask[r]]
+            if mask is None:
+                return None
+            return self._ids[:self._rows][mask].tolist()
+
+    def filtered_page(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        within: Optional[List[str]] = None,
+        field: Optional[str] = None,
+        descending: bool = False,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Tuple[Any, str]], int]:
+        """
+        Filtra, ordena e recorta uma página sem sair das colunas.
+
+        Retorna as entradas (chave, id) da página, a partir da posição
+        `after`, e o total de resultados do filtro.
+        """
+        with self._lock:
+            rows = self._rows
+            mask = self._mask(category, gender, min_price, max_price, size)
+            if mask is None:
+                mask = self._alive[:rows]
+            if within is not None:
+                row_of = self._row_of
+                selected = np.array([row_of[i] for i in within if i in row_of], dtype=np.intp)
+                selected = np.sort(selected[mask[selected]])
+            else:
+                selected = np.flatnonzero(mask)
+            total = len(selected)
+
+            keys = self._sort_column(field)[:rows]
+            ids = self._ids[:rows]
+            if after is not None:
+                selected = selected[_after(keys[selected], ids[selected], after, descending)]
+            # Nomes são comparados pela posição (inteiros), não como strings
+            ranks = self._ranked_names()[:rows] if field == "name" else keys
+            page = _top_rows(selected, ranks, ids, descending, limit)
+            return list(zip(keys[page].tolist(), ids[page].tolist())), total
+
+    def _sort_column(self, field: Optional[str]):
+        if field is None:
+            return self._sequence
+        return {
+            "price": self._price,
+            "rating": self._rating,
+            "reviews_count": self._reviews,
+            "name": self._names,
+        }[field]
+
+    def _ranked_names(self):
+        """Posição de cada nome entre os nomes ativos (nomes iguais, mesma posição)."""
+        version = self._names_version
+        if self._ranks_version != version:
+            rows = np.flatnonzero(self._alive[:self._rows])
+            names = self._names[rows]
+            order = np.argsort(names, kind="stable")
+            sorted_names = names[order]
+            ranks = np.zeros(self._capacity, dtype=np.int64)
+            if len(rows):
+                changes = sorted_names[1:] != sorted_names[:-1]
+                ranks[rows[order[1:]]] = np.cumsum(changes)
+            self._name_ranks = ranks
+            self._ranks_version = version
+        return self._name_ranks
+
+    def _mask(
+        self,
+        category: Optional[str],
+        gender: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+        size: Optional[str],
+    ):
+        """Máscara dos critérios informados (None quando não há nenhum)."""
+        rows = self._rows
+        mask = None
+
+        def narrow(condition):
+            # Sempre um vetor novo: as colunas nunca são alteradas aqui
+            nonlocal mask
+            mask = (self._alive[:rows] if mask is None else mask) & condition
+
+        if category:
+            code = self._category_codes.get(category.lower(), _NO_CODE)
+            narrow(self._category[:rows] == code)
+        if gender:
+            codes = self._gender[:rows]
+            requested = self._gender_codes.get(gender.lower(), _NO_CODE)
+            unisex = self._gender_codes.get(UNISEX, _NO_CODE)
+            narrow((codes == requested) | (codes == unisex))
+        if min_price is not None:
+            narrow(self._price[:rows] >= min_price)
+        if max_price is not None:
+            narrow(self._price[:rows] <= max_price)
+        if size:
+            column = self._sizes.get(size.upper())
+            narrow(np.zeros(rows, dtype=bool) if column is None else column[:rows])
+        return mask
+
+
+# Colunas redimensionadas e compactadas juntas (os tamanhos à parte)
+_COLUMNS = (
+    "_ids", "_alive", "_sequence", "_price", "_rating", "_reviews",
+    "_names", "_category", "_gender",
+)
+
+
+def _code(codes: Dict[str, int], value: str) -> int:
+    code = codes.get(value)
+    if code is None:
+        code = codes.setdefault(value, len(codes))
+    return code
+
+
+def _resized(column, capacity: int):
+    resized = np.zeros(capacity, dtype=column.dtype)
+    resized[:len(column)] = column
+    return resized
+
+
+def _after(keys, ids, after: Tuple[Any, str], descending: bool):
+    """Máscara das entradas posteriores ao cursor (chave, id) na ordem pedida."""
+    key, last_id = after
+    beyond = keys < key if descending else keys > key
+    ties = np.flatnonzero(keys == key)
+    if len(ties):
+        beyond[ties] = ids[ties] < last_id if descending else ids[ties] > last_id
+    return beyond
+
+
+def _top_rows(rows, keys, ids, descending: bool, limit: Optional[int]):
+    """
+    Linhas da página, ordenadas por (chave, id).
+
+    Com limite, np.partition acha a chave da última posição da página e
+    só as linhas até ela são ordenadas; entre as empatadas nessa chave,
+    heapq escolhe os ids que completam a página.
+    """
+    if limit is not None and len(rows) > limit:
+        row_keys = keys[rows]
+        if limit == 0:
+            return rows[:0]
+        if descending:
+            boundary = np.partition(row_keys, len(rows) - limit)[len(rows) - limit]
+            inside = rows[row_keys > boundary]
+        else:
+            boundary = np.partition(row_keys, limit - 1)[limit - 1]
+            inside = rows[row_keys < boundary]
+        tied = rows[row_keys == boundary]
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        chosen = set(pick(limit - len(inside), ids[tied].tolist()))
+        tied = tied[[i in chosen for i in ids[tied].tolist()]]
+        rows = np.concatenate((inside, tied))
+    order = np.lexsort((ids[rows], keys[rows]))
+    if descending:
+        order = order[::-1]
+    return rows[order]
@@ -0,0 +1,297 @@
+"""
+Motor de filtragem facetada de produtos.
+
+Mantém, para cada faceta, o conjunto de produtos que a possuem:
+- categoria (sem diferenciar maiúsculas);
+- gênero (um filtro de gênero também aceita produtos "unissex");
+- tamanho (sem diferenciar maiúsculas);
+- preço, em um índice ordenado respondido por bisseção.
+
+Uma consulta escolhe o predicado mais seletivo como ponto de partida,
+percorre apenas os produtos dele e testa os demais predicados em O(1).
+O custo passa a ser proporcional ao tamanho do menor conjunto, e não ao
+tamanho do catálogo.
+
+Também mantém as ordenações usadas na paginação (preço, avaliação,
+número de avaliações, nome e a ordem de cadastro), atualizadas a cada
+alteração de produto. Uma página do catálogo sem filtros custa
+O(log n + tamanho da página).
+
+As consultas rodam no loop de eventos enquanto as escritas rodam em
+threads: um lock protege os índices, e cada consulta devolve listas já
+montadas (nada que ainda percorra os conjuntos depois de liberá-lo).
+"""
+
+import heapq
+import threading
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from domain.entities.product import Product
+from domain.pagination import PRODUCT_SORT_FIELDS, product_sort_key
+from .sorted_key_index import SortedKeyIndex
+
+UNISEX = "unissex"
+
+
+@dataclass
+class _Predicate:
+    """Um critério de filtro: quantos produtos casam, quais são e o teste O(1)."""
+    size: int
+    members: Callable[[], Iterable[str]]
+    contains: Callable[[str], bool]
+
+
+class ProductFacetIndex:
+    """Índices de facetas (categoria, gênero, tamanho e preço) do catálogo."""
+
+    def __init__(self):
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_gender: Dict[str, Set[str]] = {}
+        self._by_size: Dict[str, Set[str]] = {}
+        # Ordenações pré-calculadas; a de preço também responde os intervalos
+        self._orderings: Dict[str, SortedKeyIndex] = {
+            field: SortedKeyIndex() for field in PRODUCT_SORT_FIELDS
+        }
+        self._price = self._orderings["price"]
+        self._catalog_order = SortedKeyIndex()
+        # Nomes de categoria como cadastrados, com a contagem de produtos
+        self._category_names: Dict[str, int] = {}
+        # Índice direto: id -> facetas indexadas, usado na atualização
+        self._facets: Dict[str, Tuple[str, str, str, Tuple[str, ...]]] = {}
+        # Ordem de cadastro, para devolver os resultados na ordem do catálogo
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+        # Reentrante: filtered_page() chama filter() e sorted_page()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._facets)
+
+    def load(self, products: Iterable[Product]) -> None:
+        """Carga inicial em lote (cada ordenação é ordenada uma única vez)."""
+        with self._lock:
+            keys: Dict[str, Dict[str, Any]] = {field: {} for field in self._orderings}
+            for product in products:
+                self._index_facets(product)
+                for field, field_keys in keys.items():
+                    field_keys[product.id] = product_sort_key(product, field)
+            for field, field_keys in keys.items():
+                self._orderings[field].load(field_keys)
+            self._catalog_order.load(self._sequence)
+
+    def add(self, product: Product) -> None:
+        """Indexa um produto novo ou atualiza as facetas de um existente."""
+        with self._lock:
+            self._index_facets(product)
+            self._catalog_order.put(product.id, self._sequence[product.id])
+            for field, ordering in self._orderings.items():
+                ordering.put(product.id, product_sort_key(product, field))
+
+    def remove(self, product_id: str) -> None:
+        """Remove um produto dos índices."""
+        with self._lock:
+            if product_id not in self._facets:
+                return
+            self._unindex_facets(product_id)
+            for ordering in self._orderings.values():
+                ordering.remove(product_id)
+            self._catalog_order.remove(product_id)
+            del self._sequence[product_id]
+
+    def _index_facets(self, product: Product) -> None:
+        facets = (
+            product.category,
+            product.category.lower(),
+            product.gender.lower(),
+            tuple(dict.fromkeys(s.upper() for s in product.sizes)),
+        )
+        previous = self._facets.get(product.id)
+        if previous == facets:
+            return
+        if previous is not None:
+            self._unindex_facets(product.id)
+        else:
+            self._sequence[product.id] = self._next_sequence
+            self._next_sequence += 1
+
+        category_name, category, gender, sizes = facets
+        self._facets[product.id] = facets
+        self._category_names[category_name] = self._category_names.get(category_name, 0) + 1
+        self._by_category.setdefault(category, set()).add(product.id)
+        self._by_gender.setdefault(gender, set()).add(product.id)
+        for size in sizes:
+            self._by_size.setdefault(size, set()).add(product.id)
+
+    def _unindex_facets(self, product_id: str) -> None:
+        category_name, category, gender, sizes = self._facets.pop(product_id)
+        self._category_names[category_name] -= 1
+        if not self._category_names[category_name]:
+            del self._category_names[category_name]
+        _discard(self._by_category, category, product_id)
+        _discard(self._by_gender, gender, product_id)
+        for size in sizes:
+            _discard(self._by_size, size, product_id)
+
+    def categories(self) -> List[str]:
+        """Categorias com ao menos um produto, em ordem alfabética."""
+        with self._lock:
+            return sorted(self._category_names)
+
+    def in_catalog_order(self, product_ids: Iterable[str]) -> List[str]:
+        """Ordena ids pela ordem de cadastro no catálogo."""
+        with self._lock:
+            return sorted(product_ids, key=self._sequence.__getitem__)
+
+    def filter(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        within: Optional[List[str]] = None,
+    ) -> Optional[List[str]]:
+        """
+        Retorna os ids que satisfazem todos os critérios informados.
+
+        Se `within` for informado (ex.: resultado de uma busca textual), a
+        ordem dele é preservada; caso contrário, o resultado segue a ordem
+        de cadastro. Retorna None quando nenhum critério foi informado
+        (isto é, todo o catálogo).
+        """
+        with self._lock:
+            predicates = self._predicates(category, gender, min_price, max_price, size)
+
+            if within is not None:
+                # Ids que saíram do catálogo depois da busca são descartados
+                return [
+                    product_id for product_id in within
+                    if product_id in self._facets
+                    and all(p.contains(product_id) for p in predicates)
+                ]
+            if not predicates:
+                return None
+
+            predicates.sort(key=lambda p: p.size)
+            driver, others = predicates[0], predicates[1:]
+            matches = [
+                product_id for product_id in driver.members()
+                if all(p.contains(product_id) for p in others)
+            ]
+            return self.in_catalog_order(matches)
+
+    def filtered_page(
+        self,
+        category: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        size: Optional[str] = None,
+        within: Optional[List[str]] = None,
+        field: Optional[str] = None,
+        descending: bool = False,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Tuple[Any, str]], int]:
+        """filter() seguido de sorted_page(): a página e o total do filtro."""
+        with self._lock:
+            return self.sorted_page(
+                self.filter(category, gender, min_price, max_price, size, within),
+                field, descending, after, limit,
+            )
+
+    def sorted_page(
+        self,
+        product_ids: Optional[List[str]],
+        field: Optional[str],
+        descending: bool = False,
+        after: Optional[Tuple[Any, str]] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Tuple[Any, str]], int]:
+        """
+        Ordena e recorta uma página de resultados.
+
+        product_ids é o resultado de filter() (None = catálogo inteiro);
+        field é um dos PRODUCT_SORT_FIELDS (None = ordem de cadastro).
+        Retorna as entradas (chave, id) da página, a partir da posição
+        `after`, e o total de resultados.
+        """
+        with self._lock:
+            ordering = self._orderings[field] if field else self._catalog_order
+
+            if product_ids is None:
+                # Sem filtros: percorre a ordenação a partir do cursor
+                ids = ordering.iter_ids(after, reverse=descending)
+                if limit is not None:
+                    ids = islice(ids, limit)
+                key_of = ordering.key_of
+                return [(key_of(i), i) for i in ids], len(ordering)
+
+            key_of = ordering.key_of
+            entries: Iterable[Tuple[Any, str]] = ((key_of(i), i) for i in product_ids)
+            if after is not None:
+                if descending:
+                    entries = (e for e in entries if e < after)
+                else:
+                    entries = (e for e in entries if e > after)
+            if limit is None:
+                page = sorted(entries, reverse=descending)
+            elif descending:
+                page = heapq.nlargest(limit, entries)
+            else:
+                page = heapq.nsmallest(limit, entries)
+            return page, len(product_ids)
+
+    def _predicates(
+        self,
+        category: Optional[str],
+        gender: Optional[str],
+        min_price: Optional[float],
+        max_price: Optional[float],
+        size: Optional[str],
+    ) -> List[_Predicate]:
+        predicates: List[_Predicate] = []
+
+        if category:
+            predicates.append(_set_predicate(self._by_category.get(category.lower(), set())))
+
+        if gender:
+            requested = self._by_gender.get(gender.lower(), set())
+            unisex = self._by_gender.get(UNISEX, set())
+            if requested is unisex:
+                predicates.append(_set_predicate(unisex))
+            else:
+                predicates.append(_Predicate(
+                    size=len(requested) + len(unisex),
+                    members=lambda: chain(requested, unisex),
+                    contains=lambda i: i in requested or i in unisex,
+                ))
+
+        if min_price is not None or max_price is not None:
+            start, end = self._price.range_bounds(min_price, max_price)
+            low = float("-inf") if min_price is None else min_price
+            high = float("inf") if max_price is None else max_price
+            key_of = self._price.key_of
+            predicates.append(_Predicate(
+                size=end - start,
+                members=lambda: self._price.ids_between(start, end),
+                contains=lambda i: low <= key_of(i) <= high,
+            ))
+
+        if size:
+            predicates.append(_set_predicate(self._by_size.get(size.upper(), set())))
+
+        return predicates
+
+
+def _set_predicate(members: Set[str]) -> _Predicate:
+    return _Predicate(size=len(members), members=lambda: members, contains=members.__contains__)
+
+
+def _discard(index: Dict[str, Set[str]], key: str, product_id: str) -> None:
+    members = index.get(key)
+    if members is not None:
+        members.discard(product_id)
+        if not members:
+            del index[key]
@@ -0,0 +1,257 @@
+"""
+Índice invertido para a busca textual de produtos.
+
+Cada termo (normalizado sem acentos, ver text_folding) aponta para os
+produtos que o contêm, com um peso que depende do campo em que aparece:
+nome pesa mais que marca, que pesa mais que descrição.
+
+A busca:
+- exige que todos os termos da consulta estejam presentes (AND);
+- aceita prefixos ("cami" encontra "camiseta"), com peso menor que o
+  termo exato;
+- ordena por relevância (soma dos pesos) e, em caso de empate, pela
+  ordem de cadastro dos produtos.
+
+O índice é atualizado incrementalmente: ao atualizar um produto, apenas
+os termos dele são removidos e reinseridos, e somente se nome, marca ou
+descrição tiverem mudado.
+
+As buscas rodam no loop de eventos enquanto as escritas rodam em threads:
+um lock protege o índice, e a busca apenas lê (os termos novos entram no
+vocabulário ordenado do lado de quem escreve, em prepare()).
+
+As regras de casamento e de pontuação (term_weights, query_terms e
+match_score) são funções do módulo: o adapter SQLite as reutiliza, para
+que os dois repositórios respondam a mesma busca da mesma forma.
+"""
+
+import bisect
+import heapq
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+from domain.entities.product import Product
+from .text_folding import tokenize
+
+# Peso de cada campo indexado: nome, marca e descrição
+NAME_WEIGHT = 3.0
+BRAND_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+# Fração do peso concedida quando o termo casa apenas por prefixo
+PREFIX_FACTOR = 0.5
+
+
+def term_weights(name: str, brand: str, description: str) -> Dict[str, float]:
+    """Termos normalizados de um produto com o peso somado por campo."""
+    weights: Dict[str, float] = {}
+    for text, weight in zip(
+        (name, brand, description), (NAME_WEIGHT, BRAND_WEIGHT, DESCRIPTION_WEIGHT)
+    ):
+        for term in tokenize(text):
+            weights[term] = weights.get(term, 0.0) + weight
+    return weights
+
+
+def query_terms(query: str) -> List[str]:
+    """Termos distintos da consulta, normalizados, na ordem em que aparecem."""
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def match_score(weights: Dict[str, float], terms: List[str]) -> Optional[float]:
+    """
+    Relevância de um produto (seus term_weights) para os termos da consulta,
+    ou None se algum termo não casar. Cada termo vale o maior peso entre o
+    termo exato e os termos do produto que o têm como prefixo (estes com
+    PREFIX_FACTOR); os termos se somam.
+    """
+    total = 0.0
+    for term in terms:
+        best = 0.0
+        for candidate, weight in weights.items():
+            if candidate == term:
+                best = max(best, weight)
+            elif candidate.startswith(term):
+                best = max(best, weight * PREFIX_FACTOR)
+        if not best:
+            return None
+        total += best
+    return total
+
+
+class ProductSearchIndex:
+    """Índice invertido termo -> {id do produto: peso}."""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        # Vocabulário ordenado, para localizar prefixos por bisseção. Termos
+        # novos ficam pendentes até o prepare() de quem escreveu, o que evita
+        # inserções ordenadas uma a uma durante a carga inicial; até lá, a
+        # busca os percorre à parte.
+        self._vocabulary: List[str] = []
+        self._pending_terms: Set[str] = set()
+        # Índice direto: id -> {termo: peso}, usado na remoção incremental
+        self._documents: Dict[str, Dict[str, float]] = {}
+        self._texts: Dict[str, Tuple[str, str, str]] = {}
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+        # Postings já ordenadas por relevância, por termo: cache que a busca
+        # preenche sob o lock e que as escritas invalidam termo a termo
+        self._ranked: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, product: Product) -> None:
+        """Indexa um produto novo ou reindexa um produto alterado."""
+        texts = (product.name, product.brand, product.description)
+        with self._lock:
+            if self._texts.get(product.id) != texts:
+                self._add(product.id, texts)
+
+    def _add(self, product_id: str, texts: Tuple[str, str, str]) -> None:
+        if product_id in self._documents:
+            self._remove_terms(product_id)
+        else:
+            self._sequence[product_id] = self._next_sequence
+            self._next_sequence += 1
+        self._texts[product_id] = texts
+
+        weights = term_weights(*texts)
+        self._documents[product_id] = weights
+
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._pending_terms.add(term)
+            postings[product_id] = weight
+            self._ranked.pop(term, None)
+
+    def remove(self, product_id: str) -> None:
+        """Remove um produto do índice."""
+        with self._lock:
+            if product_id not in self._documents:
+                return
+            self._remove_terms(product_id)
+            del self._texts[product_id]
+            del self._sequence[product_id]
+
+    def _remove_terms(self, product_id: str) -> None:
+        for term in self._documents.pop(product_id):
+            postings = self._postings[term]
+            del postings[product_id]
+            self._ranked.pop(term, None)
+            if not postings:
+                del self._postings[term]
+                if term in self._pending_terms:
+                    self._pending_terms.discard(term)
+                else:
+                    del self._vocabulary[bisect.bisect_left(self._vocabulary, term)]
+
+    def prepare(self) -> None:
+        """Incorpora ao vocabulário ordenado os termos pendentes (após escrever)."""
+        with self._lock:
+            if not self._pending_terms:
+                return
+            if len(self._pending_terms) <= 64:
+                for term in self._pending_terms:
+                    bisect.insort(self._vocabulary, term)
+            else:
+                self._vocabulary.extend(self._pending_terms)
+                self._vocabulary.sort()
+            self._pending_terms.clear()
+
+    def _expand(self, term: str) -> List[Tuple[str, Dict[str, float], float]]:
+        """Termos do vocabulário que casam com o termo: o exato e os prefixados."""
+        expansions = []
+        if term in self._postings:
+            expansions.append((term, self._postings[term], 1.0))
+        vocabulary = self._vocabulary
+        i = bisect.bisect_right(vocabulary, term)
+        while i < len(vocabulary) and vocabulary[i].startswith(term):
+            candidate = vocabulary[i]
+            expansions.append((candidate, self._postings[candidate], PREFIX_FACTOR))
+            i += 1
+        for candidate in self._pending_terms:
+            if candidate != term and candidate.startswith(term):
+                expansions.append((candidate, self._postings[candidate], PREFIX_FACTOR))
+        return expansions
+
+    def _ranked_postings(self, term: str) -> List[str]:
+        ranked = self._ranked.get(term)
+        if ranked is None:
+            postings = self._postings[term]
+            ranked = sorted(
+                postings, key=lambda i: (-postings[i], self._sequence[i])
+            )
+            self._ranked[term] = ranked
+        return ranked
+
+    @staticmethod
+    def _scores(expansions) -> Dict[str, float]:
+        scores: Dict[str, float] = {}
+        for _, postings, factor in expansions:
+            for product_id, weight in postings.items():
+                score = weight * factor
+                if score > scores.get(product_id, 0.0):
+                    scores[product_id] = score
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Retorna os ids dos produtos que casam com todos os termos da
+        consulta, do mais relevante para o menos relevante.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+        with self._lock:
+            return self._search(terms, limit)
+
+    def _search(self, terms: List[str], limit: Optional[int]) -> List[str]:
+        expansions = [self._expand(term) for term in terms]
+        if not all(expansions):
+            return []
+
+        # Caso mais comum (um único termo, sem outras expansões): as
+        # postings já ordenadas respondem a busca sem recalcular nada.
+        if len(expansions) == 1 and len(expansions[0]) == 1:
+            ranked = self._ranked_postings(expansions[0][0][0])
+            return ranked[:limit] if limit is not None else list(ranked)
+
+        # Interseção a partir do termo mais seletivo. Para os demais termos,
+        # consulta cada candidato nas postings (custo proporcional aos
+        # candidatos) ou, se for mais barato, percorre as postings inteiras.
+        sizes = [sum(len(p) for _, p, _ in e) for e in expansions]
+        order = sorted(range(len(terms)), key=sizes.__getitem__)
+        scores = self._scores(expansions[order[0]])
+        for index in order[1:]:
+            other = expansions[index]
+            if len(other) * len(scores) <= sizes[index]:
+                narrowed = {}
+                for product_id, score in scores.items():
+                    best = 0.0
+                    for _, postings, factor in other:
+                        weight = postings.get(product_id)
+                        if weight is not None and weight * factor > best:
+                            best = weight * factor
+                    if best:
+                        narrowed[product_id] = score + best
+                scores = narrowed
+            else:
+                other_scores = self._scores(other)
+                scores = {
+                    product_id: score + other_scores[product_id]
+                    for product_id, score in scores.items()
+                    if product_id in other_scores
+                }
+            if not scores:
+                return []
+
+        def rank(product_id: str) -> Tuple[float, int]:
+            return (-scores[product_id], self._sequence[product_id])
+
+        if limit is not None:
+            return heapq.nsmallest(limit, scores, key=rank)
+        return sorted(scores, key=rank)
@@ -0,0 +1,102 @@
+"""
+Índice ordenado por chave, mantido incrementalmente.
+
+Guarda pares (chave, id) em uma lista ordenada. Permite responder
+intervalos de chave por bisseção (ex.: preço entre min e max) e percorrer
+os ids na ordem da chave a partir de uma posição qualquer, sem ordenar
+a coleção a cada consulta.
+"""
+
+import bisect
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_key_of = itemgetter(0)
+_MISSING = object()
+
+
+class SortedKeyIndex:
+    """Lista ordenada de (chave, id), com o id como critério de desempate."""
+
+    def __init__(self):
+        self._entries: List[Tuple[Any, str]] = []
+        self._keys: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._keys
+
+    def key_of(self, item_id: str) -> Any:
+        """Chave atualmente indexada para o id."""
+        return self._keys[item_id]
+
+    def load(self, items: Dict[str, Any]) -> None:
+        """Carga em lote (uma única ordenação): id -> chave."""
+        self._keys = dict(items)
+        self._entries = sorted((key, item_id) for item_id, key in self._keys.items())
+
+    def put(self, item_id: str, key: Any) -> None:
+        """Insere o id ou o reposiciona se a chave mudou."""
+        previous = self._keys.get(item_id, _MISSING)
+        if previous is not _MISSING:
+            if previous == key:
+                return
+            self._remove_entry(previous, item_id)
+        self._keys[item_id] = key
+        bisect.insort(self._entries, (key, item_id))
+
+    def remove(self, item_id: str) -> None:
+        previous = self._keys.pop(item_id, _MISSING)
+        if previous is not _MISSING:
+            self._remove_entry(previous, item_id)
+
+    def _remove_entry(self, key: Any, item_id: str) -> None:
+        i = bisect.bisect_left(self._entries, (key, item_id))
+        del self._entries[i]
+
+    def range_bounds(
+        self, low: Optional[Any] = None, high: Optional[Any] = None
+    ) -> Tuple[int, int]:
+        """Posições [início, fim) das entradas com low <= chave <= high."""
+        start = 0 if low is None else bisect.bisect_left(self._entries, low, key=_key_of)
+        end = (
+            len(self._entries)
+            if high is None
+            else bisect.bisect_right(self._entries, high, key=_key_of)
+        )
+        return start, max(start, end)
+
+    def ids_between(self, start: int, end: int) -> Iterator[str]:
+        """Ids nas posições [start, end), em ordem crescente de chave."""
+        entries = self._entries
+        for i in range(start, min(end, len(entries))):
+            yield entries[i][1]
+
+    def iter_ids(
+        self,
+        after: Optional[Tuple[Any, str]] = None,
+        reverse: bool = False,
+    ) -> Iterator[str]:
+        """
+        Percorre os ids na ordem da chave (ou na ordem inversa), começando
+        logo depois da entrada `after` = (chave, id), se informada.
+        """
+        # Não é thread-safe: quem percorre deve impedir alterações até
+        # esgotar o iterador (o ProductFacetIndex o faz sob o seu lock).
+        # Ainda assim, os limites são reavaliados a cada passo.
+        entries = self._entries
+        if not reverse:
+            i = 0 if after is None else bisect.bisect_right(entries, after)
+            while i < len(entries):
+                yield entries[i][1]
+                i += 1
+        else:
+            i = len(entries) if after is None else bisect.bisect_left(entries, after)
+            i -= 1
+            while i >= 0:
+                if i < len(entries):
+                    yield entries[i][1]
+                i -= 1
+
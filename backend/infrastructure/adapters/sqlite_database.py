@@ -0,0 +1,243 @@
+"""
+Infraestrutura comum aos adapters SQLite.
+
+Responsável por abrir uma conexão por thread (o módulo sqlite3 não permite
+compartilhar conexões entre threads), configurar o modo WAL, criar o
+esquema com seus índices e oferecer transações reentrantes.
+
+Os comandos SQL dos adapters são constantes de módulo: o sqlite3 mantém
+um cache de statements compilados por conexão, então cada comando é
+preparado uma única vez por thread e reutilizado nas chamadas seguintes.
+
+O SQLite já coordena vários processos sobre o mesmo arquivo; com
+shared=True (vários workers), o que precisa de aviso são os caches de
+cada processo. is_stale() consulta o PRAGMA data_version de uma conexão
+dedicada, que muda a cada COMMIT de qualquer outra conexão, e refresh()
+notifica os interessados (ver on_external_change).
+
+Bancos criados por versões anteriores são atualizados na abertura: as
+migrações pendentes (acima do PRAGMA user_version) rodam uma única vez,
+em uma transação.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+from .product_search_index import term_weights
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id            TEXT PRIMARY KEY,
+    name          TEXT NOT NULL,
+    description   TEXT NOT NULL,
+    price         REAL NOT NULL,
+    category      TEXT NOT NULL,
+    category_key  TEXT NOT NULL,
+    sizes         TEXT NOT NULL,
+    colors        TEXT NOT NULL,
+    image_url     TEXT NOT NULL,
+    stock         INTEGER NOT NULL,
+    brand         TEXT NOT NULL,
+    gender        TEXT NOT NULL,
+    rating        REAL NOT NULL,
+    reviews_count INTEGER NOT NULL,
+    -- Termos normalizados (ver product_search_terms), para a busca textual
+    search_terms  TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_products_category ON products (category_key);
+
+CREATE TABLE IF NOT EXISTS users (
+    id            TEXT PRIMARY KEY,
+    name          TEXT NOT NULL,
+    email         TEXT NOT NULL,
+    email_key     TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    address       TEXT,
+    phone         TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users (email_key);
+
+CREATE TABLE IF NOT EXISTS orders (
+    id               TEXT PRIMARY KEY,
+    user_id          TEXT NOT NULL,
+    items            TEXT NOT NULL,
+    status           TEXT NOT NULL,
+    created_at       TEXT NOT NULL,
+    shipping_address TEXT NOT NULL
+);
+-- (user_id, created_at, id) atende as buscas por usuário e a paginação
+-- do histórico; substitui o antigo índice só por user_id
+DROP INDEX IF EXISTS idx_orders_user;
+CREATE INDEX IF NOT EXISTS idx_orders_user_created ON orders (user_id, created_at, id);
+"""
+
+
+def product_search_terms(name: str, brand: str, description: str) -> str:
+    """
+    Termos normalizados de um produto, separados e cercados por espaços:
+    instr(search_terms, ' ' || termo) encontra os produtos com algum termo
+    que começa pelo termo procurado.
+    """
+    return " " + " ".join(term_weights(name, brand, description)) + " "
+
+
+def _add_product_search_terms(conn: sqlite3.Connection) -> None:
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(products)")}
+    if "search_terms" not in columns:
+        conn.execute("ALTER TABLE products ADD COLUMN search_terms TEXT NOT NULL DEFAULT ''")
+    conn.execute(
+        "UPDATE products SET search_terms = product_search_terms(name, brand, description)"
+    )
+
+
+def _casefold_email_keys(conn: sqlite3.Connection) -> None:
+    """
+    Refaz email_key com casefold() (antes era lower(), que difere fora do
+    ASCII: "ß" contra "ss", por exemplo). Se a nova chave colidir com a de
+    outro usuário, a linha mantém a chave antiga (OR IGNORE) e segue
+    encontrável pelo email original, como antes da migração.
+    """
+    rows = conn.execute("SELECT id, email, email_key FROM users ORDER BY rowid").fetchall()
+    conn.executemany(
+        "UPDATE OR IGNORE users SET email_key = ? WHERE id = ?",
+        [
+            (email.casefold(), user_id)
+            for user_id, email, key in rows
+            if email.casefold() != key
+        ],
+    )
+
+
+# Migrações dos bancos existentes: (versão resultante, função)
+MIGRATIONS = (
+    (1, _add_product_search_terms),
+    (2, _casefold_email_keys),
+)
+
+
+class SqliteDatabase:
+    """Fábrica de conexões SQLite (uma por thread) sobre um mesmo arquivo."""
+
+    def __init__(self, database_path: str, shared: bool = False):
+        self._database_path = database_path
+        self._shared = shared
+        self._local = threading.local()
+        self.connection().executescript(SCHEMA)
+        self._migrate()
+        # Detecção de alterações feitas por outras conexões (modo compartilhado)
+        self._listeners: List[Callable[[], None]] = []
+        self._watch_lock = threading.Lock()
+        self._watcher: Optional[sqlite3.Connection] = None
+        self._data_version = self._read_data_version() if shared else 0
+
+    @property
+    def path(self) -> str:
+        return self._database_path
+
+    def connection(self) -> sqlite3.Connection:
+        """Retorna a conexão da thread atual, abrindo-a na primeira chamada."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._database_path,
+                isolation_level=None,
+                cached_statements=256,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            # Termos da busca textual normalizados em Python: o LOWER() nativo
+            # do SQLite não trata maiúsculas nem acentos fora do ASCII
+            conn.create_function(
+                "product_search_terms", 3, product_search_terms, deterministic=True
+            )
+            self._local.connection = conn
+            self._local.depth = 0
+            self._local.after_commit = []
+        return conn
+
+    def _migrate(self) -> None:
+        """Aplica as migrações ainda não aplicadas a este banco."""
+        conn = self.connection()
+        latest = MIGRATIONS[-1][0]
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= latest:
+            return
+        with self.transaction():
+            # Relido com o lock de escrita: outro processo pode ter migrado
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for target, migrate in MIGRATIONS:
+                if version < target:
+                    migrate(conn)
+            conn.execute(f"PRAGMA user_version = {max(version, latest)}")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Abre uma transação de escrita na conexão da thread atual.
+
+        É reentrante: transações aninhadas participam da transação mais
+        externa, que é a única a executar COMMIT/ROLLBACK.
+        """
+        conn = self.connection()
+        if self._local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                self._local.after_commit.clear()
+                conn.execute("ROLLBACK")
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn.execute("COMMIT")
+            callbacks, self._local.after_commit = self._local.after_commit, []
+            for callback in callbacks:
+                callback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Executa `callback` quando a transação atual da thread for confirmada
+        (imediatamente, se não houver transação aberta). Em um ROLLBACK, o
+        callback é descartado.
+        """
+        self.connection()
+        if self._local.depth == 0:
+            callback()
+        else:
+            self._local.after_commit.append(callback)
+
+    def on_external_change(self, callback: Callable[[], None]) -> None:
+        """Registra um callback chamado por refresh() quando o banco mudou."""
+        self._listeners.append(callback)
+
+    def _read_data_version(self) -> int:
+        with self._watch_lock:
+            if self._watcher is None:
+                # Conexão só de leitura, usada sempre sob o lock
+                self._watcher = sqlite3.connect(
+                    self._database_path, isolation_level=None, check_same_thread=False
+                )
+            return self._watcher.execute("PRAGMA data_version").fetchone()[0]
+
+    def is_stale(self) -> bool:
+        """
+        Indica se houve COMMIT desde o último refresh(). Inclui os das
+        outras threads deste processo: o SQLite não diferencia.
+        """
+        return self._shared and self._read_data_version() != self._data_version
+
+    def refresh(self) -> None:
+        """Notifica os interessados se o banco mudou desde a última verificação."""
+        if not self._shared:
+            return
+        version = self._read_data_version()
+        if version == self._data_version:
+            return
+        self._data_version = version
+        for callback in self._listeners:
+            callback()
@@ -0,0 +1,125 @@
+"""
+Adapter SQLite para o repositório de pedidos.
+
+Princípio LSP: Substituível por qualquer implementação de OrderRepositoryPort.
+Princípio DIP: Implementa a interface definida no domínio.
+"""
+
+import json
+import sqlite3
+from typing import List, Optional
+from domain.ports import OrderRepositoryPort
+from domain.entities.order import Order
+from domain.pagination import (
+    ORDER_SORT_FIELDS,
+    Page,
+    decode_order_cursor,
+    encode_keyset_cursor,
+    parse_sort,
+)
+from .sqlite_database import SqliteDatabase
+
+_COLUMNS = "id, user_id, items, status, created_at, shipping_address"
+
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM orders WHERE id = ?"
+_SELECT_BY_USER = f"SELECT {_COLUMNS} FROM orders WHERE user_id = ? ORDER BY rowid"
+# Histórico paginado: percorre o índice (user_id, created_at, id) a partir
+# da posição do cursor, sem contar as páginas anteriores
+_FIRST_PAGE_BY_USER = {
+    False: f"SELECT {_COLUMNS} FROM orders WHERE user_id = ? "
+    "ORDER BY created_at, id LIMIT ?",
+    True: f"SELECT {_COLUMNS} FROM orders WHERE user_id = ? "
+    "ORDER BY created_at DESC, id DESC LIMIT ?",
+}
+_NEXT_PAGE_BY_USER = {
+    False: f"SELECT {_COLUMNS} FROM orders WHERE user_id = ? "
+    "AND (created_at, id) > (?, ?) ORDER BY created_at, id LIMIT ?",
+    True: f"SELECT {_COLUMNS} FROM orders WHERE user_id = ? "
+    "AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?",
+}
+_COUNT_BY_USER = "SELECT count(*) FROM orders WHERE user_id = ?"
+_INSERT = (
+    "INSERT INTO orders (id, user_id, items, status, created_at, shipping_address) "
+    "VALUES (:id, :user_id, :items, :status, :created_at, :shipping_address)"
+)
+_UPDATE = (
+    "UPDATE orders SET user_id = :user_id, items = :items, status = :status, "
+    "created_at = :created_at, shipping_address = :shipping_address "
+    "WHERE id = :id"
+)
+
+
+def _to_row(order: Order) -> dict:
+    return {
+        "id": order.id,
+        "user_id": order.user_id,
+        "items": json.dumps(
+            [item.to_dict() for item in order.items], ensure_ascii=False
+        ),
+        "status": order.status.value,
+        "created_at": order.created_at,
+        "shipping_address": order.shipping_address,
+    }
+
+
+def _from_row(row: sqlite3.Row) -> Order:
+    data = dict(row)
+    data["items"] = json.loads(data["items"])
+    return Order.from_dict(data)
+
+
+class SqliteOrderRepository(OrderRepositoryPort):
+    """Implementação do repositório de pedidos usando SQLite."""
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def create(self, order: Order) -> Order:
+        """Cria um novo pedido."""
+        with self._db.transaction() as conn:
+            conn.execute(_INSERT, _to_row(order))
+        return order
+
+    def get_by_id(self, order_id: str) -> Optional[Order]:
+        """Retorna um pedido pelo ID."""
+        row = self._db.connection().execute(_SELECT_BY_ID, (order_id,)).fetchone()
+        return _from_row(row) if row is not None else None
+
+    def get_by_user_id(self, user_id: str) -> List[Order]:
+        """Retorna todos os pedidos de um usuário."""
+        rows = self._db.connection().execute(_SELECT_BY_USER, (user_id,)).fetchall()
+        return [_from_row(r) for r in rows]
+
+    def get_page_by_user_id(
+        self,
+        user_id: str,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page[Order]:
+        """Página do histórico por keyset no índice (user_id, created_at, id)."""
+        _, descending = parse_sort(sort, ORDER_SORT_FIELDS)
+        # LIMIT -1 = sem limite; um item a mais indica que há outra página
+        fetch = -1 if limit is None else limit + 1
+        conn = self._db.connection()
+        if cursor:
+            created_at, order_id = decode_order_cursor(cursor, sort)
+            rows = conn.execute(
+                _NEXT_PAGE_BY_USER[descending], (user_id, created_at, order_id, fetch)
+            ).fetchall()
+        else:
+            rows = conn.execute(_FIRST_PAGE_BY_USER[descending], (user_id, fetch)).fetchall()
+        total = conn.execute(_COUNT_BY_USER, (user_id,)).fetchone()[0]
+        orders = [_from_row(r) for r in rows]
+
+        next_cursor = None
+        if limit is not None and len(orders) > limit:
+            orders = orders[:limit]
+            last = orders[-1]
+            next_cursor = encode_keyset_cursor(sort, last.created_at, last.id)
+        return Page(items=orders, total=total, next_cursor=next_cursor)
+
+    def update(self, order: Order) -> None:
+        """Atualiza um pedido."""
+        with self._db.transaction() as conn:
+            conn.execute(_UPDATE, _to_row(order))
@@ -0,0 +1,257 @@
+"""
+Adapter SQLite para o repositório de produtos.
+
+Princípio LSP: Substituível por JsonProductRepository (ou qualquer outra
+implementação de ProductRepositoryPort) sem alterar os serviços.
+Princípio DIP: Implementa a interface definida no domínio.
+"""
+
+import itertools
+import json
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional
+from domain.ports import ProductRepositoryPort
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockException, ProductNotFoundException
+from .product_search_index import match_score, query_terms, term_weights
+from .sqlite_database import SqliteDatabase, product_search_terms
+
+_COLUMNS = (
+    "id, name, description, price, category, sizes, colors, image_url, "
+    "stock, brand, gender, rating, reviews_count"
+)
+
+_SELECT_ALL = f"SELECT {_COLUMNS} FROM products ORDER BY rowid"
+_SELECT_BATCH = (
+    f"SELECT rowid, {_COLUMNS} FROM products WHERE rowid > ? ORDER BY rowid LIMIT ?"
+)
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM products WHERE id = ?"
+_EXISTS = "SELECT 1 FROM products WHERE id = ?"
+_SELECT_STOCK = "SELECT stock FROM products WHERE id = ?"
+_SELECT_BY_CATEGORY = (
+    f"SELECT {_COLUMNS} FROM products WHERE category_key = ? ORDER BY rowid"
+)
+# Pré-filtro da busca: um instr por termo da consulta (ver _search_sql)
+_SEARCH_TERM = "instr(search_terms, ?) > 0"
+_COUNT = "SELECT COUNT(*) FROM products"
+_SELECT_CATEGORIES = "SELECT DISTINCT category FROM products ORDER BY category"
+_INSERT = (
+    "INSERT INTO products (id, name, description, price, category, "
+    "category_key, sizes, colors, image_url, stock, brand, gender, rating, "
+    "reviews_count, search_terms) "
+    "VALUES (:id, :name, :description, :price, :category, :category_key, "
+    ":sizes, :colors, :image_url, :stock, :brand, :gender, :rating, "
+    ":reviews_count, :search_terms)"
+)
+_UPDATE = (
+    "UPDATE products SET name = :name, description = :description, "
+    "price = :price, category = :category, category_key = :category_key, "
+    "sizes = :sizes, colors = :colors, image_url = :image_url, "
+    "stock = :stock, brand = :brand, gender = :gender, rating = :rating, "
+    "reviews_count = :reviews_count, search_terms = :search_terms "
+    "WHERE id = :id"
+)
+_UPSERT = _INSERT + (
+    " ON CONFLICT (id) DO UPDATE SET name = excluded.name, "
+    "description = excluded.description, price = excluded.price, "
+    "category = excluded.category, category_key = excluded.category_key, "
+    "sizes = excluded.sizes, colors = excluded.colors, "
+    "image_url = excluded.image_url, stock = excluded.stock, "
+    "brand = excluded.brand, gender = excluded.gender, "
+    "rating = excluded.rating, reviews_count = excluded.reviews_count, "
+    "search_terms = excluded.search_terms"
+)
+# Os ids vão como uma única lista JSON: sem limite de parâmetros por consulta
+_COUNT_EXISTING = (
+    "SELECT count(*) FROM products WHERE id IN (SELECT value FROM json_each(?))"
+)
+# A condição stock >= ? torna a baixa um compare-and-swap no próprio UPDATE
+_DECREASE_STOCK = "UPDATE products SET stock = stock - ? WHERE id = ? AND stock >= ?"
+_INCREASE_STOCK = "UPDATE products SET stock = stock + ? WHERE id = ?"
+
+
+def _to_row(product: Product) -> dict:
+    row = product.to_dict()
+    row["category_key"] = product.category.lower()
+    row["search_terms"] = product_search_terms(
+        product.name, product.brand, product.description
+    )
+    row["sizes"] = json.dumps(list(product.sizes), ensure_ascii=False)
+    row["colors"] = json.dumps(list(product.colors), ensure_ascii=False)
+    return row
+
+
+def _search_sql(term_count: int) -> str:
+    return (
+        f"SELECT {_COLUMNS} FROM products WHERE "
+        + " AND ".join([_SEARCH_TERM] * term_count)
+        + " ORDER BY rowid"
+    )
+
+
+def _from_row(row: sqlite3.Row) -> Product:
+    data = dict(row)
+    data["sizes"] = json.loads(data["sizes"])
+    data["colors"] = json.loads(data["colors"])
+    return Product.from_dict(data)
+
+
+class SqliteProductRepository(ProductRepositoryPort):
+    """Implementação do repositório de produtos usando SQLite."""
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+        # Versões para validação de cache, mantidas no processo: refletem
+        # as alterações feitas por este repositório
+        self._version_counter = itertools.count(1)
+        self._version = 0
+        self._product_versions: Dict[str, int] = {}
+        # Versão dos produtos não alterados aqui desde a última invalidação
+        self._base_version = 0
+        self._db.on_external_change(self._invalidate_versions)
+
+    def get_all(self) -> List[Product]:
+        """Retorna todos os produtos."""
+        rows = self._db.connection().execute(_SELECT_ALL).fetchall()
+        return [_from_row(r) for r in rows]
+
+    def get_by_id(self, product_id: str) -> Optional[Product]:
+        """Retorna um produto pelo ID."""
+        row = self._db.connection().execute(_SELECT_BY_ID, (product_id,)).fetchone()
+        return _from_row(row) if row is not None else None
+
+    def count(self) -> int:
+        """Quantidade de produtos no catálogo."""
+        return self._db.connection().execute(_COUNT).fetchone()[0]
+
+    def get_by_category(self, category: str) -> List[Product]:
+        """Retorna produtos filtrados por categoria."""
+        rows = self._db.connection().execute(
+            _SELECT_BY_CATEGORY, (category.lower(),)
+        ).fetchall()
+        return [_from_row(r) for r in rows]
+
+    def search(self, query: str) -> List[Product]:
+        """
+        Busca produtos por nome, marca ou descrição, com as regras do índice
+        invertido do adapter JSON: todos os termos (ou prefixos) presentes,
+        sem acentos, ordenados por relevância e depois pela ordem de cadastro.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+        rows = self._db.connection().execute(
+            _search_sql(len(terms)), [f" {term}" for term in terms]
+        ).fetchall()
+        scored = []
+        for row in rows:
+            score = match_score(
+                term_weights(row["name"], row["brand"], row["description"]), terms
+            )
+            if score is not None:
+                scored.append((score, row))
+        # sort estável: empates mantêm a ordem de cadastro (rowid)
+        scored.sort(key=lambda item: -item[0])
+        return [_from_row(row) for _, row in scored]
+
+    def update(self, product: Product) -> None:
+        """Atualiza um produto."""
+        with self._db.transaction() as conn:
+            conn.execute(_UPDATE, _to_row(product))
+        self._bump_versions_after_commit((product.id,))
+
+    def upsert_many(self, products: List[Product]) -> int:
+        """Inclui ou atualiza vários produtos em uma única transação."""
+        product_ids = [p.id for p in products]
+        with self._db.transaction() as conn:
+            existing = conn.execute(
+                _COUNT_EXISTING, (json.dumps(product_ids),)
+            ).fetchone()[0]
+            conn.executemany(_UPSERT, [_to_row(p) for p in products])
+        # Cargas em massa avançam a versão base em vez de guardar uma versão
+        # por produto: a memória não cresce com o tamanho da carga
+        self._db.after_commit(self._invalidate_versions)
+        return len(set(product_ids)) - existing
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[Product]]:
+        """Percorre o catálogo por rowid, lendo um lote por consulta."""
+        last_rowid = 0
+        while True:
+            rows = self._db.connection().execute(
+                _SELECT_BATCH, (last_rowid, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1]["rowid"]
+            yield [_from_row(r) for r in rows]
+
+    def reserve_stock(self, quantities: Dict[str, int]) -> None:
+        """Baixa o estoque de todos os produtos em uma transação (tudo ou nada)."""
+        with self._db.transaction() as conn:
+            for product_id, quantity in quantities.items():
+                if quantity <= 0:
+                    raise ValueError("Quantidade deve ser maior que zero.")
+                cursor = conn.execute(_DECREASE_STOCK, (quantity, product_id, quantity))
+                if cursor.rowcount == 0:
+                    # A exceção desfaz as baixas anteriores (rollback)
+                    row = conn.execute(_SELECT_STOCK, (product_id,)).fetchone()
+                    if row is None:
+                        raise ProductNotFoundException(product_id)
+                    raise InsufficientStockException(product_id, row["stock"], quantity)
+        self._bump_versions_after_commit(quantities)
+
+    def release_stock(self, quantities: Dict[str, int]) -> None:
+        """Devolve as quantidades ao estoque (ignora produtos inexistentes)."""
+        with self._db.transaction() as conn:
+            for product_id, quantity in quantities.items():
+                conn.execute(_INCREASE_STOCK, (quantity, product_id))
+        self._bump_versions_after_commit(quantities)
+
+    def _bump_versions_after_commit(self, product_ids: Iterable[str]) -> None:
+        # Dentro de uma unidade de trabalho, a alteração só fica visível para
+        # as outras conexões no COMMIT: antes disso, uma versão nova poderia
+        # ser associada (em cache) aos dados antigos.
+        product_ids = list(product_ids)
+
+        def bump() -> None:
+            for product_id in product_ids:
+                self._bump_version(product_id)
+
+        self._db.after_commit(bump)
+
+    def _bump_version(self, product_id: str) -> None:
+        # next() em itertools.count é atômico: updates concorrentes nunca
+        # recebem a mesma versão
+        self._version = next(self._version_counter)
+        self._product_versions[product_id] = self._version
+
+    def _invalidate_versions(self) -> None:
+        # Outro processo alterou o banco, sem dizer quais produtos: todas as
+        # versões avançam. A limpeza vem antes da nova base para que uma
+        # versão concorrente nunca sobreviva acima dela.
+        self._product_versions.clear()
+        self._base_version = next(self._version_counter)
+        self._version = self._base_version
+
+    def catalog_version(self) -> int:
+        """Versão do catálogo (incrementada a cada update ou add)."""
+        return self._version
+
+    def product_version(self, product_id: str) -> Optional[int]:
+        """Versão de um produto (a base se não foi alterado desde a invalidação)."""
+        version = self._product_versions.get(product_id)
+        if version is not None:
+            return version
+        row = self._db.connection().execute(_EXISTS, (product_id,)).fetchone()
+        return self._base_version if row is not None else None
+
+    def get_categories(self) -> List[str]:
+        """Retorna todas as categorias disponíveis."""
+        rows = self._db.connection().execute(_SELECT_CATEGORIES).fetchall()
+        return [r["category"] for r in rows]
+
+    def add(self, product: Product) -> None:
+        """Insere um novo produto (usado pela migração e por cargas de catálogo)."""
+        with self._db.transaction() as conn:
+            conn.execute(_INSERT, _to_row(product))
+        self._bump_versions_after_commit((product.id,))
@@ -0,0 +1,24 @@
+"""
+Adapter SQLite para a unidade de trabalho.
+
+Princípio DIP: Implementa UnitOfWorkPort sobre o SqliteDatabase.
+
+A unidade é uma transação (reentrante) da conexão da thread atual: as
+escritas são confirmadas juntas no COMMIT ou desfeitas juntas se o
+bloco levantar uma exceção.
+"""
+
+from typing import ContextManager
+from domain.ports import UnitOfWorkPort
+from .sqlite_database import SqliteDatabase
+
+
+class SqliteUnitOfWork(UnitOfWorkPort):
+    """Unidade de trabalho como uma transação SQLite."""
+
+    def __init__(self, database: SqliteDatabase):
+        self._database = database
+
+    def transaction(self) -> ContextManager[None]:
+        """Abre (ou participa de) uma transação de escrita."""
+        return self._database.transaction()
@@ -0,0 +1,73 @@
+"""
+Adapter SQLite para o repositório de usuários.
+
+Princípio LSP: Substituível por qualquer implementação de UserRepositoryPort.
+Princípio DIP: Implementa a interface definida no domínio.
+"""
+
+import sqlite3
+from typing import Optional
+from domain.ports import UserRepositoryPort
+from domain.entities.user import User
+from domain.exceptions import UserAlreadyExistsException
+from .sqlite_database import SqliteDatabase
+
+_COLUMNS = "id, name, email, password_hash, address, phone"
+
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM users WHERE id = ?"
+_SELECT_BY_EMAIL = f"SELECT {_COLUMNS} FROM users WHERE email_key = ?"
+_INSERT = (
+    "INSERT INTO users (id, name, email, email_key, password_hash, address, phone) "
+    "VALUES (:id, :name, :email, :email_key, :password_hash, :address, :phone)"
+)
+_UPDATE = (
+    "UPDATE users SET name = :name, email = :email, email_key = :email_key, "
+    "password_hash = :password_hash, address = :address, phone = :phone "
+    "WHERE id = :id"
+)
+
+
+def _to_row(user: User) -> dict:
+    row = user.to_dict_with_password()
+    row["email_key"] = user.email.casefold()
+    return row
+
+
+def _from_row(row: sqlite3.Row) -> User:
+    return User.from_dict(dict(row))
+
+
+class SqliteUserRepository(UserRepositoryPort):
+    """Implementação do repositório de usuários usando SQLite."""
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+
+    def get_by_id(self, user_id: str) -> Optional[User]:
+        """Retorna um usuário pelo ID."""
+        row = self._db.connection().execute(_SELECT_BY_ID, (user_id,)).fetchone()
+        return _from_row(row) if row is not None else None
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """Retorna um usuário pelo email."""
+        row = self._db.connection().execute(
+            _SELECT_BY_EMAIL, (email.casefold(),)
+        ).fetchone()
+        return _from_row(row) if row is not None else None
+
+    def create(self, user: User) -> User:
+        """Cria um novo usuário (UserAlreadyExistsException se o email já existe)."""
+        try:
+            with self._db.transaction() as conn:
+                conn.execute(_INSERT, _to_row(user))
+        except sqlite3.IntegrityError as e:
+            # O índice único de email_key decide entre cadastros simultâneos
+            if "email_key" in str(e):
+                raise UserAlreadyExistsException(user.email) from None
+            raise
+        return user
+
+    def update(self, user: User) -> None:
+        """Atualiza um usuário."""
+        with self._db.transaction() as conn:
+            conn.execute(_UPDATE, _to_row(user))
@@ -0,0 +1,33 @@
+"""
+Normalização de texto para busca.
+
+Converte para minúsculas (casefold) e remove acentos, de modo que
+"Calça", "CALCA" e "calça" sejam equivalentes.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def fold_text(text: str) -> str:
+    """Retorna o texto em minúsculas e sem acentos."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    if decomposed.isascii():
+        return decomposed
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=65536)
+def _fold_term(term: str) -> str:
+    # O vocabulário de um catálogo se repete muito: cada termo distinto
+    # é normalizado uma única vez.
+    return term if term.isascii() else fold_text(term)
+
+
+def tokenize(text: str) -> List[str]:
+    """Quebra o texto em termos alfanuméricos normalizados."""
+    return [_fold_term(term) for term in _TOKEN_RE.findall(text.casefold())]
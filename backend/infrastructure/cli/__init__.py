@@ -0,0 +1 @@
+# CLI - Ferramentas de linha de comando (migração, manutenção)
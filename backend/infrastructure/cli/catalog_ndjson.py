@@ -0,0 +1,124 @@
+"""
+Exportação e importação do catálogo de produtos em NDJSON.
+
+Um produto por linha, no mesmo formato da API (ver Product.to_dict). A
+exportação lê o catálogo em lotes e a importação grava em lotes (incluindo
+produtos novos e atualizando os existentes pelo id), de modo que o arquivo
+nunca é carregado inteiro. A importação valida todos os registros antes de
+gravar qualquer um (um registro inválido não altera nada) e depois grava
+os lotes em uma única unidade de trabalho: no JSON, o data.json é gravado
+uma única vez, no final.
+
+Uso (a partir do diretório backend):
+    python -m infrastructure.cli.catalog_ndjson export [ARQUIVO|-] [--backend json|sqlite]
+    python -m infrastructure.cli.catalog_ndjson import [ARQUIVO|-] [--backend json|sqlite]
+        [--json PATH] [--sqlite PATH] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from typing import BinaryIO, Optional, Tuple
+from application.services import ProductService
+from domain.exceptions import InvalidImportRecordException
+from infrastructure.adapters import (
+    AsyncProductRepositoryBridge,
+    AsyncUnitOfWorkBridge,
+    JsonDocumentStore,
+    JsonProductRepository,
+    JsonUnitOfWork,
+    SqliteDatabase,
+    SqliteProductRepository,
+    SqliteUnitOfWork,
+)
+from infrastructure.adapters import ndjson
+
+_DATABASE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "database"
+)
+
+
+def _open_service(
+    args: argparse.Namespace,
+) -> Tuple[ProductService, Optional[JsonDocumentStore]]:
+    """Monta o serviço de produtos sobre o backend escolhido."""
+    store = None
+    if args.backend == "json":
+        store = JsonDocumentStore(args.json)
+        repository, unit_of_work = JsonProductRepository(store), JsonUnitOfWork(store)
+    else:
+        database = SqliteDatabase(args.sqlite)
+        repository, unit_of_work = SqliteProductRepository(database), SqliteUnitOfWork(database)
+    service = ProductService(
+        AsyncProductRepositoryBridge(repository),
+        AsyncUnitOfWorkBridge(unit_of_work, exclusive=True),
+    )
+    return service, store
+
+
+async def export_catalog(service: ProductService, output: BinaryIO, batch_size: int) -> int:
+    """Grava o catálogo em output; retorna a quantidade de produtos."""
+    count = 0
+    async for batch in service.export_products(batch_size):
+        output.write(ndjson.encode_lines(p.to_dict() for p in batch))
+        count += len(batch)
+    output.flush()
+    return count
+
+
+async def import_catalog(service: ProductService, source: BinaryIO, batch_size: int) -> dict:
+    """Importa os produtos de source; retorna o resumo da importação."""
+    return await service.import_products(
+        ndjson.iter_records(ndjson.read_file(source)), batch_size
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Exporta/importa o catálogo em NDJSON.")
+    parser.add_argument("command", choices=("export", "import"))
+    parser.add_argument("file", nargs="?", default="-", help="Arquivo NDJSON ('-' = stdin/stdout)")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    parser.add_argument(
+        "--json", default=os.path.join(_DATABASE_DIR, "data.json"),
+        help="Arquivo JSON do banco (backend json)",
+    )
+    parser.add_argument(
+        "--sqlite", default=os.path.join(_DATABASE_DIR, "data.sqlite3"),
+        help="Banco SQLite (backend sqlite)",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    service, store = _open_service(args)
+    try:
+        if args.command == "export":
+            if args.file == "-":
+                count = asyncio.run(export_catalog(service, sys.stdout.buffer, args.batch_size))
+            else:
+                with open(args.file, "wb") as f:
+                    count = asyncio.run(export_catalog(service, f, args.batch_size))
+            print(f"Exportação concluída: {count} produtos.", file=sys.stderr)
+        else:
+            try:
+                if args.file == "-":
+                    summary = asyncio.run(import_catalog(service, sys.stdin.buffer, args.batch_size))
+                else:
+                    with open(args.file, "rb") as f:
+                        summary = asyncio.run(import_catalog(service, f, args.batch_size))
+            except InvalidImportRecordException as e:
+                print(f"Erro: {e}", file=sys.stderr)
+                return 1
+            print(
+                f"Importação concluída: {summary['imported']} produtos "
+                f"({summary['created']} novos, {summary['updated']} atualizados).",
+                file=sys.stderr,
+            )
+    finally:
+        if store is not None:
+            store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Migração única do data.json para um banco SQLite.
+
+Copia produtos, usuários e pedidos (snapshot + journal de pedidos) para
+o banco indicado, dentro de uma única transação. Recusa-se a rodar se o
+banco de destino já contiver dados.
+
+Uso (a partir do diretório backend):
+    python -m infrastructure.cli.migrate_json_to_sqlite [--json PATH] [--sqlite PATH]
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict
+from domain.entities.product import Product
+from domain.entities.user import User
+from domain.entities.order import Order
+from infrastructure.adapters.order_journal import OrderJournal
+from infrastructure.adapters.sqlite_database import SqliteDatabase
+from infrastructure.adapters.sqlite_product_repository import SqliteProductRepository
+from infrastructure.adapters.sqlite_user_repository import SqliteUserRepository
+from infrastructure.adapters.sqlite_order_repository import SqliteOrderRepository
+
+_DATABASE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "database"
+)
+
+
+def migrate(json_path: str, sqlite_path: str) -> Dict[str, int]:
+    """Migra o conteúdo de json_path para sqlite_path e retorna as contagens."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    raw_orders = {o["id"]: o for o in data.get("orders", [])}
+    journal = OrderJournal(os.path.splitext(json_path)[0] + ".orders.journal")
+    for record in journal.replay():
+        raw_orders[record["order"]["id"]] = record["order"]
+
+    database = SqliteDatabase(sqlite_path)
+    conn = database.connection()
+    for table in ("products", "users", "orders"):
+        if conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+            raise RuntimeError(
+                f"O banco '{sqlite_path}' já contém dados na tabela '{table}'."
+            )
+
+    products = SqliteProductRepository(database)
+    users = SqliteUserRepository(database)
+    orders = SqliteOrderRepository(database)
+
+    with database.transaction():
+        for raw in data.get("products", []):
+            products.add(Product.from_dict(raw))
+        for raw in data.get("users", []):
+            users.create(User.from_dict(raw))
+        for raw in raw_orders.values():
+            orders.create(Order.from_dict(raw))
+
+    return {
+        "products": len(data.get("products", [])),
+        "users": len(data.get("users", [])),
+        "orders": len(raw_orders),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Migra o data.json para SQLite.")
+    parser.add_argument(
+        "--json", default=os.path.join(_DATABASE_DIR, "data.json"),
+        help="Arquivo JSON de origem",
+    )
+    parser.add_argument(
+        "--sqlite", default=os.path.join(_DATABASE_DIR, "data.sqlite3"),
+        help="Banco SQLite de destino",
+    )
+    args = parser.parse_args()
+
+    try:
+        counts = migrate(args.json, args.sqlite)
+    except RuntimeError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+    print(
+        f"Migração concluída: {counts['products']} produtos, "
+        f"{counts['users']} usuários, {counts['orders']} pedidos."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
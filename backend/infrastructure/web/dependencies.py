@@ -7,33 +7,189 @@ conectando as implementações concretas (adapters) às abstrações (ports).
 Este é o único lugar onde as implementações concretas são instanciadas.
 """
 
+import asyncio
 import os
+import secrets
+import time
 from infrastructure.adapters import (
+    JsonDocumentStore,
+    JsonDocumentWatcher,
     JsonProductRepository,
     JsonUserRepository,
     JsonOrderRepository,
+    JsonUnitOfWork,
+    HmacSessionTokens,
+    MetricsRegistry,
+    PooledPasswordHasher,
+    make_kdf,
+    SqliteDatabase,
+    SqliteProductRepository,
+    SqliteUserRepository,
+    SqliteOrderRepository,
+    SqliteUnitOfWork,
+    AsyncProductRepositoryBridge,
+    AsyncUserRepositoryBridge,
+    AsyncOrderRepositoryBridge,
+    AsyncUnitOfWorkBridge,
 )
 from application.services import ProductService, UserService, OrderService
 
-# Caminho para o arquivo JSON do banco de dados
-DATABASE_PATH = os.path.join(
+_DATABASE_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
     "infrastructure",
     "database",
-    "data.json",
 )
 
+# --- Configuração (variáveis de ambiente) ---
+# STORAGE_BACKEND: "json" (padrão) ou "sqlite"
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "json").lower()
+
+# Caminho para o arquivo JSON do banco de dados
+DATABASE_PATH = os.environ.get(
+    "DATABASE_PATH", os.path.join(_DATABASE_DIR, "data.json")
+)
+
+# Caminho para o banco SQLite (gerado por infrastructure.cli.migrate_json_to_sqlite)
+SQLITE_PATH = os.environ.get(
+    "SQLITE_PATH", os.path.join(_DATABASE_DIR, "data.sqlite3")
+)
+
+# Durabilidade do data.json (ver JsonDocumentStore):
+# "sync" (padrão) grava e sincroniza ao final de cada operação;
+# "interval" grava em segundo plano, com fsync por grupo de alterações;
+# "off" grava em segundo plano sem fsync.
+DURABILITY = os.environ.get("DURABILITY", "sync").lower()
+
+# Nos modos de fundo: intervalo (ms) entre flushes e quantidade de
+# alterações pendentes que antecipa o flush (0 = somente por intervalo)
+FLUSH_INTERVAL_MS = int(os.environ.get("FLUSH_INTERVAL_MS", "1000"))
+FLUSH_MAX_DIRTY = int(os.environ.get("FLUSH_MAX_DIRTY", "1000"))
+
+# Intervalo (ms) entre as verificações de edições externas do data.json
+# (recarga a quente do catálogo). 0 desativa a verificação.
+WATCH_INTERVAL_MS = int(os.environ.get("WATCH_INTERVAL_MS", "1000"))
+
+# Quantidade de processos do uvicorn. Com mais de um, os adapters entram
+# no modo compartilhado: cada processo enxerga as escritas dos outros.
+WORKERS = int(os.environ.get("WORKERS", "1"))
+SHARED = WORKERS > 1
+
+# Segredo usado para assinar os tokens de sessão. Sem ele, um segredo
+# aleatório é gerado e as sessões não sobrevivem a um restart. Com vários
+# workers o segredo precisa ser o mesmo em todos (ver main.py).
+SESSION_SECRET = os.environ.get("SESSION_SECRET") or secrets.token_hex(32)
+
+# Validade (s) dos tokens de sessão emitidos no login
+SESSION_TTL_SECONDS = int(os.environ.get("SESSION_TTL_SECONDS", str(8 * 3600)))
+
+# Token exigido (cabeçalho X-Admin-Token) nas operações administrativas,
+# como a importação do catálogo. Sem ele, essas operações ficam desativadas.
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+
+# KDF dos hashes de senha: "pbkdf2" (padrão) ou "scrypt". Hashes antigos
+# (SHA-256) continuam aceitos e são refeitos no login.
+PASSWORD_KDF = os.environ.get("PASSWORD_KDF", "pbkdf2").lower()
+
+# Pool de hash: workers, cálculos que podem aguardar na fila (acima disso
+# register/login respondem 503) e se o pool usa processos em vez de threads.
+# Um hash PBKDF2 com os parâmetros padrão (600 mil iterações) custa de
+# 0,25 a 0,6 s de CPU, então o pool atende até HASH_WORKERS / 0,6 logins
+# por segundo por processo, e workers acima do número de núcleos não
+# aumentam a vazão. A fila padrão (4 cálculos por worker) limita a espera
+# de quem entra nela a uns 4 hashes (até ~2,5 s) em vez de deixá-la crescer.
+HASH_WORKERS = int(os.environ.get("HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+HASH_MAX_QUEUE = int(os.environ.get("HASH_MAX_QUEUE", str(4 * HASH_WORKERS)))
+HASH_PROCESSES = os.environ.get("HASH_PROCESSES", "0") == "1"
+
+# Motor de filtros e ordenação do catálogo JSON: "1" usa colunas NumPy
+# (catálogos grandes; exige numpy instalado), "0" os índices de facetas
+CATALOG_COLUMNAR = os.environ.get("CATALOG_COLUMNAR", "0") == "1"
+
+# --- Métricas (expostas em /metrics) ---
+_metrics = MetricsRegistry()
+_load_seconds = _metrics.gauge(
+    "repository_load_seconds",
+    "Duração da carga de cada repositório na inicialização (entidades e índices).",
+    ("repository",),
+)
+
+
+def _timed_load(name: str, factory):
+    """Instancia um repositório medindo a carga inicial."""
+    start = time.perf_counter()
+    repository = factory()
+    _load_seconds.labels(name).set(time.perf_counter() - start)
+    return repository
+
+
 # --- Repositórios (Adapters) ---
 # Instanciamos as implementações concretas aqui
-_product_repository = JsonProductRepository(DATABASE_PATH)
-_user_repository = JsonUserRepository(DATABASE_PATH)
-_order_repository = JsonOrderRepository(DATABASE_PATH)
+if STORAGE_BACKEND == "json":
+    # Um único documento compartilhado: o arquivo é lido uma vez só
+    _store = JsonDocumentStore(
+        DATABASE_PATH,
+        durability=DURABILITY,
+        flush_interval=FLUSH_INTERVAL_MS / 1000,
+        max_dirty=FLUSH_MAX_DIRTY,
+        shared=SHARED,
+        metrics=_metrics,
+    )
+    _product_repository = _timed_load(
+        "products", lambda: JsonProductRepository(_store, columnar=CATALOG_COLUMNAR)
+    )
+    _user_repository = _timed_load("users", lambda: JsonUserRepository(_store))
+    _order_repository = _timed_load("orders", lambda: JsonOrderRepository(_store))
+    _unit_of_work = JsonUnitOfWork(_store)
+    _shared_state = _store
+    _watcher = (
+        JsonDocumentWatcher(_store, WATCH_INTERVAL_MS / 1000)
+        if WATCH_INTERVAL_MS > 0
+        else None
+    )
+    # Os repositórios JSON leem da memória: leituras direto no event loop
+    _inline_reads = True
+    _exclusive_units = False
+elif STORAGE_BACKEND == "sqlite":
+    _database = SqliteDatabase(SQLITE_PATH, shared=SHARED)
+    _product_repository = SqliteProductRepository(_database)
+    _user_repository = SqliteUserRepository(_database)
+    _order_repository = SqliteOrderRepository(_database)
+    _unit_of_work = SqliteUnitOfWork(_database)
+    _shared_state = _database
+    _watcher = None
+    _inline_reads = False
+    # Um escritor por vez no SQLite: as transações aguardam na fila do loop
+    _exclusive_units = True
+else:
+    raise ValueError(
+        f"STORAGE_BACKEND inválido: '{STORAGE_BACKEND}'. Use 'json' ou 'sqlite'."
+    )
+
+# --- Ports assíncronos ---
+# Os adapters síncronos atendem os serviços assíncronos através da ponte
+_async_product_repository = AsyncProductRepositoryBridge(_product_repository, _inline_reads)
+_async_user_repository = AsyncUserRepositoryBridge(_user_repository, _inline_reads)
+_async_order_repository = AsyncOrderRepositoryBridge(_order_repository, _inline_reads)
+_async_unit_of_work = AsyncUnitOfWorkBridge(_unit_of_work, exclusive=_exclusive_units)
 
 # --- Services (Use Cases) ---
 # Injetamos as abstrações nos serviços
-_product_service = ProductService(_product_repository)
-_user_service = UserService(_user_repository)
-_order_service = OrderService(_order_repository, _product_repository)
+_product_service = ProductService(_async_product_repository, _async_unit_of_work)
+_session_tokens = HmacSessionTokens(SESSION_SECRET.encode(), SESSION_TTL_SECONDS)
+_password_hasher = PooledPasswordHasher(
+    make_kdf(PASSWORD_KDF),
+    workers=HASH_WORKERS,
+    max_queue=HASH_MAX_QUEUE,
+    processes=HASH_PROCESSES,
+)
+_user_service = UserService(_async_user_repository, _password_hasher, _session_tokens)
+_metrics.gauge_function(
+    "catalog_products", "Produtos no catálogo.", _product_repository.count
+)
+_metrics.register_cache("session_tokens", _session_tokens.cache_stats)
+_order_service = OrderService(
+    _async_order_repository, _async_product_repository, _async_unit_of_work
+)
 
 
 def get_product_service() -> ProductService:
@@ -49,3 +205,30 @@ def get_user_service() -> UserService:
 def get_order_service() -> OrderService:
     """Retorna a instância do serviço de pedidos."""
     return _order_service
+
+
+def get_metrics() -> MetricsRegistry:
+    """Retorna o registro de métricas da aplicação."""
+    return _metrics
+
+
+async def refresh_shared_state() -> None:
+    """Com vários workers, aplica o que os outros processos gravaram."""
+    if _shared_state.is_stale():
+        await asyncio.to_thread(_shared_state.refresh)
+
+
+def startup() -> None:
+    """Inicia as tarefas de fundo (chamado na inicialização da aplicação)."""
+    if _watcher is not None:
+        _watcher.start()
+
+
+def shutdown() -> None:
+    """Persiste as alterações pendentes (chamado no encerramento da aplicação)."""
+    if _watcher is not None:
+        _watcher.stop()
+    _password_hasher.close()
+    _async_unit_of_work.close()
+    if STORAGE_BACKEND == "json":
+        _store.close()
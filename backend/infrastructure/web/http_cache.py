@@ -0,0 +1,68 @@
+"""
+Requisições condicionais HTTP (ETag / If-None-Match).
+
+As rotas de catálogo derivam o ETag da versão dos dados (ver
+ProductRepositoryPort.catalog_version) e, se o cliente já tem essa
+versão, respondem 304 sem montar nem serializar o corpo.
+
+Os contadores de versão recomeçam a cada inicialização; por isso o ETag
+inclui uma época do processo, e um ETag emitido antes de um restart (ou
+por outro worker) nunca é confundido com um atual.
+
+is_fresh contabiliza as revalidações: respostas 304 são acertos do cache
+do cliente, as demais consultas são falhas (ver revalidation_stats).
+"""
+
+import os
+import time
+from typing import Optional, Tuple
+from fastapi import Request, Response
+
+# Época do processo: diferencia ETags de execuções e workers distintos
+BOOT_EPOCH = f"{time.time_ns():x}{os.getpid():x}"
+
+# O cliente pode guardar a resposta, mas deve revalidá-la a cada uso
+CACHE_CONTROL = "no-cache"
+
+# Consultas às rotas com ETag respondidas com 304 / com o corpo completo
+_fresh = 0
+_stale = 0
+
+
+def make_etag(*parts: object) -> str:
+    """Monta um ETag forte a partir da época e das partes (ex.: versões)."""
+    return '"' + "-".join([BOOT_EPOCH, *(str(p) for p in parts)]) + '"'
+
+
+def is_fresh(request: Request, etag: str) -> bool:
+    """Indica se o If-None-Match da requisição casa com o ETag atual."""
+    global _fresh, _stale
+    header: Optional[str] = request.headers.get("if-none-match")
+    fresh = False
+    if header:
+        # Comparação fraca (RFC 9110): o prefixo W/ é ignorado
+        candidates = (c.strip() for c in header.split(","))
+        fresh = header.strip() == "*" or any(c.removeprefix("W/") == etag for c in candidates)
+    if fresh:
+        _fresh += 1
+    else:
+        _stale += 1
+    return fresh
+
+
+def revalidation_stats() -> Tuple[int, int]:
+    """(respostas 304, respostas completas) das rotas com ETag."""
+    return _fresh, _stale
+
+
+def not_modified(etag: str) -> Response:
+    """Resposta 304, sem corpo."""
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    """Adiciona o ETag e a política de cache a uma resposta 200."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
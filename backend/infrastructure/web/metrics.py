@@ -0,0 +1,110 @@
+"""
+Métricas HTTP por rota.
+
+MetricsMiddleware é um middleware ASGI puro (sem o BaseHTTPMiddleware,
+que acrescenta uma task e filas por requisição) que mede, para cada
+rota, a latência até o último byte da resposta, as requisições em
+andamento e a contagem por status.
+
+A rota é identificada pelo template (ex.: /api/products/{product_id}),
+não pelo caminho, para que a quantidade de séries não cresça com os ids.
+A resolução do template (junto com as séries da rota) é guardada por
+(método, caminho) em um dicionário limitado; caminhos sem rota ficam
+agrupados em "unmatched".
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from infrastructure.adapters import MetricsRegistry
+
+UNMATCHED = "unmatched"
+# Entradas da resolução de rotas guardadas antes de o dicionário ser limpo
+MAX_RESOLVED_PATHS = 4096
+
+
+@dataclass(slots=True)
+class _RouteSeries:
+    """Séries de uma combinação (método, rota)."""
+
+    method: str
+    route: str
+    latency: object
+    in_flight: object
+    # status -> série de http_requests_total
+    statuses: Dict[int, object] = field(default_factory=dict)
+
+
+class MetricsMiddleware:
+    """Latência, requisições em andamento e status por rota."""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        self.app = app
+        self._resolved: Dict[Tuple[str, str], _RouteSeries] = {}
+        self._latency = registry.histogram(
+            "http_request_duration_seconds",
+            "Latência das requisições até o fim da resposta.",
+            ("method", "route"),
+        )
+        self._in_flight = registry.gauge(
+            "http_requests_in_flight", "Requisições em andamento.", ("method", "route")
+        )
+        self._requests = registry.counter(
+            "http_requests_total", "Requisições respondidas por status.",
+            ("method", "route", "status"),
+        )
+
+    def _series_of(self, scope: Scope) -> _RouteSeries:
+        method = scope["method"]
+        key = (method, scope["path"])
+        series = self._resolved.get(key)
+        if series is None:
+            route = UNMATCHED
+            for candidate in scope["app"].router.routes:
+                match, _ = candidate.matches(scope)
+                if match == Match.FULL:
+                    route = candidate.path
+                    break
+                if match == Match.PARTIAL and route == UNMATCHED:
+                    # Caminho certo, método errado (405)
+                    route = candidate.path
+            series = _RouteSeries(
+                method,
+                route,
+                self._latency.labels(method, route),
+                self._in_flight.labels(method, route),
+            )
+            if len(self._resolved) >= MAX_RESOLVED_PATHS:
+                self._resolved.clear()
+            self._resolved[key] = series
+        return series
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        series = self._series_of(scope)
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        series.in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            series.latency.observe(time.perf_counter() - start)
+            series.in_flight.dec()
+            requests = series.statuses.get(status)
+            if requests is None:
+                requests = series.statuses[status] = self._requests.labels(
+                    series.method, series.route, str(status)
+                )
+            requests.inc()
@@ -0,0 +1,94 @@
+"""
+Cache de produtos já serializados em JSON.
+
+Cada produto é codificado uma vez e reaproveitado até ser alterado: o
+cache guarda, por id, os bytes JSON junto com a versão do produto (ver
+ProductRepositoryPort.product_version) e os descarta quando a versão
+muda. As listagens são montadas concatenando esses fragmentos no corpo
+de uma Response crua, sem passar pelo jsonable_encoder a cada requisição.
+
+O JSON gerado é o mesmo da JSONResponse do FastAPI (UTF-8, sem espaços).
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Tuple
+from application.services import ProductService
+from domain.entities.product import Product
+
+MEDIA_TYPE = "application/json"
+
+# Mesmas opções da JSONResponse; um encoder único evita recriá-lo a cada
+# chamada (json.dumps com opções não padrão instancia um por chamada)
+_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def encode_json(value: Any) -> bytes:
+    """Codifica um valor como a JSONResponse do FastAPI."""
+    return _ENCODER.encode(value).encode("utf-8")
+
+
+class ProductJsonCache:
+    """Bytes JSON de cada produto, validados pela versão do produto."""
+
+    def __init__(self, service: ProductService):
+        self._service = service
+        self._entries: Dict[str, Tuple[int, bytes]] = {}
+        # Fragmentos reaproveitados e codificados (ver cache_stats)
+        self._hits = 0
+        self._misses = 0
+
+    def cache_stats(self) -> Tuple[int, int]:
+        """(acertos, falhas) acumulados, por produto codificado."""
+        return self._hits, self._misses
+
+    def encode(self, product: Product, catalog_version: int) -> bytes:
+        """JSON de um produto (ver encode_many)."""
+        return self.encode_many((product,), catalog_version)[0]
+
+    def encode_many(
+        self, products: Iterable[Product], catalog_version: int
+    ) -> List[bytes]:
+        """
+        JSON de cada produto, reaproveitando os fragmentos em cache.
+
+        catalog_version deve ser lida antes de os produtos serem obtidos do
+        serviço: um fragmento só é guardado se a versão do produto não for
+        posterior a ela, o que garante que os bytes refletem essa versão
+        (uma alteração concorrente nunca fica em cache com a versão nova).
+        """
+        entries = self._entries
+        version_of = self._service.product_version
+        fragments = []
+        misses = 0
+        for product in products:
+            version = version_of(product.id)
+            cached = entries.get(product.id)
+            if cached is not None and cached[0] == version:
+                fragments.append(cached[1])
+                continue
+            misses += 1
+            data = encode_json(product.to_dict())
+            if version is not None and version <= catalog_version:
+                entries[product.id] = (version, data)
+            fragments.append(data)
+        self._hits += len(fragments) - misses
+        self._misses += misses
+        return fragments
+
+
+def join_object(**members: Any) -> bytes:
+    """
+    Monta um objeto JSON em que os valores bytes são fragmentos já
+    codificados (inseridos como estão) e os demais são codificados aqui.
+    Listas de bytes viram arrays de fragmentos.
+    """
+    parts = []
+    for name, value in members.items():
+        if isinstance(value, bytes):
+            encoded = value
+        elif isinstance(value, list) and all(isinstance(v, bytes) for v in value):
+            encoded = b"[" + b",".join(value) + b"]"
+        else:
+            encoded = encode_json(value)
+        parts.append(encode_json(name) + b":" + encoded)
+    return b"{" + b",".join(parts) + b"}"
@@ -0,0 +1,24 @@
+"""
+Rota de Métricas - Adapter Web (entrada HTTP).
+
+Princípio SRP: Responsável apenas por expor o registro de métricas no
+formato texto do Prometheus.
+"""
+
+from fastapi import APIRouter, Response
+from infrastructure.adapters.metrics_registry import CONTENT_TYPE
+from infrastructure.web.dependencies import get_metrics
+
+router = APIRouter(tags=["Métricas"])
+registry = get_metrics()
+
+
+@router.get("/metrics")
+def metrics():
+    """
+    Métricas do processo (latência por rota, E/S do armazenamento, caches).
+
+    Síncrona de propósito: roda no threadpool, e as métricas calculadas na
+    coleta (como a contagem do catálogo no SQLite) não bloqueiam o loop.
+    """
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
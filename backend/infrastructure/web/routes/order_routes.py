@@ -4,15 +4,19 @@ Rotas de Pedidos - Adapter Web (entrada HTTP).
 Princípio SRP: Responsável apenas por receber requisições HTTP.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
+from infrastructure.adapters import ndjson
 from infrastructure.web.dependencies import get_order_service
 from domain.entities.cart import Cart, CartItem
 from domain.exceptions import (
     OrderNotFoundException,
     EmptyCartException,
     InsufficientStockException,
+    InvalidCursorException,
+    InvalidSortException,
     ProductNotFoundException,
 )
 
@@ -41,7 +45,7 @@ class CreateOrderRequest(BaseModel):
 # --- Endpoints ---
 
 @router.post("/")
-def create_order(request: CreateOrderRequest):
+async def create_order(request: CreateOrderRequest):
     """Cria um novo pedido a partir dos itens do carrinho."""
     try:
         cart = Cart(user_id=request.user_id)
@@ -58,7 +62,7 @@ def create_order(request: CreateOrderRequest):
                 )
             )
 
-        order = service.create_order_from_cart(
+        order = await service.create_order_from_cart(
             cart=cart,
             shipping_address=request.shipping_address,
         )
@@ -72,33 +76,67 @@ def create_order(request: CreateOrderRequest):
         raise HTTPException(status_code=404, detail=str(e))
     except InsufficientStockException as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/user/{user_id}")
-def get_user_orders(user_id: str):
-    """Lista todos os pedidos de um usuário."""
-    orders = service.get_user_orders(user_id)
+async def get_user_orders(
+    user_id: str,
+    sort: Optional[str] = Query(
+        None, description="created_at (padrão) ou -created_at (mais recentes primeiro)"
+    ),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Pedidos por página"),
+    cursor: Optional[str] = Query(None, description="next_cursor da página anterior"),
+    stream: bool = Query(
+        False, description="Envia todos os pedidos (a partir do cursor) em NDJSON"
+    ),
+):
+    """Lista os pedidos de um usuário, paginados ou em streaming."""
+    if stream:
+        batches = service.iter_user_orders(user_id, sort=sort, cursor=cursor)
+        try:
+            # A primeira página valida sort e cursor antes de a resposta começar
+            first = await anext(batches, None)
+        except (InvalidSortException, InvalidCursorException) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        async def body():
+            if first is not None:
+                yield ndjson.encode_lines(o.to_dict() for o in first)
+                async for batch in batches:
+                    yield ndjson.encode_lines(o.to_dict() for o in batch)
+
+        return StreamingResponse(body(), media_type=ndjson.MEDIA_TYPE)
+
+    try:
+        page = await service.get_user_orders_page(
+            user_id, sort=sort, limit=limit, cursor=cursor
+        )
+    except (InvalidSortException, InvalidCursorException) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {
-        "orders": [o.to_dict() for o in orders],
-        "total": len(orders),
+        "orders": [o.to_dict() for o in page.items],
+        "total": page.total,
+        "next_cursor": page.next_cursor,
     }
 
 
 @router.get("/{order_id}")
-def get_order(order_id: str):
+async def get_order(order_id: str):
     """Busca um pedido pelo ID."""
     try:
-        order = service.get_order(order_id)
+        order = await service.get_order(order_id)
         return order.to_dict()
     except OrderNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.put("/{order_id}/cancel")
-def cancel_order(order_id: str):
+async def cancel_order(order_id: str):
     """Cancela um pedido."""
     try:
-        order = service.cancel_order(order_id)
+        order = await service.cancel_order(order_id)
         return {
             "message": "Pedido cancelado com sucesso!",
             "order": order.to_dict(),
@@ -5,48 +5,149 @@ Princípio SRP: Responsável apenas por receber requisições HTTP
 e delegar ao serviço de aplicação.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from infrastructure.web.dependencies import get_product_service
-from domain.exceptions import ProductNotFoundException
+from infrastructure.adapters import ndjson
+from infrastructure.web.dependencies import get_metrics, get_product_service
+from infrastructure.web.http_cache import (
+    is_fresh,
+    make_etag,
+    not_modified,
+    revalidation_stats,
+    set_cache_headers,
+)
+from infrastructure.web.product_json_cache import (
+    MEDIA_TYPE,
+    ProductJsonCache,
+    join_object,
+)
+from infrastructure.web.session import require_admin
+from domain.exceptions import (
+    InvalidCursorException,
+    InvalidImportRecordException,
+    InvalidSortException,
+    ProductNotFoundException,
+)
 
 router = APIRouter(prefix="/api/products", tags=["Produtos"])
 service = get_product_service()
+# Produtos já serializados, reaproveitados entre requisições
+payloads = ProductJsonCache(service)
+get_metrics().register_cache("product_json", payloads.cache_stats)
+get_metrics().register_cache("http_etag", revalidation_stats)
 
 
 @router.get("/")
-def list_products(
+async def list_products(
+    request: Request,
     category: Optional[str] = Query(None, description="Filtrar por categoria"),
     gender: Optional[str] = Query(None, description="Filtrar por gênero"),
     min_price: Optional[float] = Query(None, description="Preço mínimo"),
     max_price: Optional[float] = Query(None, description="Preço máximo"),
     size: Optional[str] = Query(None, description="Filtrar por tamanho"),
     search: Optional[str] = Query(None, description="Buscar por termo"),
+    sort: Optional[str] = Query(
+        None,
+        description="Ordenação: price, rating, reviews_count ou name (prefixo '-' = decrescente)",
+    ),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Itens por página"),
+    cursor: Optional[str] = Query(None, description="next_cursor da página anterior"),
 ):
-    """Lista produtos com filtros opcionais."""
-    products = service.filter_products(
-        category=category,
-        gender=gender,
-        min_price=min_price,
-        max_price=max_price,
-        size=size,
-        search=search,
+    """Lista produtos com filtros, ordenação e paginação opcionais."""
+    # O ETag vale por URL: a versão do catálogo basta para qualquer consulta
+    version = service.catalog_version()
+    etag = make_etag("catalog", version)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    try:
+        page = await service.filter_products_page(
+            category=category,
+            gender=gender,
+            min_price=min_price,
+            max_price=max_price,
+            size=size,
+            search=search,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+        )
+    except (InvalidSortException, InvalidCursorException) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    body = join_object(
+        products=payloads.encode_many(page.items, version),
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
-    return {"products": [p.to_dict() for p in products], "total": len(products)}
+    response = Response(content=body, media_type=MEDIA_TYPE)
+    set_cache_headers(response, etag)
+    return response
 
 
 @router.get("/categories")
-def list_categories():
+async def list_categories(request: Request, response: Response):
     """Lista todas as categorias disponíveis."""
-    categories = service.get_categories()
+    etag = make_etag("catalog", service.catalog_version())
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    categories = await service.get_categories()
+    set_cache_headers(response, etag)
     return {"categories": categories}
 
 
+@router.get("/export")
+async def export_products(
+    batch_size: int = Query(1000, ge=1, le=10_000, description="Produtos por lote lido"),
+):
+    """Exporta o catálogo inteiro em NDJSON (um produto por linha), em streaming."""
+    async def body():
+        async for batch in service.export_products(batch_size):
+            yield ndjson.encode_lines(p.to_dict() for p in batch)
+
+    return StreamingResponse(
+        body(),
+        media_type=ndjson.MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="products.ndjson"'},
+    )
+
+
+@router.post("/import", dependencies=[Depends(require_admin)])
+async def import_products(
+    request: Request,
+    batch_size: int = Query(1000, ge=1, le=10_000, description="Produtos por lote gravado"),
+):
+    """
+    Importa produtos em NDJSON (corpo da requisição, lido em streaming):
+    inclui os novos e atualiza os existentes pelo id.
+    """
+    try:
+        summary = await service.import_products(
+            ndjson.iter_records(request.stream()), batch_size
+        )
+    except InvalidImportRecordException as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"message": "Importação concluída.", **summary}
+
+
 @router.get("/{product_id}")
-def get_product(product_id: str):
+async def get_product(product_id: str, request: Request):
     """Busca um produto pelo ID."""
+    catalog_version = service.catalog_version()
+    version = service.product_version(product_id)
+    if version is not None:
+        etag = make_etag("product", product_id, version)
+        if is_fresh(request, etag):
+            return not_modified(etag)
+
     try:
-        product = service.get_product_by_id(product_id)
-        return product.to_dict()
+        product = await service.get_product_by_id(product_id)
     except ProductNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
+    response = Response(
+        content=payloads.encode(product, catalog_version), media_type=MEDIA_TYPE
+    )
+    if version is not None:
+        set_cache_headers(response, etag)
+    return response
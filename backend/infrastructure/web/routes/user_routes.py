@@ -4,14 +4,16 @@ Rotas de Usuários - Adapter Web (entrada HTTP).
 Princípio SRP: Responsável apenas por receber requisições HTTP.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from infrastructure.web.dependencies import get_user_service
+from infrastructure.web.session import bearer_token, current_user_id
 from domain.exceptions import (
     UserNotFoundException,
     UserAlreadyExistsException,
     InvalidCredentialsException,
+    HashingOverloadedException,
 )
 
 router = APIRouter(prefix="/api/users", tags=["Usuários"])
@@ -39,13 +41,18 @@ class UpdateProfileRequest(BaseModel):
     phone: Optional[str] = None
 
 
+def _overloaded(e: HashingOverloadedException) -> HTTPException:
+    """Pool de hash cheio: o cliente deve tentar de novo em seguida."""
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+
 # --- Endpoints ---
 
 @router.post("/register")
-def register(request: RegisterRequest):
+async def register(request: RegisterRequest):
     """Registra um novo usuário."""
     try:
-        user = service.register(
+        user = await service.register(
             name=request.name,
             email=request.email,
             password=request.password,
@@ -55,33 +62,60 @@ def register(request: RegisterRequest):
         return {"message": "Usuário registrado com sucesso!", "user": user.to_dict()}
     except UserAlreadyExistsException as e:
         raise HTTPException(status_code=409, detail=str(e))
+    except HashingOverloadedException as e:
+        raise _overloaded(e)
 
 
 @router.post("/login")
-def login(request: LoginRequest):
+async def login(request: LoginRequest):
     """Autentica um usuário."""
     try:
-        user = service.login(email=request.email, password=request.password)
-        return {"message": "Login realizado com sucesso!", "user": user.to_dict()}
+        user = await service.login(email=request.email, password=request.password)
+        return {
+            "message": "Login realizado com sucesso!",
+            "user": user.to_dict(),
+            # Enviar nas próximas chamadas como "Authorization: Bearer <token>"
+            "token": service.issue_session(user),
+            "expires_in": service.session_ttl,
+        }
     except InvalidCredentialsException as e:
         raise HTTPException(status_code=401, detail=str(e))
+    except HashingOverloadedException as e:
+        raise _overloaded(e)
+
+
+@router.post("/logout")
+async def logout(authorization: Optional[str] = Header(None)):
+    """Encerra a sessão do token enviado."""
+    service.logout(bearer_token(authorization))
+    return {"message": "Sessão encerrada."}
+
+
+@router.get("/me")
+async def get_current_user(user_id: str = Depends(current_user_id)):
+    """Retorna o usuário dono do token de sessão."""
+    try:
+        user = await service.get_user_by_id(user_id)
+        return user.to_dict()
+    except UserNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.get("/{user_id}")
-def get_user(user_id: str):
+async def get_user(user_id: str):
     """Busca um usuário pelo ID."""
     try:
-        user = service.get_user_by_id(user_id)
+        user = await service.get_user_by_id(user_id)
         return user.to_dict()
     except UserNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.put("/{user_id}")
-def update_profile(user_id: str, request: UpdateProfileRequest):
+async def update_profile(user_id: str, request: UpdateProfileRequest):
     """Atualiza o perfil do usuário."""
     try:
-        user = service.update_profile(
+        user = await service.update_profile(
             user_id=user_id,
             name=request.name,
             address=request.address,
@@ -0,0 +1,53 @@
+"""
+Autenticação nas rotas.
+
+As rotas que exigem um usuário autenticado declaram a dependência
+current_user_id, que lê o cabeçalho "Authorization: Bearer <token>" e
+valida o token emitido no login (ver UserService.authenticate). A
+validação é feita em memória, sem consultar o repositório de usuários.
+
+As operações administrativas (ex.: importação do catálogo) declaram
+require_admin, que confere o cabeçalho "X-Admin-Token" com ADMIN_TOKEN.
+"""
+
+import hmac
+from typing import Optional
+from fastapi import Header, HTTPException
+from domain.exceptions import InvalidTokenException
+from infrastructure.web.dependencies import ADMIN_TOKEN, get_user_service
+
+_service = get_user_service()
+
+
+def bearer_token(authorization: Optional[str]) -> str:
+    """Extrai o token do cabeçalho Authorization (esquema Bearer)."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        raise HTTPException(
+            status_code=401,
+            detail="Token de sessão ausente.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token.strip()
+
+
+async def current_user_id(authorization: Optional[str] = Header(None)) -> str:
+    """Dependência: id do usuário dono do token de sessão."""
+    try:
+        return _service.authenticate(bearer_token(authorization))
+    except InvalidTokenException as e:
+        raise HTTPException(
+            status_code=401, detail=str(e), headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Dependência: exige o token administrativo (desativado sem ADMIN_TOKEN)."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=403, detail="Operações administrativas desativadas."
+        )
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Token administrativo inválido.")
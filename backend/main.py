@@ -38,6 +38,8 @@ Princípios SOLID aplicados:
 
 import sys
 import os
+import secrets
+from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -48,6 +50,28 @@ sys.path.insert(0, os.path.dirname(__file__))
 from infrastructure.web.routes.product_routes import router as product_router
 from infrastructure.web.routes.user_routes import router as user_router
 from infrastructure.web.routes.order_routes import router as order_router
+from infrastructure.web.routes.metrics_routes import router as metrics_router
+from infrastructure.web.metrics import MetricsMiddleware
+from infrastructure.web.dependencies import (
+    WORKERS,
+    SHARED,
+    get_metrics,
+    refresh_shared_state,
+    shutdown,
+    startup,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida: inicia a verificação de edições externas do data.json e,
+    no encerramento, grava o que ainda estiver pendente.
+    """
+    startup()
+    yield
+    shutdown()
+
 
 # --- Criação da aplicação ---
 app = FastAPI(
@@ -56,6 +80,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # --- CORS (permitir acesso do frontend) ---
@@ -67,14 +92,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Vários workers: cada requisição vê o que os outros processos gravaram ---
+if SHARED:
+    @app.middleware("http")
+    async def refresh_from_other_workers(request, call_next):
+        await refresh_shared_state()
+        return await call_next(request)
+
+# --- Métricas por rota (último adicionado = mais externo: mede os demais) ---
+app.add_middleware(MetricsMiddleware, registry=get_metrics())
+
 # --- Registro de Rotas ---
 app.include_router(product_router)
 app.include_router(user_router)
 app.include_router(order_router)
+app.include_router(metrics_router)
 
 
 @app.get("/", tags=["Health"])
-def health_check():
+async def health_check():
     """Verificação de saúde da API."""
     return {
         "status": "online",
@@ -85,4 +121,9 @@ def health_check():
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Workers e recargas precisam assinar as sessões com o mesmo segredo
+    os.environ.setdefault("SESSION_SECRET", secrets.token_hex(32))
+    # O reload automático só funciona com um único processo
+    uvicorn.run(
+        "main:app", host="0.0.0.0", port=8000, reload=WORKERS == 1, workers=WORKERS
+    )
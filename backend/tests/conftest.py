@@ -0,0 +1,76 @@
+"""
+Configuração comum dos testes: o diretório backend entra no sys.path, e
+as fixtures abaixo fornecem a fábrica de produtos e o harness de
+concorrência usados pelos testes de repositórios e índices.
+"""
+
+import os
+import sys
+import threading
+from typing import Callable, List
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importado depois de ajustar o sys.path
+from domain.entities.product import Product
+
+
+def _product_record(product_id: str, **fields) -> dict:
+    record = {
+        "id": product_id, "name": f"Camiseta {product_id}", "description": "Algodão",
+        "price": 49.9, "category": "Camisetas", "sizes": ["M"], "colors": ["preto"],
+        "image_url": "", "stock": 10, "brand": "Marca", "gender": "unissex",
+        "rating": 4.5, "reviews_count": 3,
+    }
+    record.update(fields)
+    return record
+
+
+def _run_concurrently(write: Callable[[], None], read: Callable[[], None]) -> List[Exception]:
+    errors: List[Exception] = []
+    stop = threading.Event()
+
+    def writer():
+        try:
+            write()
+        except Exception as error:  # pragma: no cover - falha reportada ao teste
+            errors.append(error)
+        finally:
+            stop.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while not stop.is_set():
+        try:
+            read()
+        except Exception as error:
+            errors.append(error)
+            break
+    thread.join()
+    return errors
+
+
+@pytest.fixture
+def product_record():
+    """
+    Produto no formato do documento (Product.to_dict), com os campos
+    padrão substituídos pelos nomeados: product_record("p1", stock=3).
+    """
+    return _product_record
+
+
+@pytest.fixture
+def make_product():
+    """Product montado por Product.from_dict (listas viram tuplas)."""
+    return lambda product_id, **fields: Product.from_dict(_product_record(product_id, **fields))
+
+
+@pytest.fixture
+def run_concurrently():
+    """
+    Roda write em uma thread e repete read até write terminar; retorna
+    as exceções das duas (vazia se nada falhou).
+    """
+    return _run_concurrently
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from domain.ports import UnitOfWorkPort
+from infrastructure.adapters import AsyncUnitOfWorkBridge
+
+
+class _ThreadRecordingUnitOfWork(UnitOfWorkPort):
+    """Registra as threads em que as unidades são abertas."""
+
+    def __init__(self):
+        self.threads = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            self.threads.add(threading.get_ident())
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _unit_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("unit-of-work")]
+
+
+def test_concurrent_units_reuse_a_bounded_set_of_threads():
+    unit_of_work = _ThreadRecordingUnitOfWork()
+    bridge = AsyncUnitOfWorkBridge(unit_of_work, max_threads=4)
+
+    async def checkout():
+        async with bridge.transaction():
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(checkout() for _ in range(50)))
+
+    asyncio.run(main())
+    assert unit_of_work.max_active <= 4
+    assert len(unit_of_work.threads) <= 4
+
+    bridge.close()
+    assert _unit_threads() == []
+
+
+def test_close_releases_threads_returned_after_shutdown():
+    bridge = AsyncUnitOfWorkBridge(_ThreadRecordingUnitOfWork(), max_threads=2)
+
+    async def main():
+        async with bridge.transaction():
+            bridge.close()
+
+    asyncio.run(main())
+    deadline = time.monotonic() + 5
+    while _unit_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _unit_threads() == []
+
+
+def test_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        AsyncUnitOfWorkBridge(_ThreadRecordingUnitOfWork(), max_threads=0)
@@ -0,0 +1,25 @@
+import pytest
+
+from domain.exceptions import InvalidTokenException
+from infrastructure.adapters.hmac_session_tokens import HmacSessionTokens
+
+
+@pytest.fixture
+def tokens():
+    return HmacSessionTokens(b"0123456789abcdef0123456789abcdef")
+
+
+@pytest.mark.parametrize("token", ["ção.assinatura", "payload.ção", "😀", "", "."])
+def test_malformed_tokens_are_rejected_as_invalid(tokens, token):
+    with pytest.raises(InvalidTokenException):
+        tokens.verify(token)
+    tokens.revoke(token)
+
+
+def test_issued_token_is_verified(tokens):
+    token = tokens.issue("user-1")
+
+    assert tokens.verify(token) == "user-1"
+    tokens.revoke(token)
+    with pytest.raises(InvalidTokenException):
+        tokens.verify(token)
@@ -0,0 +1,46 @@
+import json
+
+from infrastructure.adapters import JsonDocumentStore
+
+
+def _store(tmp_path) -> JsonDocumentStore:
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"items": []}), encoding="utf-8")
+    store = JsonDocumentStore(str(path))
+    items = []
+    store.register("items", lambda: items)
+    store.items = items
+    return store
+
+
+def test_sync_batch_writes_after_releasing_the_lock(tmp_path):
+    store = _store(tmp_path)
+    held_while_writing = []
+    write = store._write
+
+    def spy(document, fsync):
+        held_while_writing.append(store.lock._is_owned())
+        write(document, fsync)
+
+    store._write = spy
+    with store.batch():
+        store.items.append({"id": "1"})
+        store.mark_dirty("items")
+
+    assert held_while_writing == [False]
+    saved = json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))
+    assert saved["items"] == [{"id": "1"}]
+
+
+def test_sync_batch_persists_changes_made_before_an_error(tmp_path):
+    store = _store(tmp_path)
+    try:
+        with store.batch():
+            store.items.append({"id": "1"})
+            store.mark_dirty("items")
+            raise RuntimeError("falha no meio do batch")
+    except RuntimeError:
+        pass
+
+    saved = json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))
+    assert saved["items"] == [{"id": "1"}]
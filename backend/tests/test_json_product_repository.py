@@ -0,0 +1,69 @@
+import json
+import threading
+
+from infrastructure.adapters import JsonDocumentStore, JsonProductRepository
+
+
+def _repository(tmp_path, products) -> JsonProductRepository:
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"products": products}), encoding="utf-8")
+    return JsonProductRepository(JsonDocumentStore(str(path)))
+
+
+def test_reload_swaps_products_under_the_stock_locks(tmp_path, product_record):
+    repository = _repository(tmp_path, [product_record("p1", name="Camiseta")])
+    incoming = [product_record("p1", name="Camiseta listrada")]
+
+    with repository._stock_locked(["p1"]):
+        reload = threading.Thread(target=repository._reload, args=(incoming,))
+        reload.start()
+        reload.join(0.1)
+        # Uma baixa de estoque em andamento segura a troca do produto
+        assert reload.is_alive()
+        assert repository.get_by_id("p1").name == "Camiseta"
+    reload.join()
+
+    repository.reserve_stock({"p1": 3})
+    assert repository.get_by_id("p1").name == "Camiseta listrada"
+    assert repository.get_by_id("p1").stock == 7
+
+
+def test_reload_and_upsert_keep_indexes_and_catalog_in_sync(
+    tmp_path, product_record, make_product
+):
+    repository = _repository(
+        tmp_path, [product_record("p1", name="Camiseta"), product_record("p2", name="Camiseta")]
+    )
+
+    repository._reload(
+        [product_record("p1", name="Camiseta"), product_record("p3", name="Camiseta gola V")]
+    )
+    created = repository.upsert_many(
+        [repository.get_by_id("p3"), make_product("p4", name="Camiseta polo")]
+    )
+
+    assert created == 1
+    assert [p.id for p in repository.search("camiseta")] == ["p1", "p3", "p4"]
+    assert [p.id for p in repository.filter_products(size="M")] == ["p1", "p3", "p4"]
+
+
+
+def test_rejected_external_edit_does_not_abort_the_write(tmp_path, product_record):
+    repository = _repository(tmp_path, [product_record("p1", stock=75)])
+    path = tmp_path / "data.json"
+    broken = product_record("p1", stock=75)
+    del broken["name"]
+    path.write_text(json.dumps({"products": [broken]}), encoding="utf-8")
+
+    repository.reserve_stock({"p1": 2})
+
+    # A memória ficou como estava e a gravação devolveu o estado dela ao arquivo
+    assert repository.get_by_id("p1").name == "Camiseta p1"
+    saved = json.loads(path.read_text(encoding="utf-8"))["products"]
+    assert saved == [product_record("p1", stock=73)]
+    rejected = json.loads((tmp_path / "data.rejected.json").read_text(encoding="utf-8"))
+    assert rejected == {"products": [broken]}
+
+    # A edição rejeitada não volta a ser conferida a cada gravação
+    repository.reserve_stock({"p1": 1})
+    assert json.loads(path.read_text(encoding="utf-8"))["products"][0]["stock"] == 72
@@ -0,0 +1,27 @@
+import pytest
+
+from infrastructure.adapters.metrics_registry import MetricsRegistry, _Metric, _SeriesMetric
+
+
+def test_metric_bases_are_abstract():
+    with pytest.raises(TypeError):
+        _Metric("m", "ajuda")
+    with pytest.raises(TypeError):
+        _SeriesMetric("m", "ajuda")
+
+
+def test_render_all_metric_kinds():
+    registry = MetricsRegistry()
+    registry.counter("writes_total", "Gravações.", ("collection",)).labels("orders").inc()
+    registry.gauge("in_flight", "Em andamento.").labels().inc(2)
+    registry.histogram("seconds", "Duração.", buckets=(0.1, 1.0)).labels().observe(0.5)
+    registry.gauge_function("catalog_size", "Produtos.", lambda: 3)
+
+    text = registry.render()
+
+    assert 'writes_total{collection="orders"} 1' in text
+    assert "in_flight 2" in text
+    assert 'seconds_bucket{le="0.1"} 0' in text
+    assert 'seconds_bucket{le="1"} 1' in text
+    assert 'seconds_bucket{le="+Inf"} 1' in text
+    assert "catalog_size 3" in text
@@ -0,0 +1,64 @@
+"""
+Testes do journal de pedidos após uma queda no meio de uma escrita.
+"""
+
+import json
+from domain.entities.order import Order, OrderItem
+from infrastructure.adapters import JsonDocumentStore, JsonOrderRepository
+
+
+def _open(path):
+    store = JsonDocumentStore(str(path))
+    return store, JsonOrderRepository(store)
+
+
+def _order(order_id: str) -> Order:
+    item = OrderItem("prod-1", "Camiseta", 1, "M", "preto", 49.9)
+    return Order(id=order_id, user_id="user-1", items=[item])
+
+
+def _journal_path(data_path) -> str:
+    return str(data_path).removesuffix(".json") + ".orders.journal"
+
+
+def test_torn_tail_is_truncated_before_the_next_append(tmp_path):
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps({"products": [], "users": [], "orders": []}))
+
+    store, orders = _open(data_path)
+    orders.create(_order("o1"))
+    orders.create(_order("o2"))
+    store.close()
+    # Queda no meio do append de o3: linha sem o "\n" final
+    with open(_journal_path(data_path), "ab") as f:
+        f.write(b'{"op":"put","order":{"id":"o3","us')
+
+    store, orders = _open(data_path)
+    assert orders.get_by_id("o3") is None
+    orders.create(_order("o4"))
+    orders.create(_order("o5"))
+    store.close()
+
+    store, orders = _open(data_path)
+    assert [o for o in ("o1", "o2", "o4", "o5") if orders.get_by_id(o) is None] == []
+    assert orders.get_by_id("o3") is None
+    store.close()
+    with open(_journal_path(data_path), "rb") as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line)["order"]["id"] for line in lines] == ["o1", "o2", "o4", "o5"]
+
+
+def test_record_appended_after_torn_bytes_is_recovered(tmp_path):
+    # Log gravado antes da correção: o append seguinte colado aos bytes parciais
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps({"products": [], "users": [], "orders": []}))
+    records = [
+        json.dumps({"op": "put", "order": _order(i).to_dict()}, separators=(",", ":"))
+        for i in ("o1", "o4", "o5")
+    ]
+    with open(_journal_path(data_path), "w", encoding="utf-8") as f:
+        f.write(records[0] + "\n" + '{"op":"put","ord' + records[1] + "\n" + records[2] + "\n")
+
+    store, orders = _open(data_path)
+    assert [o for o in ("o1", "o4", "o5") if orders.get_by_id(o) is None] == []
+    store.close()
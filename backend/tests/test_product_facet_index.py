@@ -0,0 +1,41 @@
+import pytest
+
+from infrastructure.adapters.product_facet_index import ProductFacetIndex
+
+
+@pytest.fixture(params=["facets", "columns"])
+def engine(request):
+    if request.param == "columns":
+        pytest.importorskip("numpy")
+        from infrastructure.adapters.product_column_index import ProductColumnIndex
+        return ProductColumnIndex()
+    return ProductFacetIndex()
+
+
+def test_filters_while_products_are_written(engine, make_product, run_concurrently):
+    engine.load(make_product(f"p{i}", price=10.0 + i) for i in range(500))
+
+    def write():
+        for round_ in range(20):
+            for i in range(500, 700):
+                engine.add(
+                    make_product(f"p{i}", price=10.0 + round_, sizes=["M" if round_ % 2 else "G"])
+                )
+            for i in range(500, 700):
+                engine.remove(f"p{i}")
+
+    def read():
+        engine.filter(size="M")
+        engine.filter(min_price=10.0, max_price=30.0, size="m")
+        engine.filtered_page(size="M", field="price", limit=20)
+        engine.filtered_page(field="name", limit=20)
+
+    assert not run_concurrently(write, read)
+    assert len(engine.filter(size="M")) == 500
+
+
+def test_search_results_removed_from_the_catalog_are_dropped(engine, make_product):
+    engine.load([make_product("p1", price=10.0), make_product("p2", price=20.0)])
+    engine.remove("p2")
+
+    assert engine.filter(within=["p2", "p1"]) == ["p1"]
@@ -0,0 +1,108 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from application.services import ProductService
+from domain.exceptions import InvalidImportRecordException
+from domain.ports import AsyncUnitOfWorkPort
+from infrastructure.adapters import (
+    AsyncProductRepositoryBridge,
+    AsyncUnitOfWorkBridge,
+    JsonDocumentStore,
+    JsonProductRepository,
+    JsonUnitOfWork,
+    SqliteDatabase,
+    SqliteProductRepository,
+    SqliteUnitOfWork,
+)
+
+
+async def _stream(records):
+    for record in records:
+        yield record
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "sqlite":
+        database = SqliteDatabase(str(tmp_path / "data.sqlite3"))
+        return SqliteProductRepository(database), SqliteUnitOfWork(database)
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"products": []}), encoding="utf-8")
+    store = JsonDocumentStore(str(path))
+    return JsonProductRepository(store), JsonUnitOfWork(store)
+
+
+def test_invalid_record_leaves_the_catalog_untouched(backend, product_record):
+    repository, unit_of_work = backend
+    service = ProductService(
+        AsyncProductRepositoryBridge(repository),
+        AsyncUnitOfWorkBridge(unit_of_work, exclusive=True),
+    )
+    records = [product_record(f"p{i}") for i in range(5)] + [{"id": "ruim"}]
+
+    with pytest.raises(InvalidImportRecordException) as error:
+        asyncio.run(service.import_products(_stream(records), batch_size=2))
+
+    assert error.value.record == 6
+    assert repository.get_all() == []
+
+
+class _RecordingUnitOfWork(AsyncUnitOfWorkPort):
+    def __init__(self, events):
+        self._events = events
+
+    @asynccontextmanager
+    async def _transaction(self):
+        self._events.append("begin")
+        yield
+        self._events.append("commit")
+
+    def transaction(self):
+        return self._transaction()
+
+
+def test_transaction_opens_only_after_the_upload_is_read(backend, product_record):
+    repository, _ = backend
+    events = []
+    service = ProductService(
+        AsyncProductRepositoryBridge(repository), _RecordingUnitOfWork(events)
+    )
+
+    async def upload():
+        for i in range(5):
+            events.append("read")
+            yield product_record(f"p{i}")
+
+    summary = asyncio.run(service.import_products(upload(), batch_size=2))
+
+    assert events == ["read"] * 5 + ["begin", "commit"]
+    assert summary == {"imported": 5, "created": 5, "updated": 0}
+    assert [p.id for p in repository.get_all()] == [f"p{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("price", float("nan")),
+        ("price", float("inf")),
+        ("rating", float("-inf")),
+        ("price", -1.0),
+        ("stock", -1),
+    ],
+)
+def test_rejects_non_finite_and_negative_numbers(backend, product_record, field, value):
+    repository, unit_of_work = backend
+    service = ProductService(
+        AsyncProductRepositoryBridge(repository), AsyncUnitOfWorkBridge(unit_of_work)
+    )
+    records = [product_record("p1"), product_record("p2", **{field: value})]
+
+    with pytest.raises(InvalidImportRecordException) as error:
+        asyncio.run(service.import_products(_stream(records)))
+
+    assert error.value.record == 2
+    assert field in str(error.value)
+    assert repository.get_all() == []
@@ -0,0 +1,28 @@
+from infrastructure.adapters.product_search_index import ProductSearchIndex
+
+
+def test_search_sees_terms_added_without_prepare(make_product):
+    index = ProductSearchIndex()
+    index.add(make_product("p1", name="Camiseta básica"))
+
+    assert index.search("cami") == ["p1"]
+    assert index.search("basica") == ["p1"]
+
+
+def test_concurrent_writes_and_searches(make_product, run_concurrently):
+    index = ProductSearchIndex()
+    for i in range(200):
+        index.add(make_product(f"p{i}", name=f"Camiseta modelo{i}"))
+    index.prepare()
+
+    def write():
+        for round_ in range(30):
+            for i in range(200):
+                index.add(make_product(f"p{i}", name=f"Camiseta modelo{i} lote{round_}"))
+            index.prepare()
+
+    def read():
+        assert len(index.search("cami")) == 200
+        index.search("modelo1 lote")
+
+    assert not run_concurrently(write, read)
@@ -0,0 +1,37 @@
+import sqlite3
+
+from infrastructure.adapters import SqliteDatabase, SqliteUserRepository
+
+
+def _legacy_database(path):
+    """Banco anterior às migrações: email_key gravado com lower()."""
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE users (
+            id TEXT PRIMARY KEY, name TEXT NOT NULL, email TEXT NOT NULL,
+            email_key TEXT NOT NULL, password_hash TEXT NOT NULL,
+            address TEXT, phone TEXT
+        );
+        CREATE UNIQUE INDEX idx_users_email ON users (email_key);
+        """
+    )
+    for user_id, email in (("u1", "Straße@Example.com"), ("u2", "ana@example.com")):
+        conn.execute(
+            "INSERT INTO users VALUES (?, 'Nome', ?, ?, 'hash', NULL, NULL)",
+            (user_id, email, email.lower()),
+        )
+    conn.commit()
+    conn.close()
+
+
+def test_email_keys_are_casefolded_on_open(tmp_path):
+    path = str(tmp_path / "legacy.sqlite3")
+    _legacy_database(path)
+
+    repository = SqliteUserRepository(SqliteDatabase(path))
+
+    assert repository.get_by_email("STRASSE@example.com").id == "u1"
+    assert repository.get_by_email("Ana@Example.com").id == "u2"
+    version = sqlite3.connect(path).execute("PRAGMA user_version").fetchone()[0]
+    assert version == 2
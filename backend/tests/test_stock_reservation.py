@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+import pytest
+
+from application.services import OrderService
+from domain.entities.cart import Cart, CartItem
+from domain.entities.product import Product
+from domain.exceptions import InsufficientStockException, ProductNotFoundException
+from infrastructure.adapters import (
+    AsyncOrderRepositoryBridge,
+    AsyncProductRepositoryBridge,
+    AsyncUnitOfWorkBridge,
+    JsonDocumentStore,
+    JsonOrderRepository,
+    JsonProductRepository,
+    JsonUnitOfWork,
+    SqliteDatabase,
+    SqliteOrderRepository,
+    SqliteProductRepository,
+    SqliteUnitOfWork,
+)
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend(request, tmp_path, product_record):
+    """(produtos, pedidos, unidade de trabalho) com p1 (estoque 5) e p2 (estoque 1)."""
+    catalog = [product_record("p1", stock=5), product_record("p2", stock=1)]
+    if request.param == "sqlite":
+        database = SqliteDatabase(str(tmp_path / "data.sqlite3"))
+        products = SqliteProductRepository(database)
+        for raw in catalog:
+            products.add(Product.from_dict(raw))
+        return products, SqliteOrderRepository(database), SqliteUnitOfWork(database)
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"products": catalog, "orders": []}), encoding="utf-8")
+    store = JsonDocumentStore(str(path))
+    return JsonProductRepository(store), JsonOrderRepository(store), JsonUnitOfWork(store)
+
+
+def _stock(products) -> dict:
+    return {p.id: p.stock for p in products.get_all()}
+
+
+def test_reserve_with_a_missing_product_changes_nothing(backend):
+    products, _, _ = backend
+
+    with pytest.raises(ProductNotFoundException):
+        products.reserve_stock({"p1": 2, "p9": 1})
+
+    assert _stock(products) == {"p1": 5, "p2": 1}
+
+
+def test_reserve_rolls_back_earlier_products_when_one_lacks_stock(backend):
+    products, _, _ = backend
+
+    with pytest.raises(InsufficientStockException):
+        products.reserve_stock({"p1": 2, "p2": 3})
+
+    assert _stock(products) == {"p1": 5, "p2": 1}
+
+
+def test_release_ignores_missing_products(backend):
+    products, _, _ = backend
+
+    products.release_stock({"p1": 2, "p9": 1})
+
+    assert _stock(products) == {"p1": 7, "p2": 1}
+
+
+class _FailingOrders(AsyncOrderRepositoryBridge):
+    async def create(self, order):
+        raise RuntimeError("falha ao gravar o pedido")
+
+
+def test_checkout_returns_stock_when_the_order_cannot_be_created(backend):
+    products, orders, unit_of_work = backend
+    service = OrderService(
+        _FailingOrders(orders),
+        AsyncProductRepositoryBridge(products),
+        AsyncUnitOfWorkBridge(unit_of_work),
+    )
+    cart = Cart(user_id="u1", items=[
+        CartItem("p1", "Camiseta p1", 2, "M", "preto", 49.9),
+        CartItem("p2", "Camiseta p2", 1, "M", "preto", 49.9),
+    ])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.create_order_from_cart(cart, "Rua A, 1"))
+
+    assert _stock(products) == {"p1": 5, "p2": 1}
@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import pytest
+
+from application.services import UserService
+from domain.exceptions import InvalidCredentialsException, UserAlreadyExistsException
+from infrastructure.adapters import (
+    AsyncUserRepositoryBridge,
+    JsonDocumentStore,
+    JsonUserRepository,
+    Pbkdf2Kdf,
+    PooledPasswordHasher,
+    ScryptKdf,
+    SqliteDatabase,
+    SqliteUserRepository,
+)
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteUserRepository(SqliteDatabase(str(tmp_path / "data.sqlite3")))
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"users": []}), encoding="utf-8")
+    return JsonUserRepository(JsonDocumentStore(str(path)))
+
+
+@pytest.fixture
+def hasher():
+    hasher = PooledPasswordHasher(Pbkdf2Kdf(1000), workers=4)
+    yield hasher
+    hasher.close()
+
+
+def test_concurrent_registrations_with_the_same_email(repository, hasher):
+    service = UserService(AsyncUserRepositoryBridge(repository), hasher)
+
+    async def register_all():
+        return await asyncio.gather(
+            *(service.register("Ana", "ana@example.com", "senha123") for _ in range(5)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(register_all())
+
+    assert sum(not isinstance(r, Exception) for r in results) == 1
+    assert all(
+        isinstance(r, UserAlreadyExistsException) for r in results if isinstance(r, Exception)
+    )
+
+
+class _CountingHasher(PooledPasswordHasher):
+    def __init__(self):
+        super().__init__(Pbkdf2Kdf(1000))
+        self.verified = 0
+
+    async def verify(self, password, password_hash):
+        self.verified += 1
+        return await super().verify(password, password_hash)
+
+
+def test_login_with_unknown_email_still_verifies_a_hash(repository):
+    hasher = _CountingHasher()
+    service = UserService(AsyncUserRepositoryBridge(repository), hasher)
+
+    with pytest.raises(InvalidCredentialsException):
+        asyncio.run(service.login("ninguem@example.com", "senha123"))
+
+    assert hasher.verified == 1
+    hasher.close()
+
+
+@pytest.mark.parametrize(
+    "old_kdf, new_kdf",
+    [(Pbkdf2Kdf(1000), ScryptKdf(n=2 ** 10)), (ScryptKdf(n=2 ** 10), Pbkdf2Kdf(1000))],
+)
+def test_switching_the_kdf_migrates_passwords_on_login(repository, old_kdf, new_kdf):
+    before = PooledPasswordHasher(old_kdf)
+    asyncio.run(
+        UserService(AsyncUserRepositoryBridge(repository), before)
+        .register("Ana", "ana@example.com", "senha123")
+    )
+    before.close()
+
+    after = PooledPasswordHasher(new_kdf)
+    service = UserService(AsyncUserRepositoryBridge(repository), after)
+    user = asyncio.run(service.login("ana@example.com", "senha123"))
+
+    assert new_kdf.identifies(user.password_hash)
+    assert new_kdf.identifies(repository.get_by_email("ana@example.com").password_hash)
+    assert asyncio.run(service.login("ana@example.com", "senha123")).id == user.id
+    after.close()